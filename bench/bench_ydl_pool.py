@@ -0,0 +1,78 @@
+"""
+Benchmark biaya per item: membuat YoutubeDL baru untuk setiap item
+dibandingkan memakai ulang instance dari core.ydl_pool.
+
+Pemakaian (dari root repo):
+    python bench/bench_ydl_pool.py                 # hanya biaya konstruksi, offline
+    python bench/bench_ydl_pool.py --online 20     # tambah pencarian ytsearch1 sungguhan
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+import yt_dlp
+from core.ydl_pool import ambil_ydl, atur_outtmpl, tutup_pool, PROFIL_CARI_CEPAT, PROFIL_AUDIO, PROFIL_VIDEO
+
+PROFIL = {
+    PROFIL_CARI_CEPAT: {'quiet': True, 'no_warnings': True, 'extract_flat': 'in_playlist'},
+    PROFIL_AUDIO: {
+        'quiet': True, 'format': 'bestaudio/best', 'outtmpl': 'x.%(ext)s',
+        'postprocessors': [{'key': 'FFmpegExtractAudio', 'preferredcodec': 'mp3', 'preferredquality': '192'},
+                           {'key': 'EmbedThumbnail', 'already_have_thumbnail': False}],
+        'writethumbnail': True, 'ignoreerrors': True,
+    },
+    PROFIL_VIDEO: {'quiet': True, 'format': 'bestvideo+bestaudio/best', 'outtmpl': 'x.%(ext)s', 'ignoreerrors': True},
+}
+
+
+def tanpa_pool(profil, opsi, n):
+    mulai = time.perf_counter()
+    for _ in range(n):
+        with yt_dlp.YoutubeDL(opsi) as ydl:
+            ydl.params['outtmpl']['default'] = 'y.%(ext)s'
+    return time.perf_counter() - mulai
+
+
+def dengan_pool(profil, opsi, n):
+    mulai = time.perf_counter()
+    for _ in range(n):
+        ydl = ambil_ydl(profil, opsi)
+        atur_outtmpl(ydl, 'y.%(ext)s')
+    tutup_pool()
+    return time.perf_counter() - mulai
+
+
+def cari_online(n, pakai_pool):
+    opsi = PROFIL[PROFIL_CARI_CEPAT]
+    mulai = time.perf_counter()
+    for i in range(n):
+        query = f"ytsearch1:lagu populer {i}"
+        if pakai_pool:
+            ambil_ydl(PROFIL_CARI_CEPAT, opsi).extract_info(query, download=False)
+        else:
+            with yt_dlp.YoutubeDL(opsi) as ydl:
+                ydl.extract_info(query, download=False)
+    tutup_pool()
+    return time.perf_counter() - mulai
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', type=int, default=1000, help="Jumlah item (default 1000)")
+    parser.add_argument('--online', type=int, default=0, help="Jumlah pencarian sungguhan (butuh internet)")
+    args = parser.parse_args()
+
+    print(f"Konstruksi YoutubeDL untuk {args.n} item per profil:")
+    for profil, opsi in PROFIL.items():
+        t_baru = tanpa_pool(profil, opsi, args.n)
+        t_pool = dengan_pool(profil, opsi, args.n)
+        hemat = (t_baru - t_pool) / args.n * 1000
+        print(f"  {profil:<12} baru: {t_baru:7.2f} s | pool: {t_pool:7.3f} s | hemat {hemat:.2f} ms/item")
+
+    if args.online:
+        t_baru = cari_online(args.online, False)
+        t_pool = cari_online(args.online, True)
+        print(f"\nPencarian online {args.online} item: baru {t_baru:.2f} s | pool {t_pool:.2f} s "
+              f"| hemat {(t_baru - t_pool) / args.online * 1000:.0f} ms/item")
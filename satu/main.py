@@ -1,8 +1,16 @@
 import yt_dlp
 import os
+import sys
 import json
 import glob
 
+# Pakai penyimpan status yang sama dengan aplikasi GUI (src/core/status_store.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from core.status_store import PenyimpanStatus
+from core.ydl_pool import file_hasil
+from core.transcode import buat_mp3, metadata_dari_info, MP3BersampulPP
+from core.cache_thumbnail import sampul_untuk_info
+
 # --- KONFIGURASI ---
 # Ganti dengan path FFMPEG di komputer Anda
 FFMPEG_PATH = r'C:\ffmpeg-7.1.1-essentials_build\bin' 
@@ -26,11 +34,6 @@ def dapatkan_path_output():
     folder_audio_kustom = os.path.join(folder_output_kustom, "audio")
     return folder_output_kustom, folder_audio_kustom
 
-def simpan_perubahan_json(file_path, data):
-    """Menyimpan seluruh data kembali ke file JSON yang spesifik."""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
 def progress_hook(d):
     """Fungsi untuk menampilkan progress bar saat mengunduh."""
     if d['status'] == 'downloading':
@@ -45,23 +48,15 @@ def unduh_audio_saja(url, nama_file, path_output_audio):
     buat_folder_jika_perlu(path_output_audio)
     ydl_opts = {
         'format': 'bestaudio/best',
-        'postprocessors': [{
-            'key': 'FFmpegExtractAudio', 
-            'preferredcodec': 'mp3', 
-            'preferredquality': '192'
-        },{
-            # Postprocessor untuk menyematkan thumbnail
-            'key': 'EmbedThumbnail',
-            'already_have_thumbnail': False
-        }],
         'outtmpl': os.path.join(path_output_audio, f'{nama_file}.%(ext)s'),
         'ffmpeg_location': FFMPEG_PATH,
         'progress_hooks': [progress_hook],
-        'writethumbnail': True, # WAJIB: untuk memberitahu yt-dlp agar mengunduh thumbnail
         'ignoreerrors': True, # Melanjutkan jika ada error pada satu video
     }
     try:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            # Encode MP3 dan sematkan sampul (dari cache thumbnail) dalam satu proses ffmpeg
+            ydl.add_post_processor(MP3BersampulPP(ydl, kualitas='192'))
             ydl.download([url])
         return True
     except Exception as e:
@@ -86,6 +81,41 @@ def unduh_video_saja(url, nama_file, path_output_video):
         print(f"\n   -> ❌ Error saat mengunduh video: {e}")
         return False
 
+def unduh_keduanya(url, nama_file, path_output_video, path_output_audio):
+    """Mengunduh video sekali, lalu membuat MP3 (dengan thumbnail) dari stream audionya."""
+    buat_folder_jika_perlu(path_output_video)
+    buat_folder_jika_perlu(path_output_audio)
+    ydl_opts = {
+        'format': 'bestvideo+bestaudio/best',
+        'outtmpl': os.path.join(path_output_video, f'{nama_file}.%(ext)s'),
+        'ffmpeg_location': FFMPEG_PATH,
+        'progress_hooks': [progress_hook],
+        'ignoreerrors': True,
+    }
+    try:
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=True)
+    except Exception as e:
+        print(f"\n   -> ❌ Error saat mengunduh video: {e}")
+        return False, False
+
+    file_video = file_hasil(info)
+    if not file_video:
+        return False, False
+
+    # Salinan sementara sampul dari cache thumbnail (sama seperti unduh_audio_saja)
+    file_sampul = sampul_untuk_info(info)
+    try:
+        buat_mp3(file_video, os.path.join(path_output_audio, f'{nama_file}.mp3'), file_sampul,
+                 ffmpeg_location=FFMPEG_PATH, metadata=metadata_dari_info(info))
+        return True, True
+    except Exception as e:
+        print(f"\n   -> ❌ Error saat membuat audio dari video: {e}")
+        return True, False
+    finally:
+        if file_sampul and os.path.exists(file_sampul):
+            os.remove(file_sampul)
+
 def pilih_file_json():
     """Menampilkan daftar file JSON dan meminta pengguna untuk memilih."""
     buat_folder_jika_perlu(FOLDER_JSON)
@@ -113,8 +143,9 @@ def proses_dari_json(file_json_path, path_output_video, path_output_audio, mode=
     """Membaca file JSON yang dipilih dan mengunduh sesuai mode."""
     print(f"\n--- Memproses dari file '{os.path.basename(file_json_path)}' (Mode: {mode.upper()}) ---")
     try:
-        with open(file_json_path, 'r', encoding='utf-8') as f:
-            data_musik = json.load(f)
+        # Status disimpan bertahap (debounce) dan atomik, bukan menulis ulang file per item
+        penyimpan = PenyimpanStatus(file_json_path, indent=2)
+        data_musik = penyimpan.data
     except FileNotFoundError:
         print(f"❌ Error: File '{file_json_path}' tidak ditemukan.")
         return
@@ -122,15 +153,27 @@ def proses_dari_json(file_json_path, path_output_video, path_output_audio, mode=
         print(f"❌ Error: Format JSON di '{file_json_path}' tidak valid.")
         return
 
-    item_baru_diunduh = 0
     items_to_download = [item for item in data_musik if not item.get("download")]
     total_items = len(items_to_download)
-    item_diproses = 0
 
     if total_items == 0:
         print("\n✅ Selesai! Tidak ada item baru untuk diunduh di file ini.")
         return
 
+    try:
+        item_baru_diunduh = _unduh_semua(data_musik, penyimpan, total_items, path_output_video, path_output_audio, mode)
+    finally:
+        penyimpan.tutup()
+
+    if item_baru_diunduh > 0:
+        print(f"\n\n✅ Selesai! {item_baru_diunduh} item baru berhasil diproses dari file ini.")
+    else:
+        print("\n\n✅ Selesai! Tidak ada item baru yang berhasil diunduh.")
+
+def _unduh_semua(data_musik, penyimpan, total_items, path_output_video, path_output_audio, mode):
+    """Mengunduh semua item yang belum diunduh dan mencatat statusnya ke penyimpan."""
+    item_baru_diunduh = 0
+    item_diproses = 0
     for item in data_musik:
         if not item.get("download"):
             item_diproses += 1
@@ -162,27 +205,19 @@ def proses_dari_json(file_json_path, path_output_video, path_output_audio, mode=
                 sukses = unduh_video_saja(link, nama_file_kustom, path_output_video)
                 if sukses: print(f"   -> ✅ Video untuk '{nama_file_kustom}' berhasil diunduh.")
             elif mode == 'both':
-                print("   -> Mengunduh Video...")
-                sukses_v = unduh_video_saja(link, nama_file_kustom, path_output_video)
+                print("   -> Mengunduh Video (audio dibuat dari video)...")
+                sukses_v, sukses_a = unduh_keduanya(link, nama_file_kustom, path_output_video, path_output_audio)
                 if sukses_v: print(f"   -> ✅ Video untuk '{nama_file_kustom}' berhasil diunduh.")
-                
-                print("   -> Mengunduh Audio...")
-                sukses_a = unduh_audio_saja(link, nama_file_kustom, path_output_audio)
-                if sukses_a: print(f"   -> ✅ Audio '{nama_file_kustom}.mp3' berhasil diunduh dengan thumbnail.")
+                if sukses_a: print(f"   -> ✅ Audio '{nama_file_kustom}.mp3' berhasil dibuat dengan thumbnail.")
                 sukses = sukses_v or sukses_a
 
             if sukses:
-                item["download"] = True
                 item_baru_diunduh += 1
-                print(f"   -> 💾 Menyimpan status 'download: true' untuk '{judul_tampil}' ke JSON...")
-                simpan_perubahan_json(file_json_path, data_musik)
+                print(f"   -> 💾 Mencatat status 'download: true' untuk '{judul_tampil}'...")
+                penyimpan.perbarui(item.get("judul_asli") or link, download=True)
             else:
                 print(f"   -> ❌ Gagal memproses '{judul_tampil}'.")
-
-    if item_baru_diunduh > 0:
-        print(f"\n\n✅ Selesai! {item_baru_diunduh} item baru berhasil diproses dari file ini.")
-    else:
-        print("\n\n✅ Selesai! Tidak ada item baru yang berhasil diunduh.")
+    return item_baru_diunduh
 
 # --- Program Utama ---
 if __name__ == "__main__":
@@ -228,8 +263,9 @@ if __name__ == "__main__":
             elif pilihan_format == 'b':
                 if unduh_video_saja(link_video, nama_file_default, folder_output_kustom): print("✅ Video berhasil diunduh.")
             elif pilihan_format == 'c':
-                unduh_video_saja(link_video, nama_file_default, folder_output_kustom)
-                unduh_audio_saja(link_video, nama_file_default, folder_audio_kustom)
+                sukses_v, sukses_a = unduh_keduanya(link_video, nama_file_default, folder_output_kustom, folder_audio_kustom)
+                if sukses_v: print("✅ Video berhasil diunduh.")
+                if sukses_a: print("✅ Audio berhasil dibuat dari video.")
     
     elif pilihan_utama == '2':
         file_dipilih = pilih_file_json()
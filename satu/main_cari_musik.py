@@ -1,8 +1,13 @@
 import json
 import os
+import sys
 from pytube import Search
 from pytube.exceptions import PytubeError
 
+# Pakai cache pencarian yang sama dengan aplikasi GUI (src/core/search_cache.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from core.search_cache import SearchCache
+
 # --- Konfigurasi Path ---
 FOLDER_INPUT = 'data_musik'
 FOLDER_OUTPUT = os.path.join(FOLDER_INPUT, 'hasil')
@@ -96,24 +101,39 @@ if __name__ == "__main__":
     except (FileNotFoundError, json.JSONDecodeError):
         print("Memulai proses pencarian baru...")
 
+    cache = SearchCache()
+
     for judul_asli in daftar_judul_input:
         if judul_asli in judul_asli_sudah_diproses:
             print(f"Dilewati (judul asli sudah ada): {judul_asli}")
             continue
 
-        print(f"Mencari: {judul_asli}")
-        video = cari_video_youtube(judul_asli) # Mencari video
-        
-        # ## PERUBAHAN UTAMA ##
-        # Menyiapkan data untuk disimpan
-        if video:
-            judul_hasil = video.title # Mengambil judul dari video
-            link_hasil = video.watch_url # Mengambil link dari video
-            print(f"   -> Ditemukan: '{judul_hasil}'")
+        cached = cache.ambil(judul_asli)
+        if cached:
+            if cached['ditemukan']:
+                judul_hasil = cached['judul_video']
+                link_hasil = cached['link_youtube']
+                print(f"Dari cache: {judul_asli} -> '{judul_hasil}'")
+            else:
+                judul_hasil = "Tidak Ditemukan"
+                link_hasil = "Tidak Ditemukan"
+                print(f"Dari cache (tidak ditemukan): {judul_asli}")
         else:
-            judul_hasil = "Tidak Ditemukan"
-            link_hasil = "Tidak Ditemukan"
-            print(f"   -> Gagal menemukan video untuk: '{judul_asli}'")
+            print(f"Mencari: {judul_asli}")
+            video = cari_video_youtube(judul_asli) # Mencari video
+            
+            # ## PERUBAHAN UTAMA ##
+            # Menyiapkan data untuk disimpan
+            if video:
+                judul_hasil = video.title # Mengambil judul dari video
+                link_hasil = video.watch_url # Mengambil link dari video
+                print(f"   -> Ditemukan: '{judul_hasil}'")
+                cache.simpan(judul_asli, video.video_id, judul_hasil, link_hasil)
+            else:
+                judul_hasil = "Tidak Ditemukan"
+                link_hasil = "Tidak Ditemukan"
+                print(f"   -> Gagal menemukan video untuk: '{judul_asli}'")
+                cache.simpan(judul_asli, ditemukan=False)
         
         # Menyimpan hasil dengan format baru
         hasil_akhir.append({
@@ -127,4 +147,6 @@ if __name__ == "__main__":
         
         judul_asli_sudah_diproses.add(judul_asli)
 
+    print(f"\nCache pencarian: {cache.statistik()}")
+    cache.tutup()
     print(f"\nProses selesai. Semua hasil telah disimpan di '{file_output_path}'")
\ No newline at end of file
@@ -6,7 +6,17 @@ FFMPEG_PATH = None
 FOLDER_MUSIK_UTAMA = "data_musik"
 FOLDER_HASIL_JSON = os.path.join(FOLDER_MUSIK_UTAMA, "hasil")
 FOLDER_DOWNLOAD_UTAMA = "musikku"
+FOLDER_CACHE = os.path.join(FOLDER_MUSIK_UTAMA, "cache")
+FILE_CACHE_PENCARIAN = os.path.join(FOLDER_CACHE, "cache_pencarian.sqlite3")
+FILE_ARSIP_UNDUHAN = os.path.join(FOLDER_CACHE, "arsip_unduhan.sqlite3")
+FOLDER_CACHE_THUMBNAIL = os.path.join(FOLDER_CACHE, "thumbnail")
 CONFIG_FILE = "config.json"
+JUMLAH_PENGISI_UKURAN = 2  # Thread tahap 2 (pengisian ukuran file) di tab Pengunduh
+JUMLAH_KONVERSI = os.cpu_count() or 2  # Proses ffmpeg simultan pada tahap konversi (mode pipeline)
+JUMLAH_PREFETCH = 3  # Item antrean unduhan yang info-nya diekstraksi lebih dulu di latar belakang
+FPS_PEMBARUAN_UI = 20  # Frekuensi maksimum pembaruan progres/status/log ke tampilan (kali per detik)
+JUMLAH_PEMUAT_GALERI = 4  # Sampul galeri thumbnail yang diambil/di-decode bersamaan
+MAKS_GAMBAR_GALERI = 400  # Sampul galeri (ukuran tampil) yang disimpan di memori
 
 # --- FUNGSI MANAJEMEN KONFIGURASI (UMUM) ---
 
@@ -66,6 +76,49 @@ def load_ui_settings():
         ui_settings['scale'] = default_settings['scale']
     return ui_settings
 
+def load_search_cache_settings():
+    """Memuat pengaturan cache pencarian dengan nilai default jika tidak ada."""
+    config = load_config()
+    default_settings = {
+        'ttl_hari': 30,          # Umur hasil yang ditemukan
+        'ttl_negatif_jam': 24,   # Umur hasil "Tidak Ditemukan"
+        'maks_entri': 50000,     # Batas jumlah entri sebelum entri terlama dibuang
+    }
+    cache_settings = config.get('search_cache', {})
+    for key, value in default_settings.items():
+        cache_settings.setdefault(key, value)
+    return cache_settings
+
+def load_log_settings():
+    """Memuat pengaturan log dengan nilai default jika tidak ada."""
+    config = load_config()
+    default_settings = {
+        'kapasitas': 5000,       # Catatan log yang disimpan di memori per tab (ring buffer)
+        'baris_tampil': 2000,    # Batas baris yang ditampilkan di kotak log
+        'file_aktif': False,     # Salin log ke file berotasi
+        'file': os.path.join(FOLDER_MUSIK_UTAMA, "log", "music_manager.log"),
+        'maks_mb': 5,            # Ukuran per file log sebelum dirotasi
+        'cadangan': 3,           # Jumlah file log lama yang disimpan
+    }
+    log_settings = config.get('log', {})
+    for key, value in default_settings.items():
+        log_settings.setdefault(key, value)
+    return log_settings
+
+def load_thumbnail_cache_settings():
+    """Memuat pengaturan cache thumbnail dengan nilai default jika tidak ada."""
+    config = load_config()
+    default_settings = {
+        'maks_mb_disk': 200,         # Batas total ukuran file thumbnail di disk
+        'maks_mb_memori': 64,        # Batas gambar hasil decode yang disimpan di memori (LRU)
+        'revalidasi_jam': 24,        # Setelah ini entri dicek ulang ke server (If-None-Match/If-Modified-Since)
+        'ttl_negatif_jam': 24,       # Umur catatan "thumbnail tidak ada" (mis. maxresdefault 404)
+    }
+    cache_settings = config.get('thumbnail_cache', {})
+    for key, value in default_settings.items():
+        cache_settings.setdefault(key, value)
+    return cache_settings
+
 
 # --- Style Sheet (QSS) untuk TEMA TERANG ---
 STYLESHEET_LIGHT = """
@@ -0,0 +1,114 @@
+import os
+import re
+import time
+import shutil
+import sqlite3
+import threading
+
+# Import konfigurasi dari file terpisah
+from config import FILE_ARSIP_UNDUHAN
+
+# Tindakan jika video sudah ada di arsip
+ARSIP_HARDLINK = 'hardlink'        # tautkan file yang sudah ada (tanpa tambahan ruang disk)
+ARSIP_SALIN = 'salin'              # salin file yang sudah ada
+ARSIP_UNDUH_ULANG = 'unduh_ulang'  # abaikan arsip, selalu unduh
+
+_POLA_VIDEO_ID = re.compile(r'(?:v=|\/|be\/|embed\/|shorts\/)([0-9A-Za-z_-]{11})')
+
+
+def ambil_video_id(link):
+    """ID video YouTube (11 karakter) dari link, atau None."""
+    match = _POLA_VIDEO_ID.search(link or "")
+    return match.group(1) if match else None
+
+
+class ArsipUnduhan:
+    """
+    Arsip unduhan seluruh pustaka (SQLite) dengan kunci (video_id, mode).
+    Mencatat path dan ukuran setiap file hasil unduhan, di folder mana pun,
+    agar lagu yang sama dari daftar lain tidak perlu diunduh lagi.
+    Aman dipakai dari beberapa thread.
+    """
+
+    def __init__(self, path=FILE_ARSIP_UNDUHAN):
+        self._lock = threading.Lock()
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS arsip (
+                    video_id TEXT NOT NULL,
+                    mode TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    ukuran INTEGER NOT NULL,
+                    dicatat_pada REAL NOT NULL,
+                    PRIMARY KEY (video_id, mode, path)
+                )
+            """)
+            self._conn.commit()
+
+    def cari(self, video_id, mode):
+        """Path file yang masih ada (dan ukurannya cocok) untuk video_id + mode, atau None."""
+        if not video_id:
+            return None
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, ukuran FROM arsip WHERE video_id = ? AND mode = ? ORDER BY dicatat_pada DESC",
+                (video_id, mode)
+            ).fetchall()
+            hilang = []
+            hasil = None
+            for path, ukuran in rows:
+                if os.path.isfile(path) and os.path.getsize(path) == ukuran:
+                    hasil = path
+                    break
+                hilang.append(path)
+            # Entri yang filenya sudah dihapus/diubah dibuang dari arsip
+            if hilang:
+                self._conn.executemany("DELETE FROM arsip WHERE video_id = ? AND mode = ? AND path = ?",
+                                       [(video_id, mode, path) for path in hilang])
+                self._conn.commit()
+            return hasil
+
+    def catat(self, video_id, mode, path):
+        """Mencatat file hasil unduhan ke arsip."""
+        if not video_id or not path or not os.path.isfile(path):
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO arsip (video_id, mode, path, ukuran, dicatat_pada) VALUES (?, ?, ?, ?, ?)",
+                (video_id, mode, os.path.abspath(path), os.path.getsize(path), time.time())
+            )
+            self._conn.commit()
+
+    def pakai(self, sumber, folder_tujuan, nama_file, aksi=ARSIP_HARDLINK):
+        """
+        Menempatkan file arsip `sumber` ke folder_tujuan/nama_file(.ekstensi sumber)
+        dengan hardlink (jatuh ke salin jika beda drive/tidak didukung) atau salin.
+        Jika nama itu sudah dipakai file lain, file tersebut tidak disentuh dan
+        dipakai nama baru "nama_file (2)", "(3)", dst. Mengembalikan path tujuan.
+        """
+        dasar, ekstensi = os.path.join(folder_tujuan, nama_file), os.path.splitext(sumber)[1]
+        tujuan = dasar + ekstensi
+        nomor = 1
+        while os.path.exists(tujuan):
+            if os.path.samefile(sumber, tujuan) or os.path.getsize(tujuan) == os.path.getsize(sumber):
+                return tujuan
+            nomor += 1
+            tujuan = f"{dasar} ({nomor}){ekstensi}"
+        os.makedirs(folder_tujuan, exist_ok=True)
+        if aksi == ARSIP_HARDLINK:
+            try:
+                os.link(sumber, tujuan)
+                return tujuan
+            except OSError:
+                pass
+        shutil.copy2(sumber, tujuan)
+        return tujuan
+
+    def tutup(self):
+        with self._lock:
+            self._conn.close()
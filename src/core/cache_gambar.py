@@ -0,0 +1,80 @@
+import time
+import threading
+import collections
+from PyQt6.QtGui import QImage
+
+# Import konfigurasi dari file terpisah
+from config import load_thumbnail_cache_settings
+from core.cache_thumbnail import ambil_cache_thumbnail, kunci_youtube, url_youtube
+
+
+class CacheGambar:
+    """
+    LRU gambar hasil decode (QImage) di memori, dibatasi total byte, di atas
+    CacheThumbnail (disk + jaringan). Dipisah agar modul yang hanya butuh file
+    sampul (transcode, skrip satu/, bench/) tidak bergantung pada PyQt6.
+    """
+
+    def __init__(self, cache=None, settings=None):
+        settings = settings or load_thumbnail_cache_settings()
+        self.maks_memori = float(settings['maks_mb_memori']) * 1024 * 1024
+        self.revalidasi = float(settings['revalidasi_jam']) * 3600
+        self.cache = cache or ambil_cache_thumbnail()
+        self._lock = threading.Lock()
+        self._memori = collections.OrderedDict()  # kunci -> (QImage, dimuat_pada)
+        self._byte_memori = 0
+
+    def ambil_gambar(self, kunci, url):
+        """QImage hasil decode dari LRU memori atau dari cache disk; QImage kosong jika tidak ada."""
+        sekarang = time.time()
+        with self._lock:
+            entri = self._memori.get(kunci)
+            if entri and sekarang - entri[1] < self.revalidasi:
+                self._memori.move_to_end(kunci)
+                return entri[0]
+        path = self.cache.ambil_file(kunci, url)
+        gambar = QImage(path) if path else QImage()
+        if gambar.isNull():
+            self._buang(kunci)
+        else:
+            self._simpan(kunci, gambar, sekarang)
+        return gambar
+
+    def _simpan(self, kunci, gambar, sekarang):
+        with self._lock:
+            lama = self._memori.pop(kunci, None)
+            if lama:
+                self._byte_memori -= lama[0].sizeInBytes()
+            self._memori[kunci] = (gambar, sekarang)
+            self._byte_memori += gambar.sizeInBytes()
+            while self._byte_memori > self.maks_memori and len(self._memori) > 1:
+                _, (terlama, _) = self._memori.popitem(last=False)
+                self._byte_memori -= terlama.sizeInBytes()
+
+    def _buang(self, kunci):
+        with self._lock:
+            lama = self._memori.pop(kunci, None)
+            if lama:
+                self._byte_memori -= lama[0].sizeInBytes()
+
+    def gambar_youtube(self, video_id, kualitas):
+        return self.ambil_gambar(kunci_youtube(video_id, kualitas), url_youtube(video_id, kualitas))
+
+    def pratinjau_youtube(self, video_id):
+        """(QImage kualitas terbaik, judul) untuk video_id."""
+        kualitas, judul = self.cache.pratinjau_youtube(video_id)
+        gambar = self.gambar_youtube(video_id, kualitas) if kualitas else QImage()
+        return gambar, judul
+
+
+_cache = None
+_lock_cache = threading.Lock()
+
+
+def ambil_cache_gambar():
+    """Instance CacheGambar bersama untuk seluruh proses."""
+    global _cache
+    with _lock_cache:
+        if _cache is None:
+            _cache = CacheGambar()
+        return _cache
@@ -0,0 +1,353 @@
+import os
+import time
+import shutil
+import hashlib
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+
+# Import konfigurasi dari file terpisah
+from config import FOLDER_CACHE_THUMBNAIL, load_thumbnail_cache_settings
+
+# Kualitas thumbnail YouTube, dari yang terbaik
+KUALITAS_YOUTUBE = ('maxresdefault', 'sddefault', 'hqdefault', 'mqdefault')
+KUALITAS_GALERI = 'mqdefault'  # 320x180, selalu tersedia; cukup untuk sel galeri
+TIMEOUT_PERMINTAAN = 5
+JUMLAH_PENGAMBIL = 8  # Permintaan paralel (probe kualitas + oEmbed) lewat satu session keep-alive
+_EKSTENSI = {'image/jpeg': '.jpg', 'image/png': '.png', 'image/webp': '.webp'}
+
+
+def kunci_youtube(video_id, kualitas):
+    return f"{video_id}/{kualitas}"
+
+
+def url_youtube(video_id, kualitas):
+    return f"https://img.youtube.com/vi/{video_id}/{kualitas}.jpg"
+
+
+def kunci_url(url):
+    """Kunci cache untuk thumbnail non-YouTube (mis. dari extractor lain)."""
+    return "url/" + hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+class CacheThumbnail:
+    """
+    Cache thumbnail bersama untuk tab Thumbnail dan sampul hasil unduhan,
+    dengan kunci (video_id, kualitas):
+      - file di disk dengan indeks SQLite, dibatasi total ukuran, entri yang
+        paling lama tidak diakses dibuang lebih dulu;
+      - revalidasi bersyarat (ETag/Last-Modified) setelah `revalidasi_jam`,
+        sehingga gambar yang tidak berubah tidak diunduh ulang.
+    Thumbnail yang tidak ada (404) juga dicatat agar tidak dicoba terus.
+    Tanpa ketergantungan Qt; LRU gambar hasil decode ada di core.cache_gambar.
+    Aman dipakai dari beberapa thread; satu kunci hanya diambil sekali meski
+    diminta bersamaan. Semua permintaan memakai satu requests.Session sehingga
+    koneksi TLS ke server thumbnail dipakai ulang.
+    """
+
+    def __init__(self, folder=FOLDER_CACHE_THUMBNAIL, settings=None, session=None):
+        settings = settings or load_thumbnail_cache_settings()
+        self.maks_disk = float(settings['maks_mb_disk']) * 1024 * 1024
+        self.revalidasi = float(settings['revalidasi_jam']) * 3600
+        self.ttl_negatif = float(settings['ttl_negatif_jam']) * 3600
+        self.folder = folder
+        self.session = session or self._buat_session()
+        # Hanya untuk probe kualitas dan oEmbed; jangan memanggil kualitas_terbaik() dari thread pool ini
+        self._pool = ThreadPoolExecutor(max_workers=JUMLAH_PENGAMBIL, thread_name_prefix='Thumbnail')
+        self.hits = 0
+        self.misses = 0
+        self.revalidasi_304 = 0
+        self._lock = threading.Lock()
+        self._sedang_diambil = {}  # kunci -> [lock, jumlah peminta]
+
+        os.makedirs(folder, exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(folder, "indeks.sqlite3"), timeout=10, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS thumbnail (
+                    kunci TEXT PRIMARY KEY,
+                    ada INTEGER NOT NULL,
+                    file TEXT,
+                    ukuran INTEGER NOT NULL DEFAULT 0,
+                    etag TEXT,
+                    last_modified TEXT,
+                    divalidasi_pada REAL NOT NULL,
+                    diakses_pada REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_thumbnail_diakses ON thumbnail (diakses_pada)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS judul (
+                    video_id TEXT PRIMARY KEY,
+                    judul TEXT NOT NULL,
+                    disimpan_pada REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+            self._total_disk = self._conn.execute("SELECT COALESCE(SUM(ukuran), 0) FROM thumbnail").fetchone()[0]
+
+    @staticmethod
+    def _buat_session():
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=JUMLAH_PENGAMBIL)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    # --- Disk + jaringan ---
+
+    def ambil_file(self, kunci, url):
+        """Path file thumbnail di cache (diunduh/divalidasi bila perlu), atau None jika tidak ada."""
+        with self._lock:
+            entri = self._sedang_diambil.setdefault(kunci, [threading.Lock(), 0])
+            entri[1] += 1
+        try:
+            with entri[0]:
+                return self._pastikan(kunci, url)
+        finally:
+            with self._lock:
+                entri[1] -= 1
+                if not entri[1]:
+                    del self._sedang_diambil[kunci]
+
+    def _pastikan(self, kunci, url):
+        sekarang = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT ada, file, etag, last_modified, divalidasi_pada FROM thumbnail WHERE kunci = ?", (kunci,)
+            ).fetchone()
+        path_lama = None
+        headers = {}
+        if row:
+            ada, file, etag, last_modified, divalidasi_pada = row
+            path_lama = os.path.join(self.folder, file) if ada else None
+            if ada and not os.path.exists(path_lama):
+                path_lama = None  # file dihapus dari luar, unduh ulang
+            elif sekarang - divalidasi_pada < (self.revalidasi if ada else self.ttl_negatif):
+                self._sentuh(kunci, sekarang)
+                self.hits += 1
+                return path_lama
+            elif ada:
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=TIMEOUT_PERMINTAAN)
+        except requests.exceptions.RequestException:
+            # Server tidak terjangkau: salinan lama tetap lebih baik daripada tanpa sampul
+            return path_lama
+
+        if response.status_code == 304 and path_lama:
+            with self._lock:
+                self._conn.execute("UPDATE thumbnail SET divalidasi_pada = ?, diakses_pada = ? WHERE kunci = ?",
+                                   (sekarang, sekarang, kunci))
+                self._conn.commit()
+            self.revalidasi_304 += 1
+            return path_lama
+
+        jenis = response.headers.get('Content-Type', '').split(';')[0].strip()
+        if response.status_code == 200 and response.content and jenis.startswith('image'):
+            self.misses += 1
+            return self._simpan(kunci, response, jenis, sekarang)
+
+        if response.status_code in (404, 410):
+            self.misses += 1
+            self._simpan_negatif(kunci, sekarang)
+            return None
+        return path_lama
+
+    def _simpan(self, kunci, response, jenis, sekarang):
+        file = hashlib.sha1(kunci.encode('utf-8')).hexdigest() + _EKSTENSI.get(jenis, '.jpg')
+        path = os.path.join(self.folder, file)
+        try:
+            with open(path + '.part', 'wb') as f:
+                f.write(response.content)
+            os.replace(path + '.part', path)
+        except OSError:
+            return None
+        ukuran = len(response.content)
+        with self._lock:
+            lama = self._conn.execute("SELECT ukuran FROM thumbnail WHERE kunci = ?", (kunci,)).fetchone()
+            self._total_disk += ukuran - (lama[0] if lama else 0)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO thumbnail "
+                "(kunci, ada, file, ukuran, etag, last_modified, divalidasi_pada, diakses_pada) "
+                "VALUES (?, 1, ?, ?, ?, ?, ?, ?)",
+                (kunci, file, ukuran, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                 sekarang, sekarang)
+            )
+            if self._total_disk > self.maks_disk:
+                self._pangkas(kecuali=kunci)
+            self._conn.commit()
+        return path
+
+    def _simpan_negatif(self, kunci, sekarang):
+        with self._lock:
+            row = self._conn.execute("SELECT file, ukuran FROM thumbnail WHERE kunci = ? AND ada = 1",
+                                     (kunci,)).fetchone()
+            if row:
+                self._hapus_file(row[0])
+                self._total_disk -= row[1]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO thumbnail (kunci, ada, file, ukuran, divalidasi_pada, diakses_pada) "
+                "VALUES (?, 0, NULL, 0, ?, ?)", (kunci, sekarang, sekarang)
+            )
+            self._conn.commit()
+
+    def _sentuh(self, kunci, sekarang):
+        with self._lock:
+            self._conn.execute("UPDATE thumbnail SET diakses_pada = ? WHERE kunci = ?", (sekarang, kunci))
+            self._conn.commit()
+
+    def _pangkas(self, kecuali=None):
+        """Membuang file yang paling lama tidak diakses sampai total ukuran turun ke 90% batas."""
+        target = self.maks_disk * 0.9
+        rows = self._conn.execute(
+            "SELECT kunci, file, ukuran FROM thumbnail WHERE ada = 1 ORDER BY diakses_pada ASC"
+        ).fetchall()
+        for kunci, file, ukuran in rows:
+            if self._total_disk <= target:
+                break
+            if kunci == kecuali:
+                continue
+            self._hapus_file(file)
+            self._conn.execute("DELETE FROM thumbnail WHERE kunci = ?", (kunci,))
+            self._total_disk -= ukuran
+
+    def _hapus_file(self, file):
+        try:
+            os.remove(os.path.join(self.folder, file))
+        except OSError:
+            pass  # mis. sedang dibaca ffmpeg di Windows; akan tertimpa saat diunduh ulang
+
+    # --- YouTube ---
+
+    def kualitas_terbaik(self, video_id):
+        """
+        Kualitas thumbnail terbaik yang tersedia untuk video_id, atau None.
+        Semua kualitas dicoba bersamaan, jadi waktu tunggu terburuk sekitar satu
+        permintaan; kualitas yang lebih rendah ikut tersimpan di cache.
+        """
+        probe = [self._pool.submit(self.ambil_file, kunci_youtube(video_id, kualitas), url_youtube(video_id, kualitas))
+                 for kualitas in KUALITAS_YOUTUBE]
+        for kualitas, hasil in zip(KUALITAS_YOUTUBE, probe):
+            if hasil.result():
+                return kualitas
+        return None
+
+    def file_youtube(self, video_id):
+        """
+        Path thumbnail terbaik yang tersedia untuk video_id, atau None. Kualitas
+        dicoba berurutan dan berhenti di yang pertama ada, sehingga unduhan
+        biasa cukup satu permintaan (maxresdefault).
+        """
+        for kualitas in KUALITAS_YOUTUBE:
+            path = self.ambil_file(kunci_youtube(video_id, kualitas), url_youtube(video_id, kualitas))
+            if path:
+                return path
+        return None
+
+    def pratinjau_youtube(self, video_id):
+        """(kualitas terbaik atau None, judul) untuk video_id; probe gambar dan oEmbed berjalan bersamaan."""
+        judul = self._pool.submit(self.judul_youtube, video_id)
+        kualitas = self.kualitas_terbaik(video_id)
+        return kualitas, judul.result()
+
+    def judul_youtube(self, video_id):
+        """Judul video dari oEmbed YouTube (disimpan di cache), atau None."""
+        sekarang = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT judul, disimpan_pada FROM judul WHERE video_id = ?",
+                                     (video_id,)).fetchone()
+        if row and sekarang - row[1] < self.revalidasi:
+            return row[0]
+        judul = row[0] if row else None
+        try:
+            response = self.session.get(
+                "https://www.youtube.com/oembed",
+                params={'url': f"https://www.youtube.com/watch?v={video_id}", 'format': 'json'},
+                timeout=TIMEOUT_PERMINTAAN,
+            )
+            if response.status_code == 200:
+                judul = response.json().get('title') or judul
+        except (requests.exceptions.RequestException, ValueError):
+            return judul
+        if judul:
+            with self._lock:
+                self._conn.execute("INSERT OR REPLACE INTO judul (video_id, judul, disimpan_pada) VALUES (?, ?, ?)",
+                                   (video_id, judul, sekarang))
+                self._conn.commit()
+        return judul
+
+    def statistik(self):
+        """Mengembalikan teks ringkas hit/miss cache dan pemakaian disk."""
+        return (f"{self.hits} hit, {self.misses} miss, {self.revalidasi_304} revalidasi 304, "
+                f"{self._total_disk / 1024 / 1024:.1f} MB di disk")
+
+    def tutup(self):
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+
+_cache = None
+_lock_cache = threading.Lock()
+
+
+def ambil_cache_thumbnail():
+    """Instance CacheThumbnail bersama untuk seluruh proses."""
+    global _cache
+    with _lock_cache:
+        if _cache is None:
+            _cache = CacheThumbnail()
+        return _cache
+
+
+def _salin_sementara(path):
+    if not path:
+        return None
+    fd, salinan = tempfile.mkstemp(prefix='.sampul_', suffix=os.path.splitext(path)[1])
+    os.close(fd)
+    try:
+        shutil.copyfile(path, salinan)
+    except OSError:
+        os.remove(salinan)  # file cache baru saja dipangkas
+        return None
+    return salinan
+
+
+def tutup_cache_thumbnail():
+    """Menutup instance bersama (saat aplikasi ditutup) jika pernah dibuat."""
+    global _cache
+    with _lock_cache:
+        if _cache is not None:
+            _cache.tutup()
+            _cache = None
+
+
+def sampul_untuk_info(info):
+    """
+    Salinan sementara file sampul untuk info dict yt-dlp: thumbnail YouTube
+    terbaik berdasarkan id video, atau URL thumbnail dari extractor lain. None
+    jika tidak ada. Salinan tidak ikut terhapus saat cache dipangkas selagi
+    ffmpeg memakainya; pemanggil wajib menghapusnya setelah selesai.
+    """
+    if not info:
+        return None
+    cache = ambil_cache_thumbnail()
+    path = None
+    if info.get('extractor_key') == 'Youtube' and info.get('id'):
+        path = cache.file_youtube(info['id'])
+    if not path:
+        url = info.get('thumbnail') or next(
+            (t.get('url') for t in reversed(info.get('thumbnails') or []) if t.get('url')), None)
+        path = cache.ambil_file(kunci_url(url), url) if url else None
+    return _salin_sementara(path)
@@ -0,0 +1,104 @@
+import time
+import threading
+from collections import deque
+
+STATUS_OK = 'ok'
+STATUS_ERROR = 'error'
+STATUS_THROTTLE = 'throttle'
+
+# Pesan error yang menandakan YouTube sedang membatasi permintaan
+_TANDA_THROTTLE = ('429', 'too many requests', 'sign in to confirm', 'not a bot', 'rate limit')
+
+
+def klasifikasi_error(error):
+    """Mengembalikan STATUS_THROTTLE untuk error pembatasan (HTTP 429/cek bot), selain itu STATUS_ERROR."""
+    pesan = str(error).lower()
+    if any(tanda in pesan for tanda in _TANDA_THROTTLE):
+        return STATUS_THROTTLE
+    return STATUS_ERROR
+
+
+class PengaturKonkurensi:
+    """
+    Membatasi jumlah pencarian yang berjalan bersamaan. Dalam mode adaptif,
+    batas dinaikkan satu per satu selama permintaan lancar (additive increase)
+    dan dipotong setengah saat terjadi throttling atau error (multiplicative
+    decrease). Jeda backoff eksponensial untuk HTTP 429/cek bot berlaku di
+    kedua mode.
+    """
+
+    def __init__(self, batas_awal, maksimum, adaptif=True, minimum=1):
+        self.adaptif = adaptif
+        self.minimum = minimum
+        self.maksimum = max(minimum, maksimum)
+        self.batas = max(minimum, min(batas_awal, self.maksimum))
+        self._cond = threading.Condition()
+        self._aktif = 0
+        self._sukses_beruntun = 0
+        self._jeda = 0
+        self._jeda_sampai = 0
+        self._latensi_ewma = None
+        self._latensi_dasar = deque(maxlen=50)
+
+    def masuk(self, is_running=lambda: True):
+        """Menunggu slot kosong. Mengembalikan False jika dihentikan saat menunggu."""
+        with self._cond:
+            while is_running():
+                tunggu = self._jeda_sampai - time.monotonic()
+                if tunggu <= 0 and self._aktif < self.batas:
+                    self._aktif += 1
+                    return True
+                self._cond.wait(timeout=min(max(tunggu, 0.1), 0.5))
+            return False
+
+    def keluar(self, latensi, status=STATUS_OK):
+        """Melepas slot dan menyesuaikan batas berdasarkan latensi dan status permintaan."""
+        with self._cond:
+            self._aktif -= 1
+            sekarang = time.monotonic()
+
+            # Jeda backoff untuk throttling selalu berlaku; hanya perubahan batas yang khusus mode adaptif
+            if status == STATUS_THROTTLE:
+                self._jeda = min(max(self._jeda * 2, 5), 120)
+                self._jeda_sampai = sekarang + self._jeda
+            elif status == STATUS_OK:
+                self._jeda = 0
+
+            if self.adaptif:
+                if status in (STATUS_THROTTLE, STATUS_ERROR):
+                    self._turunkan()
+                else:
+                    self._catat_latensi(latensi)
+
+            self._cond.notify_all()
+
+    def _catat_latensi(self, latensi):
+        self._latensi_dasar.append(latensi)
+        if self._latensi_ewma is None:
+            self._latensi_ewma = latensi
+        else:
+            self._latensi_ewma = 0.8 * self._latensi_ewma + 0.2 * latensi
+
+        # Latensi melonjak jauh di atas latensi terbaik = tanda antrean/pembatasan di sisi server
+        if len(self._latensi_dasar) >= 5 and self._latensi_ewma > 2.5 * min(self._latensi_dasar):
+            self.batas = max(self.minimum, self.batas - 1)
+            self._sukses_beruntun = 0
+            self._latensi_ewma = None
+            return
+
+        self._sukses_beruntun += 1
+        if self._sukses_beruntun >= self.batas and self.batas < self.maksimum:
+            self.batas += 1
+            self._sukses_beruntun = 0
+
+    def _turunkan(self):
+        self.batas = max(self.minimum, self.batas // 2)
+        self._sukses_beruntun = 0
+
+    def status(self):
+        """Teks ringkas untuk ditampilkan di UI."""
+        teks = f"Konkurensi: {self.batas}/{self.maksimum}"
+        sisa_jeda = self._jeda_sampai - time.monotonic()
+        if sisa_jeda > 0:
+            teks += f" | Jeda throttling {sisa_jeda:.0f} dtk"
+        return teks
@@ -0,0 +1,94 @@
+import time
+from urllib.parse import urlparse, parse_qs
+
+# Masa berlaku jika URL stream tidak mencantumkan parameter expire
+MASA_BERLAKU_DEFAULT = 5 * 3600
+# Sisa waktu minimum agar unduhan tidak terputus di tengah jalan
+MARGIN_KEDALUWARSA = 15 * 60
+
+_KOLOM_FORMAT = (
+    'format_id', 'url', 'ext', 'protocol', 'acodec', 'vcodec', 'abr', 'vbr', 'tbr', 'asr',
+    'width', 'height', 'fps', 'container', 'filesize', 'filesize_approx', 'http_headers', 'downloader_options',
+)
+
+
+def _ringkas_format(f):
+    return {k: f[k] for k in _KOLOM_FORMAT if f.get(k) is not None} if f else None
+
+
+def _pilih_format(formats):
+    """Format terbaik per jenis; daftar format yt-dlp sudah terurut dari terburuk ke terbaik."""
+    audio = video = gabungan = None
+    for f in formats:
+        if not f.get('url') or f.get('protocol', 'https') not in ('https', 'http'):
+            continue
+        ada_audio = f.get('acodec') not in (None, 'none')
+        ada_video = f.get('vcodec') not in (None, 'none')
+        if ada_audio and ada_video:
+            gabungan = f
+        elif ada_audio:
+            audio = f
+        elif ada_video:
+            video = f
+    return audio, video, gabungan
+
+
+def _kedaluwarsa(formats):
+    batas = []
+    for f in formats:
+        expire = parse_qs(urlparse(f['url']).query).get('expire')
+        if expire and expire[0].isdigit():
+            batas.append(int(expire[0]))
+    return min(batas) if batas else int(time.time()) + MASA_BERLAKU_DEFAULT
+
+
+def buat_info_ringkas(video_info):
+    """
+    Rekaman ringkas dari info video lengkap: id, format terpilih (audio, video,
+    gabungan) beserta URL stream dan ukuran byte, durasi, serta waktu kedaluwarsa.
+    Mengembalikan None jika tidak ada format yang bisa dipakai ulang.
+    """
+    audio, video, gabungan = _pilih_format(video_info.get('formats') or [])
+    terpilih = [f for f in (audio, video, gabungan) if f]
+    if not terpilih:
+        return None
+    return {
+        'id': video_info.get('id'),
+        'judul': video_info.get('title'),
+        'webpage_url': video_info.get('webpage_url'),
+        'durasi': video_info.get('duration'),
+        'thumbnail': video_info.get('thumbnail'),
+        'uploader': video_info.get('uploader'),
+        'extractor': video_info.get('extractor'),
+        'extractor_key': video_info.get('extractor_key'),
+        'format': {'audio': _ringkas_format(audio), 'video': _ringkas_format(video),
+                   'gabungan': _ringkas_format(gabungan)},
+        'ukuran_byte': {jenis: f.get('filesize') or f.get('filesize_approx')
+                        for jenis, f in (('audio', audio), ('video', video), ('gabungan', gabungan)) if f},
+        'kedaluwarsa': _kedaluwarsa(terpilih),
+    }
+
+
+def masih_berlaku(rekaman, margin=MARGIN_KEDALUWARSA):
+    """True jika URL stream pada rekaman masih bisa dipakai untuk mengunduh."""
+    return bool(rekaman) and rekaman.get('kedaluwarsa', 0) - margin > time.time()
+
+
+def info_untuk_unduh(rekaman):
+    """Menyusun kembali info dict minimal yang bisa diproses YoutubeDL.process_ie_result()."""
+    formats = [dict(f) for f in rekaman['format'].values() if f]
+    info = {
+        '_type': 'video',
+        'id': rekaman['id'],
+        'title': rekaman.get('judul') or rekaman['id'],
+        'webpage_url': rekaman.get('webpage_url'),
+        'original_url': rekaman.get('webpage_url'),
+        'duration': rekaman.get('durasi'),
+        'uploader': rekaman.get('uploader'),
+        'extractor': rekaman.get('extractor') or 'youtube',
+        'extractor_key': rekaman.get('extractor_key') or 'Youtube',
+        'formats': formats,
+    }
+    if rekaman.get('thumbnail'):
+        info['thumbnails'] = [{'url': rekaman['thumbnail']}]
+    return info
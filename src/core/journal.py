@@ -0,0 +1,114 @@
+import os
+import json
+import time
+import tempfile
+import threading
+
+
+def tulis_json_atomik(path, data, indent=4):
+    """Menulis JSON ke file sementara lalu mengganti file tujuan sekaligus (atomik)."""
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class JurnalHasil:
+    """
+    Jurnal append-only (JSONL) untuk hasil pencarian. Setiap hasil langsung
+    ditulis satu baris, lalu secara berkala dipadatkan ke file JSON akhir.
+    """
+
+    def __init__(self, output_file, interval_item=200, interval_detik=30):
+        self.output_file = output_file
+        self.path = os.path.splitext(output_file)[0] + ".jurnal.jsonl"
+        self.interval_item = interval_item
+        self.interval_detik = interval_detik
+        self._lock = threading.Lock()
+        self._hasil = {}
+        self._file = None
+        self._sejak_pemadatan = 0
+        self._waktu_pemadatan = time.monotonic()
+
+    def muat(self):
+        """Memuat hasil dari file JSON akhir dan jurnal (untuk melanjutkan proses)."""
+        with self._lock:
+            self._hasil = {}
+            if os.path.exists(self.output_file):
+                try:
+                    with open(self.output_file, 'r', encoding='utf-8') as f:
+                        for item in json.load(f):
+                            self._hasil[item.get('judul_asli')] = item
+                except (IOError, json.JSONDecodeError):
+                    pass
+
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            item = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # Baris terakhir bisa terpotong jika proses mati mendadak
+                        self._hasil[item.get('judul_asli')] = item
+
+            return list(self._hasil.values())
+
+    def tambah(self, hasil):
+        """Menambahkan satu hasil ke jurnal dan memadatkan jika sudah waktunya."""
+        with self._lock:
+            self._tulis(hasil)
+
+    def perbarui(self, judul_asli, **kolom):
+        """Memperbarui kolom pada hasil yang sudah ada (mis. ukuran_file dari tahap kedua)."""
+        with self._lock:
+            if judul_asli not in self._hasil:
+                return
+            hasil = dict(self._hasil[judul_asli])
+            hasil.update(kolom)
+            self._tulis(hasil)
+
+    def _tulis(self, hasil):
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(hasil, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._hasil[hasil.get('judul_asli')] = hasil
+        self._sejak_pemadatan += 1
+
+        if (self._sejak_pemadatan >= self.interval_item
+                or time.monotonic() - self._waktu_pemadatan >= self.interval_detik):
+            self._padatkan()
+
+    def padatkan(self):
+        with self._lock:
+            self._padatkan()
+
+    def _padatkan(self):
+        # Tulis file akhir dulu, baru kosongkan jurnal; jika mati di antaranya,
+        # entri ganda akan digabung kembali oleh muat()
+        tulis_json_atomik(self.output_file, list(self._hasil.values()))
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._sejak_pemadatan = 0
+        self._waktu_pemadatan = time.monotonic()
+
+    def semua(self):
+        with self._lock:
+            return list(self._hasil.values())
+
+    def tutup(self):
+        """Pemadatan terakhir lalu menutup jurnal."""
+        with self._lock:
+            self._padatkan()
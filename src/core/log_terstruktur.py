@@ -0,0 +1,95 @@
+import os
+import logging
+import collections
+from logging.handlers import RotatingFileHandler
+
+# Semua logger aplikasi berada di bawah nama ini, mis. 'music_manager.unduhan'
+LOGGER_UTAMA = 'music_manager'
+# Id pekerja untuk pesan dari thread pengendali/GUI
+PEKERJA_UTAMA = 'Utama'
+
+_logger_utama = logging.getLogger(LOGGER_UTAMA)
+_logger_utama.setLevel(logging.INFO)
+_logger_utama.propagate = False
+
+
+def ambil_logger(nama):
+    return logging.getLogger(f'{LOGGER_UTAMA}.{nama}')
+
+
+def catat(logger, level, pesan, pekerja=PEKERJA_UTAMA, item=None):
+    """Mencatat satu pesan beserta id pekerja (mis. 'Unduh-2') dan item (mis. judul lagu)."""
+    logger.log(level, pesan, extra={'pekerja': pekerja, 'item': item})
+
+
+def pekerja_dari(record):
+    return getattr(record, 'pekerja', None) or record.threadName
+
+
+class FormatLog(logging.Formatter):
+    """Format baris file log: waktu, level, pekerja, item, pesan."""
+
+    def format(self, record):
+        teks = f"{self.formatTime(record)} {record.levelname:<7} [{pekerja_dari(record)}] "
+        if getattr(record, 'item', None):
+            teks += f"<{record.item}> "
+        teks += record.getMessage()
+        if record.exc_info:
+            teks += "\n" + self.formatException(record.exc_info)
+        return teks
+
+
+class PenampungLog(logging.Handler):
+    """
+    Handler logging berbasis ring buffer: hanya `kapasitas` catatan terakhir
+    yang disimpan, sehingga memori tetap terbatas berapa pun jumlah log.
+    Tampilan mengambil catatan baru secara berkala lewat ambil_baru().
+    """
+
+    def __init__(self, kapasitas=5000):
+        super().__init__()
+        self.kapasitas = kapasitas
+        self._ring = collections.deque(maxlen=kapasitas)
+        self._baru = collections.deque(maxlen=kapasitas)
+        self.pekerja = set()
+
+    def emit(self, record):
+        # Dipanggil di bawah self.lock oleh Handler.handle()
+        record.pekerja = pekerja_dari(record)
+        self._ring.append(record)
+        self._baru.append(record)
+        self.pekerja.add(record.pekerja)
+
+    def ambil_baru(self):
+        """Catatan yang masuk sejak pemanggilan terakhir (paling banyak `kapasitas`)."""
+        with self.lock:
+            baru = list(self._baru)
+            self._baru.clear()
+        return baru
+
+    def semua(self):
+        with self.lock:
+            self._baru.clear()
+            return list(self._ring)
+
+    def bersihkan(self):
+        with self.lock:
+            self._ring.clear()
+            self._baru.clear()
+            self.pekerja.clear()
+
+
+_handler_file = None
+
+
+def pasang_file_log(path, maks_mb=5, cadangan=3):
+    """Menyalin semua log aplikasi ke file berotasi (maks_mb per file, `cadangan` file lama)."""
+    global _handler_file
+    if _handler_file:
+        return _handler_file
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    _handler_file = RotatingFileHandler(path, maxBytes=maks_mb * 1024 * 1024, backupCount=cadangan,
+                                        encoding='utf-8', delay=True)
+    _handler_file.setFormatter(FormatLog())
+    _logger_utama.addHandler(_handler_file)
+    return _handler_file
@@ -0,0 +1,87 @@
+import re
+import heapq
+from array import array
+
+# Jenis nilai ukuran file
+UKURAN_TIDAK_DIKETAHUI = 0
+UKURAN_PASTI = 1
+UKURAN_PERKIRAAN = 2  # Teks diawali '~' (filesize_approx dari yt-dlp)
+
+_POLA_UKURAN = re.compile(r'^\s*(~)?\s*(\d+(?:\.\d+)?)\s*(KB|MB|GB)?', re.IGNORECASE)
+_SATUAN_MB = {'KB': 1 / 1024, 'MB': 1.0, 'GB': 1024.0}
+
+
+def urai_ukuran(teks):
+    """Mengubah teks ukuran ("3.42 MB", "~5.10 MB", "N/A") menjadi (megabyte, jenis)."""
+    cocok = _POLA_UKURAN.match(teks or "")
+    if not cocok:
+        return 0.0, UKURAN_TIDAK_DIKETAHUI
+    mb = float(cocok.group(2)) * _SATUAN_MB[(cocok.group(3) or 'MB').upper()]
+    return mb, UKURAN_PERKIRAAN if cocok.group(1) else UKURAN_PASTI
+
+
+class KolomUkuran:
+    """
+    Ukuran file semua baris yang sudah diurai sekali saat dimuat: array('d')
+    berisi megabyte dan bytearray berisi jenisnya. Aturan pemilihan bekerja
+    langsung di atas kedua array ini dan mengembalikan bytearray centang
+    (1 = dipilih) sepanjang jumlah baris. Baris tanpa ukuran tidak pernah dipilih.
+    """
+
+    def __init__(self, daftar_teks=()):
+        self.mb = array('d')
+        self.jenis = bytearray()
+        for teks in daftar_teks:
+            self.tambah(teks)
+
+    def __len__(self):
+        return len(self.mb)
+
+    def tambah(self, teks):
+        mb, jenis = urai_ukuran(teks)
+        self.mb.append(mb)
+        self.jenis.append(jenis)
+
+    def perbarui(self, row, teks):
+        self.mb[row], self.jenis[row] = urai_ukuran(teks)
+
+    def _berlaku(self, sertakan_perkiraan):
+        batas = UKURAN_PERKIRAAN if sertakan_perkiraan else UKURAN_PASTI
+        return [UKURAN_TIDAK_DIKETAHUI < j <= batas for j in self.jenis]
+
+    def paling_besar(self, batas_mb, sertakan_perkiraan=True):
+        """Dipilih jika ukuran <= batas_mb."""
+        return bytearray(b and mb <= batas_mb for b, mb in zip(self._berlaku(sertakan_perkiraan), self.mb))
+
+    def paling_kecil(self, batas_mb, sertakan_perkiraan=True):
+        """Dipilih jika ukuran >= batas_mb."""
+        return bytearray(b and mb >= batas_mb for b, mb in zip(self._berlaku(sertakan_perkiraan), self.mb))
+
+    def rentang(self, min_mb, maks_mb, sertakan_perkiraan=True):
+        return bytearray(b and min_mb <= mb <= maks_mb for b, mb in zip(self._berlaku(sertakan_perkiraan), self.mb))
+
+    def terbesar(self, k, sertakan_perkiraan=True):
+        """K baris dengan ukuran terbesar."""
+        berlaku = self._berlaku(sertakan_perkiraan)
+        hasil = bytearray(len(self.mb))
+        for row in heapq.nlargest(k, (r for r, b in enumerate(berlaku) if b), key=self.mb.__getitem__):
+            hasil[row] = 1
+        return hasil
+
+    def anggaran(self, total_mb, sertakan_perkiraan=True):
+        """
+        Mengisi anggaran total (mis. kapasitas flashdisk) sesuai urutan tabel:
+        baris yang masih muat dipilih, yang tidak muat dilewati dan baris
+        berikutnya tetap dicoba.
+        """
+        hasil = bytearray(len(self.mb))
+        sisa = total_mb
+        for row, (b, mb) in enumerate(zip(self._berlaku(sertakan_perkiraan), self.mb)):
+            if b and mb <= sisa:
+                hasil[row] = 1
+                sisa -= mb
+        return hasil
+
+    def total(self, centang):
+        """Total megabyte baris yang dicentang."""
+        return sum(mb for c, mb in zip(centang, self.mb) if c)
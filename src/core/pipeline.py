@@ -0,0 +1,31 @@
+import time
+import threading
+
+
+class PengukurTahap:
+    """Mencatat laju satu tahap pipeline (item dan byte per detik sejak tahap dimulai)."""
+
+    def __init__(self, nama):
+        self.nama = nama
+        self._lock = threading.Lock()
+        self._mulai = time.monotonic()
+        self.jumlah_item = 0
+        self.jumlah_byte = 0
+        self.aktif = 0
+
+    def masuk(self):
+        with self._lock:
+            self.aktif += 1
+
+    def keluar(self, jumlah_byte=0, sukses=True):
+        with self._lock:
+            self.aktif -= 1
+            if sukses:
+                self.jumlah_item += 1
+                self.jumlah_byte += jumlah_byte
+
+    def ringkasan(self):
+        durasi = max(time.monotonic() - self._mulai, 1e-6)
+        mb_per_detik = self.jumlah_byte / durasi / (1024 * 1024)
+        return (f"{self.nama}: {self.jumlah_item} item, {self.jumlah_item / durasi * 60:.1f}/mnt, "
+                f"{mb_per_detik:.2f} MB/dtk, aktif {self.aktif}")
@@ -0,0 +1,110 @@
+import threading
+
+from core.ydl_pool import ambil_ydl, buang_ydl, tutup_pool, PROFIL_CARI_LENGKAP
+from core.size_enricher import OPSI_INFO_LENGKAP
+
+_GAGAL = object()
+
+
+class PenyelesaiAwal:
+    """
+    Resolver look-ahead untuk antrean unduhan: selagi item sekarang diunduh,
+    info (halaman, player JS, dekode signature) untuk K item berikutnya sudah
+    diekstraksi di latar belakang, sehingga unduhan berikutnya bisa langsung
+    dimulai begitu slot kosong.
+    """
+
+    def __init__(self, items, kedalaman=3, num_workers=2, terbuka=False):
+        # items: list of (indeks_antrean, link), urut sesuai antrean unduhan.
+        # terbuka: daftar masih bisa bertambah lewat tambah() sampai tutup_daftar()
+        self.kedalaman = max(1, kedalaman)
+        self.num_workers = max(1, num_workers)
+        self.is_running = True
+        self._items = list(items)
+        self._posisi = 0      # item berikutnya yang akan diekstraksi
+        self._kursor = 0      # indeks antrean yang sedang diambil pengunduh
+        self._hasil = {}
+        self._sedang = set()
+        self._dilewati = set()
+        self._cond = threading.Condition()
+        self._threads = []
+        self._terbuka = terbuka
+
+    def mulai(self):
+        self._threads = [threading.Thread(target=self._kerja, daemon=True) for _ in range(self.num_workers)]
+        for t in self._threads:
+            t.start()
+
+    def _berikutnya(self):
+        with self._cond:
+            while self.is_running:
+                while self._posisi < len(self._items) and self._items[self._posisi][0] in self._dilewati:
+                    self._posisi += 1
+                if self._posisi >= len(self._items):
+                    if not self._terbuka:
+                        return None
+                elif self._items[self._posisi][0] < self._kursor + self.kedalaman:
+                    indeks, link = self._items[self._posisi]
+                    self._posisi += 1
+                    self._sedang.add(indeks)
+                    return indeks, link
+                self._cond.wait(timeout=0.5)
+            return None
+
+    def _kerja(self):
+        while self.is_running:
+            berikutnya = self._berikutnya()
+            if berikutnya is None:
+                break
+            indeks, link = berikutnya
+            info = _GAGAL
+            try:
+                ydl = ambil_ydl(PROFIL_CARI_LENGKAP, OPSI_INFO_LENGKAP)
+                info = ydl.extract_info(link, download=False) or _GAGAL
+            except Exception:
+                buang_ydl(PROFIL_CARI_LENGKAP)
+            with self._cond:
+                self._sedang.discard(indeks)
+                if indeks not in self._dilewati:
+                    self._hasil[indeks] = info
+                self._cond.notify_all()
+        tutup_pool()
+
+    def ambil(self, indeks):
+        """
+        Dipanggil saat pengunduh mengambil item `indeks`. Mengembalikan info yang
+        sudah diekstraksi (menunggu jika sedang diekstraksi), atau None jika
+        belum sempat/gagal sehingga pengunduh perlu mengekstraksi sendiri.
+        """
+        with self._cond:
+            self._kursor = max(self._kursor, indeks + 1)
+            self._cond.notify_all()
+            while indeks in self._sedang and self.is_running:
+                self._cond.wait(timeout=0.5)
+            self._dilewati.add(indeks)
+            info = self._hasil.pop(indeks, None)
+        return None if info is _GAGAL else info
+
+    def lewati(self, indeks):
+        """Item `indeks` tidak diunduh (mis. sudah ada di arsip); hasil ekstraksinya tidak ditunggu."""
+        with self._cond:
+            self._kursor = max(self._kursor, indeks + 1)
+            self._dilewati.add(indeks)
+            self._hasil.pop(indeks, None)
+            self._cond.notify_all()
+
+    def tambah(self, indeks, link):
+        """Menambahkan item di akhir antrean (indeks harus lebih besar dari item sebelumnya)."""
+        with self._cond:
+            self._items.append((indeks, link))
+            self._cond.notify_all()
+
+    def tutup_daftar(self):
+        with self._cond:
+            self._terbuka = False
+            self._cond.notify_all()
+
+    def stop(self):
+        with self._cond:
+            self.is_running = False
+            self._cond.notify_all()
@@ -0,0 +1,144 @@
+import os
+import re
+import time
+import sqlite3
+import threading
+import unicodedata
+
+# Import konfigurasi dari file terpisah
+from config import FILE_CACHE_PENCARIAN, load_search_cache_settings
+
+UKURAN_TIDAK_LENGKAP = {"N/A", "Error"}
+
+
+def normalisasi_judul(judul):
+    """Menormalkan judul pencarian agar variasi huruf/tanda baca memakai kunci yang sama."""
+    teks = unicodedata.normalize('NFKC', judul or "").casefold()
+    teks = re.sub(r'[^\w]+', ' ', teks)
+    return ' '.join(teks.split())
+
+
+class SearchCache:
+    """
+    Cache hasil pencarian YouTube di disk (SQLite), dipakai bersama oleh
+    SearchWorker dan satu/main_cari_musik.py. Aman dipakai dari beberapa thread.
+    """
+
+    def __init__(self, path=FILE_CACHE_PENCARIAN, settings=None):
+        settings = settings or load_search_cache_settings()
+        self.ttl = float(settings['ttl_hari']) * 86400
+        self.ttl_negatif = float(settings['ttl_negatif_jam']) * 3600
+        self.maks_entri = int(settings['maks_entri'])
+        self.hits = 0
+        self.misses = 0
+        self._simpan_sejak_pangkas = 0
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS hasil (
+                    kunci TEXT PRIMARY KEY,
+                    ditemukan INTEGER NOT NULL,
+                    video_id TEXT,
+                    judul_video TEXT,
+                    link_youtube TEXT,
+                    ukuran_file TEXT,
+                    disimpan_pada REAL NOT NULL,
+                    diakses_pada REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_hasil_diakses ON hasil (diakses_pada)")
+            self._conn.commit()
+
+    def ambil(self, judul, perlu_ukuran=False):
+        """
+        Mengembalikan dict hasil dari cache, atau None jika tidak ada/kedaluwarsa.
+        Jika perlu_ukuran True, entri tanpa ukuran file dianggap tidak ada.
+        """
+        kunci = normalisasi_judul(judul)
+        sekarang = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT ditemukan, video_id, judul_video, link_youtube, ukuran_file, disimpan_pada "
+                "FROM hasil WHERE kunci = ?", (kunci,)
+            ).fetchone()
+
+            if row:
+                ditemukan, video_id, judul_video, link_youtube, ukuran_file, disimpan_pada = row
+                ttl = self.ttl if ditemukan else self.ttl_negatif
+                if sekarang - disimpan_pada > ttl:
+                    self._conn.execute("DELETE FROM hasil WHERE kunci = ?", (kunci,))
+                    self._conn.commit()
+                    row = None
+                elif perlu_ukuran and ditemukan and (not ukuran_file or ukuran_file in UKURAN_TIDAK_LENGKAP):
+                    row = None
+
+            if not row:
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE hasil SET diakses_pada = ? WHERE kunci = ?", (sekarang, kunci))
+            self._conn.commit()
+            self.hits += 1
+
+        return {
+            'ditemukan': bool(ditemukan),
+            'video_id': video_id,
+            'judul_video': judul_video,
+            'link_youtube': link_youtube,
+            'ukuran_file': ukuran_file or "N/A",
+        }
+
+    def simpan(self, judul, video_id=None, judul_video=None, link_youtube=None, ukuran_file="N/A", ditemukan=True):
+        """Menyimpan hasil pencarian. Gunakan ditemukan=False untuk hasil "Tidak Ditemukan"."""
+        kunci = normalisasi_judul(judul)
+        if not kunci:
+            return
+        sekarang = time.time()
+        with self._lock:
+            if ditemukan and ukuran_file in UKURAN_TIDAK_LENGKAP:
+                # Jangan timpa ukuran yang sudah diketahui dengan "N/A" dari pencarian cepat
+                row = self._conn.execute(
+                    "SELECT ukuran_file FROM hasil WHERE kunci = ? AND video_id = ?", (kunci, video_id)
+                ).fetchone()
+                if row and row[0] and row[0] not in UKURAN_TIDAK_LENGKAP:
+                    ukuran_file = row[0]
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO hasil "
+                "(kunci, ditemukan, video_id, judul_video, link_youtube, ukuran_file, disimpan_pada, diakses_pada) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (kunci, int(ditemukan), video_id, judul_video, link_youtube, ukuran_file, sekarang, sekarang)
+            )
+            self._simpan_sejak_pangkas += 1
+            if self._simpan_sejak_pangkas >= 100:
+                self._pangkas()
+            self._conn.commit()
+
+    def _pangkas(self):
+        """Membuang entri yang paling lama tidak diakses jika jumlah entri melebihi batas."""
+        self._simpan_sejak_pangkas = 0
+        jumlah = self._conn.execute("SELECT COUNT(*) FROM hasil").fetchone()[0]
+        kelebihan = jumlah - self.maks_entri
+        if kelebihan > 0:
+            self._conn.execute(
+                "DELETE FROM hasil WHERE kunci IN "
+                "(SELECT kunci FROM hasil ORDER BY diakses_pada ASC LIMIT ?)", (kelebihan,)
+            )
+
+    def statistik(self):
+        """Mengembalikan teks ringkas jumlah hit/miss cache."""
+        total = self.hits + self.misses
+        rasio = (self.hits / total * 100) if total else 0
+        return f"{self.hits} hit, {self.misses} miss ({rasio:.0f}% hit)"
+
+    def tutup(self):
+        with self._lock:
+            self._pangkas()
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,113 @@
+import heapq
+import itertools
+import threading
+
+from core.ydl_pool import ambil_ydl, buang_ydl, tutup_pool, PROFIL_CARI_LENGKAP
+from core.info_ringkas import buat_info_ringkas
+
+UKURAN_BELUM_ADA = {"", "N/A", "Error"}
+OPSI_INFO_LENGKAP = {'quiet': True, 'no_warnings': True}
+
+
+def perlu_ukuran(item):
+    """True jika hasil pencarian punya link valid tetapi belum punya ukuran file."""
+    link = item.get('link_youtube') or ""
+    return link.startswith('http') and (item.get('ukuran_file') or "") in UKURAN_BELUM_ADA
+
+
+def hitung_ukuran_file(video_info):
+    """Mengembalikan teks ukuran file (mis. "3.42 MB") dari info video lengkap."""
+    try:
+        best_format = next((f for f in reversed(video_info.get('formats', []))
+                            if f.get('vcodec') != 'none' and f.get('acodec') != 'none' and f.get('filesize')), None)
+        if not best_format:
+            best_format = next((f for f in reversed(video_info.get('formats', []))
+                                if f.get('acodec') != 'none' and f.get('filesize')), None)
+
+        if best_format and best_format.get('filesize'):
+            filesize = best_format['filesize']
+            return f"{filesize / (1024*1024):.2f} MB"
+        filesize_approx = video_info.get('filesize_approx')
+        if filesize_approx:
+            return f"~{filesize_approx / (1024*1024):.2f} MB"
+        return "Tidak diketahui"
+    except Exception:
+        return "Error"
+
+
+class PengayaUkuran:
+    """
+    Tahap kedua pencarian: mengisi ukuran file di latar belakang dengan
+    ekstraksi format lengkap. Jumlah thread dibatasi sendiri, dan item yang
+    sedang dilihat/dipilih pengguna bisa didahulukan lewat prioritaskan().
+    Dengan simpan_info, rekaman format ringkas (lihat core.info_ringkas) ikut
+    dikirim ke on_result agar tahap unduh tidak perlu mengekstraksi ulang.
+    """
+
+    def __init__(self, items, on_result, num_workers=2, cache=None, simpan_info=False):
+        # items: list of (kunci, judul_asli, link)
+        # on_result(kunci, judul_asli, ukuran_file, info_unduh atau None)
+        self.on_result = on_result
+        self.simpan_info = simpan_info
+        self.num_workers = max(1, num_workers)
+        self.cache = cache
+        self.is_running = True
+        self._urutan = itertools.count()
+        self._lock = threading.Lock()
+        self._items = {}
+        self._heap = []
+        self._selesai = set()
+        for kunci, judul_asli, link in items:
+            self._items[kunci] = (judul_asli, link)
+            heapq.heappush(self._heap, (1, next(self._urutan), kunci))
+
+    def prioritaskan(self, kunci_list):
+        """Mendahulukan item tertentu; permintaan terbaru diproses lebih dulu."""
+        with self._lock:
+            for kunci in reversed(list(kunci_list)):
+                if kunci in self._items and kunci not in self._selesai:
+                    heapq.heappush(self._heap, (0, -next(self._urutan), kunci))
+
+    def _ambil_berikutnya(self):
+        with self._lock:
+            while self._heap and self.is_running:
+                _, _, kunci = heapq.heappop(self._heap)
+                if kunci not in self._selesai:
+                    self._selesai.add(kunci)
+                    return kunci
+            return None
+
+    def _kerja(self):
+        while self.is_running:
+            kunci = self._ambil_berikutnya()
+            if kunci is None:
+                break
+            judul_asli, link = self._items[kunci]
+            ukuran_file_str = "Error"
+            info_unduh = None
+            try:
+                ydl = ambil_ydl(PROFIL_CARI_LENGKAP, OPSI_INFO_LENGKAP)
+                video_info = ydl.extract_info(link, download=False)
+                if video_info:
+                    ukuran_file_str = hitung_ukuran_file(video_info)
+                    if self.simpan_info:
+                        info_unduh = buat_info_ringkas(video_info)
+                    if self.cache:
+                        self.cache.simpan(judul_asli, video_info.get('id'), video_info.get('title'),
+                                          link, ukuran_file_str)
+            except Exception:
+                buang_ydl(PROFIL_CARI_LENGKAP)
+            if self.is_running:
+                self.on_result(kunci, judul_asli, ukuran_file_str, info_unduh)
+        tutup_pool()
+
+    def jalankan(self):
+        """Memproses semua item dan menunggu sampai selesai atau dihentikan."""
+        threads = [threading.Thread(target=self._kerja, daemon=True) for _ in range(self.num_workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def stop(self):
+        self.is_running = False
@@ -0,0 +1,119 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+import spotipy
+from requests.adapters import HTTPAdapter
+from spotipy.cache_handler import MemoryCacheHandler
+from spotipy.exceptions import SpotifyException
+from spotipy.oauth2 import SpotifyClientCredentials
+
+# Import konfigurasi dari file terpisah
+from config import load_spotify_credentials
+
+TIMEOUT_PERMINTAAN = 10
+JUMLAH_HALAMAN_PARALEL = 4  # Halaman playlist yang diambil bersamaan
+LAGU_PER_HALAMAN = 100      # Batas maksimum endpoint playlist items
+MAKS_PERCOBAAN = 4
+MAKS_JEDA = 60              # Retry-After lebih lama dari ini tidak ditunggu, error diteruskan
+# Hanya bidang yang dipakai tab Spotify, agar respons jauh lebih kecil
+BIDANG_LAGU = 'items(track(name,artists(name),album(name)))'
+
+_lock = threading.Lock()
+_klien = None
+_kredensial = None
+_jeda_sampai = 0.0  # Setelah HTTP 429, semua permintaan menunggu sampai waktu ini
+
+
+def _buat_session():
+    """
+    Session HTTP bersama dengan pool koneksi untuk halaman paralel. Tanpa retry
+    urllib3: semua pengulangan (429, 5xx, jaringan) ada di panggil_api() saja.
+    """
+    adapter = HTTPAdapter(pool_maxsize=JUMLAH_HALAMAN_PARALEL * 2)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def ambil_klien_spotify(client_id=None, client_secret=None):
+    """
+    Klien spotipy bersama untuk seluruh proses. Token akses disimpan di memori
+    sampai kedaluwarsa dan koneksi HTTP (keep-alive) dipakai ulang antar
+    pencarian, sehingga setiap permintaan cukup satu round trip ke API.
+    Klien hanya dibuat ulang jika kredensial berubah. Tanpa argumen,
+    kredensial dibaca dari config.json.
+    """
+    global _klien, _kredensial
+    if client_id is None or client_secret is None:
+        creds = load_spotify_credentials()
+        client_id, client_secret = creds.get('client_id', ''), creds.get('client_secret', '')
+    with _lock:
+        if _klien is None or _kredensial != (client_id, client_secret):
+            auth_manager = SpotifyClientCredentials(client_id=client_id, client_secret=client_secret,
+                                                    cache_handler=MemoryCacheHandler(),
+                                                    requests_timeout=TIMEOUT_PERMINTAAN)
+            _klien = spotipy.Spotify(auth_manager=auth_manager, requests_session=_buat_session(),
+                                     requests_timeout=TIMEOUT_PERMINTAAN)
+            _kredensial = (client_id, client_secret)
+        return _klien
+
+
+def _tunggu_jeda():
+    tunggu = _jeda_sampai - time.monotonic()
+    if tunggu > 0:
+        time.sleep(tunggu)
+
+
+def panggil_api(fungsi, *args, **kwargs):
+    """
+    Memanggil metode klien Spotify dengan retry. HTTP 429 menunggu sesuai
+    Retry-After (jeda berlaku untuk semua thread), error 5xx dan jaringan
+    diulang dengan backoff eksponensial.
+    """
+    global _jeda_sampai
+    for percobaan in range(MAKS_PERCOBAAN):
+        _tunggu_jeda()
+        try:
+            return fungsi(*args, **kwargs)
+        except SpotifyException as e:
+            if percobaan == MAKS_PERCOBAAN - 1:
+                raise
+            if e.http_status == 429:
+                try:
+                    jeda = float((e.headers or {}).get('Retry-After', 2 ** percobaan))
+                except ValueError:
+                    jeda = 2 ** percobaan
+                if jeda > MAKS_JEDA:
+                    raise
+                with _lock:
+                    _jeda_sampai = max(_jeda_sampai, time.monotonic() + jeda)
+            elif e.http_status and e.http_status >= 500:
+                time.sleep(2 ** percobaan)
+            else:
+                raise
+        except requests.exceptions.RequestException:
+            if percobaan == MAKS_PERCOBAAN - 1:
+                raise
+            time.sleep(2 ** percobaan)
+
+
+def ambil_lagu_playlist(sp, playlist_id):
+    """
+    Semua item playlist, urut sesuai playlist. Halaman pertama memberi `total`,
+    lalu sisa offset diambil bersamaan (paling banyak JUMLAH_HALAMAN_PARALEL)
+    dan disusun kembali sesuai urutan offset.
+    """
+    def halaman(offset, fields=BIDANG_LAGU):
+        return panggil_api(sp.playlist_items, playlist_id, fields=fields, limit=LAGU_PER_HALAMAN,
+                           offset=offset, additional_types=('track',))
+
+    pertama = halaman(0, fields=f'total,{BIDANG_LAGU}')
+    items = list(pertama.get('items') or [])
+    sisa = range(LAGU_PER_HALAMAN, pertama.get('total') or 0, LAGU_PER_HALAMAN)
+    if sisa:
+        with ThreadPoolExecutor(max_workers=JUMLAH_HALAMAN_PARALEL, thread_name_prefix='Spotify') as pool:
+            for hasil in pool.map(halaman, sisa):
+                items.extend(hasil.get('items') or [])
+    return items
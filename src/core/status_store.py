@@ -0,0 +1,133 @@
+import os
+import json
+import threading
+
+from core.journal import tulis_json_atomik
+
+
+class PenyimpanStatus:
+    """
+    Menyimpan isi file hasil JSON di memori dengan indeks per judul_asli dan
+    link, sehingga perubahan status tidak perlu membaca ulang dan memindai
+    seluruh file. Perubahan ditulis bertahap (debounce) secara atomik, dan
+    sekali lagi lewat simpan()/tutup() saat proses berhenti atau selesai.
+    """
+
+    def __init__(self, json_file_path, jeda_simpan=2.0, indent=4):
+        self.json_file_path = json_file_path
+        self.jeda_simpan = jeda_simpan
+        self.indent = indent
+        self._lock = threading.RLock()
+        self._timer = None
+        self._kotor = False
+        self._ditahan = False
+
+        self.data = self._baca()
+        self._indeks = {}
+        for item in self.data:
+            self._indeks_item(item)
+
+    def _baca(self):
+        # Pada mode streaming file hasil bisa saja belum dibuat oleh pencarian
+        if not os.path.exists(self.json_file_path):
+            return []
+        with open(self.json_file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _indeks_item(self, item):
+        for kunci in (item.get('link_youtube'), item.get('judul_asli')):
+            if kunci:
+                self._indeks[kunci] = item
+
+    def cari(self, kunci):
+        """Mencari item berdasarkan judul_asli atau link_youtube."""
+        return self._indeks.get(kunci)
+
+    def tambah(self, item):
+        """
+        Menambahkan item baru (mis. hasil pencarian yang di-stream) dan
+        mengembalikan indeksnya di data. Item lama dengan judul_asli sama yang
+        belum punya link (mis. "Dibatasi YouTube" yang dicari ulang) diganti
+        di tempat. None jika judul_asli sudah punya hasil dengan link.
+        """
+        with self._lock:
+            lama = self._indeks.get(item.get('judul_asli'))
+            if lama is None:
+                self.data.append(item)
+                self._indeks_item(item)
+                self._tandai_kotor()
+                return len(self.data) - 1
+            if (lama.get('link_youtube') or "").startswith('http'):
+                return None
+            if self._indeks.get(lama.get('link_youtube')) is lama:
+                del self._indeks[lama['link_youtube']]
+            lama.clear()
+            lama.update(item)
+            self._indeks_item(lama)
+            self._tandai_kotor()
+            return next(i for i, x in enumerate(self.data) if x is lama)
+
+    def tahan(self):
+        """Menunda penulisan ke disk selama proses lain (pencarian) masih menulis file yang sama."""
+        with self._lock:
+            self._ditahan = True
+
+    def lanjutkan(self):
+        """
+        Mengakhiri penundaan: file dibaca ulang (kolom dari proses lain, mis.
+        ukuran file, ikut terbawa), status unduhan di memori digabungkan, item
+        yang belum ada di file ditambahkan, lalu semuanya disimpan.
+        """
+        with self._lock:
+            self._ditahan = False
+            di_memori = self.data
+            self.data = self._baca()
+            self._indeks = {}
+            for item in self.data:
+                self._indeks_item(item)
+            for item in di_memori:
+                item_file = self._indeks.get(item.get('judul_asli'))
+                if item_file is None:
+                    self.data.append(item)
+                    self._indeks_item(item)
+                elif item.get('download'):
+                    item_file['download'] = True
+            self._kotor = True
+        self.simpan()
+
+    def perbarui(self, kunci, **kolom):
+        """Memperbarui kolom item (dicari lewat judul_asli/link) dan menjadwalkan penyimpanan."""
+        with self._lock:
+            item = self._indeks.get(kunci)
+            if item is None:
+                return False
+            item.update(kolom)
+            self._tandai_kotor()
+            return True
+
+    def _tandai_kotor(self):
+        self._kotor = True
+        if self._timer is None and not self._ditahan:
+            self._timer = threading.Timer(self.jeda_simpan, self._simpan_latar)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _simpan_latar(self):
+        try:
+            self.simpan()
+        except Exception:
+            pass  # Perubahan tetap tertunda dan dicoba lagi pada penyimpanan berikutnya
+
+    def simpan(self):
+        """Menulis semua perubahan yang tertunda ke disk (atomik)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._kotor or self._ditahan:
+                return
+            tulis_json_atomik(self.json_file_path, self.data, indent=self.indent)
+            self._kotor = False
+
+    def tutup(self):
+        self.simpan()
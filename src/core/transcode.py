@@ -0,0 +1,225 @@
+import os
+import base64
+import struct
+import tempfile
+import subprocess
+from yt_dlp.postprocessor.common import PostProcessor
+from yt_dlp.utils import PostProcessingError
+
+# Import konfigurasi dari file terpisah
+from config import FFMPEG_PATH
+from core.cache_thumbnail import sampul_untuk_info
+from core.ydl_pool import file_thumbnail
+
+# Kebijakan format audio
+FORMAT_AUDIO_MP3 = 'mp3'    # encode ulang ke MP3 (paling kompatibel)
+FORMAT_AUDIO_ASLI = 'asli'  # simpan codec asli (Opus/AAC) tanpa encode, hanya remux + tag + sampul
+
+# Codec audio -> (ekstensi, muxer ffmpeg) untuk remux tanpa encode
+_WADAH_ASLI = {
+    'opus': ('opus', 'opus'),
+    'vorbis': ('ogg', 'ogg'),
+    'mp4a': ('m4a', 'ipod'),
+    'aac': ('m4a', 'ipod'),
+    'mp3': ('mp3', 'mp3'),
+}
+_CODEC_DARI_EKSTENSI = {'webm': 'opus', 'opus': 'opus', 'ogg': 'vorbis', 'm4a': 'mp4a', 'mp4': 'mp4a', 'mp3': 'mp3'}
+
+
+def ffmpeg_exe(ffmpeg_location=None):
+    """Mengembalikan path program ffmpeg dari FFMPEG_PATH (folder atau file), default 'ffmpeg' di PATH."""
+    ffmpeg_location = ffmpeg_location or FFMPEG_PATH
+    if not ffmpeg_location:
+        return 'ffmpeg'
+    if os.path.isdir(ffmpeg_location):
+        return os.path.join(ffmpeg_location, 'ffmpeg')
+    return ffmpeg_location
+
+
+def jalankan_ffmpeg(args, ffmpeg_location=None):
+    """Menjalankan ffmpeg tanpa jendela konsol; RuntimeError berisi pesan ffmpeg jika gagal."""
+    cmd = [ffmpeg_exe(ffmpeg_location), '-y', '-hide_banner', '-loglevel', 'error'] + args
+    flags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+    hasil = subprocess.run(cmd, capture_output=True, creationflags=flags)
+    if hasil.returncode != 0:
+        pesan = hasil.stderr.decode('utf-8', 'replace').strip().splitlines()
+        raise RuntimeError(pesan[-1] if pesan else f"ffmpeg keluar dengan kode {hasil.returncode}")
+
+
+def metadata_dari_info(info):
+    """Tag dasar (judul, artis, sumber) dari info dict yt-dlp."""
+    metadata = {
+        'title': info.get('track') or info.get('title'),
+        'artist': info.get('artist') or info.get('uploader') or info.get('channel'),
+        'comment': info.get('webpage_url'),
+    }
+    return {k: v for k, v in metadata.items() if v}
+
+
+def _escape_ffmetadata(teks):
+    for karakter in ('\\', '=', ';', '#', '\n'):
+        teks = teks.replace(karakter, '\\' + karakter)
+    return teks
+
+
+def _tulis_ffmetadata(metadata, folder):
+    fd, path = tempfile.mkstemp(prefix='.meta_', suffix='.txt', dir=folder)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(';FFMETADATA1\n')
+        for kunci, nilai in metadata.items():
+            f.write(f"{_escape_ffmetadata(kunci)}={_escape_ffmetadata(str(nilai))}\n")
+    return path
+
+
+def _blok_gambar_flac(path_jpeg):
+    """METADATA_BLOCK_PICTURE (base64) untuk sampul Ogg/Opus, yang tidak mendukung stream attached_pic."""
+    with open(path_jpeg, 'rb') as f:
+        data = f.read()
+    mime = b'image/jpeg'
+    blok = (struct.pack('>II', 3, len(mime)) + mime + struct.pack('>I', 0)
+            + struct.pack('>IIIII', 0, 0, 24, 0, len(data)) + data)
+    return base64.b64encode(blok).decode('ascii')
+
+
+def buat_mp3(sumber, tujuan, sampul=None, kualitas='192', ffmpeg_location=None, metadata=None):
+    """
+    Mengambil stream audio dari file sumber (audio atau video hasil unduhan)
+    dan menyimpannya sebagai MP3, lengkap dengan sampul jika ada.
+    """
+    args = ['-i', sumber]
+    if sampul:
+        args += ['-i', sampul, '-map', '0:a:0', '-map', '1:0',
+                 '-c:v', 'mjpeg', '-disposition:v', 'attached_pic',
+                 '-metadata:s:v', 'title=Album cover', '-metadata:s:v', 'comment=Cover (front)']
+    else:
+        args += ['-map', '0:a:0']
+    for kunci, nilai in (metadata or {}).items():
+        args += ['-metadata', f'{kunci}={nilai}']
+    sementara = tujuan + '.part'
+    args += ['-c:a', 'libmp3lame', '-b:a', f'{kualitas}k', '-id3v2_version', '3', '-f', 'mp3', sementara]
+    try:
+        jalankan_ffmpeg(args, ffmpeg_location)
+        os.replace(sementara, tujuan)
+    finally:
+        if os.path.exists(sementara):
+            os.remove(sementara)
+    return tujuan
+
+
+def buat_audio_asli(sumber, dasar_tujuan, acodec=None, sampul=None, ffmpeg_location=None, metadata=None):
+    """
+    Menyalin stream audio apa adanya (tanpa encode) ke wadah yang sesuai
+    dengan codec-nya (.opus/.ogg/.m4a/.mp3), lalu menyematkan tag dan sampul.
+    `dasar_tujuan` adalah path tanpa ekstensi. Codec yang tidak dikenal
+    di-encode ke MP3. Mengembalikan path file hasil.
+    """
+    codec = (acodec or '').split('.')[0].lower()
+    if codec not in _WADAH_ASLI:
+        codec = _CODEC_DARI_EKSTENSI.get(os.path.splitext(sumber)[1][1:].lower())
+    if codec not in _WADAH_ASLI:
+        return buat_mp3(sumber, dasar_tujuan + '.mp3', sampul, ffmpeg_location=ffmpeg_location, metadata=metadata)
+
+    ekstensi, muxer = _WADAH_ASLI[codec]
+    tujuan = f'{dasar_tujuan}.{ekstensi}'
+    sementara = tujuan + '.part'
+    folder = os.path.dirname(os.path.abspath(tujuan))
+    metadata = dict(metadata or {})
+    file_bantu = []
+    try:
+        if sampul and muxer in ('opus', 'ogg'):
+            # Ogg hanya bisa menyimpan sampul sebagai tag METADATA_BLOCK_PICTURE
+            fd, sampul_jpeg = tempfile.mkstemp(prefix='.sampul_', suffix='.jpg', dir=folder)
+            os.close(fd)
+            file_bantu.append(sampul_jpeg)
+            jalankan_ffmpeg(['-i', sampul, '-frames:v', '1', '-q:v', '3', sampul_jpeg], ffmpeg_location)
+            metadata['METADATA_BLOCK_PICTURE'] = _blok_gambar_flac(sampul_jpeg)
+            sampul = None
+
+        # Tag lewat file ffmetadata agar tag panjang (sampul base64) tidak melewati batas baris perintah
+        path_meta = _tulis_ffmetadata(metadata, folder)
+        file_bantu.append(path_meta)
+        args = ['-i', sumber, '-f', 'ffmetadata', '-i', path_meta]
+        if sampul:
+            args += ['-i', sampul, '-map', '0:a:0', '-map', '2:0', '-c:v', 'mjpeg', '-disposition:v', 'attached_pic']
+        else:
+            args += ['-map', '0:a:0']
+        args += ['-map_metadata', '1', '-c:a', 'copy']
+        if muxer == 'mp3':
+            args += ['-id3v2_version', '3']
+        args += ['-f', muxer, sementara]
+
+        jalankan_ffmpeg(args, ffmpeg_location)
+        os.replace(sementara, tujuan)
+    finally:
+        for path in file_bantu + [sementara]:
+            if os.path.exists(path):
+                os.remove(path)
+    return tujuan
+
+
+def buat_audio(sumber, dasar_tujuan, format_audio=FORMAT_AUDIO_MP3, acodec=None, sampul=None,
+               ffmpeg_location=None, metadata=None):
+    """Membuat file audio akhir sesuai kebijakan format (MP3 atau codec asli). Mengembalikan path hasil."""
+    if format_audio == FORMAT_AUDIO_ASLI:
+        return buat_audio_asli(sumber, dasar_tujuan, acodec, sampul, ffmpeg_location, metadata)
+    return buat_mp3(sumber, dasar_tujuan + '.mp3', sampul, ffmpeg_location=ffmpeg_location, metadata=metadata)
+
+
+def _hapus_sampul(sampul):
+    # Salinan sementara dari sampul_untuk_info(); tidak lewat daftar hapus yt-dlp agar tetap terhapus dengan keepvideo
+    if sampul and os.path.exists(sampul):
+        os.remove(sampul)
+
+
+class MP3BersampulPP(PostProcessor):
+    """
+    Postprocessor yt-dlp pengganti rantai FFmpegExtractAudio + EmbedThumbnail:
+    encode MP3 dan penyematan sampul dikerjakan dalam satu panggilan ffmpeg,
+    sehingga file audio hanya dibaca dan ditulis sekali.
+    """
+
+    def __init__(self, downloader=None, kualitas='192'):
+        super().__init__(downloader)
+        self.kualitas = kualitas
+
+    def run(self, info):
+        sumber = info['filepath']
+        tujuan = os.path.splitext(sumber)[0] + '.mp3'
+        lokal = file_thumbnail(info)  # thumbnail yang sudah ditulis yt-dlp (writethumbnail)
+        sampul = lokal or sampul_untuk_info(info)
+        self.to_screen(f'Membuat MP3{" bersampul" if sampul else ""}: "{tujuan}"')
+        try:
+            buat_mp3(sumber, tujuan, sampul, self.kualitas, self.get_param('ffmpeg_location'),
+                     metadata_dari_info(info))
+        except Exception as e:
+            raise PostProcessingError(f'Gagal membuat MP3: {e}')
+        finally:
+            if not lokal:
+                _hapus_sampul(sampul)
+
+        info['filepath'] = tujuan
+        info['ext'] = 'mp3'
+        # File sumber dan thumbnail yang sudah disematkan dihapus oleh yt-dlp (kecuali opsi keepvideo)
+        return [f for f in (sumber, lokal) if f and f != tujuan], info
+
+
+class AudioAsliPP(PostProcessor):
+    """Postprocessor yt-dlp untuk FORMAT_AUDIO_ASLI: remux codec asli + tag + sampul, tanpa encode."""
+
+    def run(self, info):
+        sumber = info['filepath']
+        lokal = file_thumbnail(info)  # thumbnail yang sudah ditulis yt-dlp (writethumbnail)
+        sampul = lokal or sampul_untuk_info(info)
+        self.to_screen(f'Menyimpan audio asli ({info.get("acodec") or info.get("ext")}) tanpa encode')
+        try:
+            tujuan = buat_audio_asli(sumber, os.path.splitext(sumber)[0], info.get('acodec'), sampul,
+                                     self.get_param('ffmpeg_location'), metadata_dari_info(info))
+        except Exception as e:
+            raise PostProcessingError(f'Gagal menyimpan audio: {e}')
+        finally:
+            if not lokal:
+                _hapus_sampul(sampul)
+
+        info['filepath'] = tujuan
+        info['ext'] = os.path.splitext(tujuan)[1][1:]
+        return [f for f in (sumber, lokal) if f and f != tujuan], info
@@ -1,117 +1,188 @@
 import os
 import json
-import re
-import requests
-import yt_dlp
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials
+import time
+import queue
+import logging
+import threading
+from collections import deque
 from pytube import Search
-from PyQt6.QtGui import QPixmap
-from PyQt6.QtCore import QThread, pyqtSignal, QMutex, QMutexLocker
+from PyQt6.QtGui import QImage, QImageReader
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 
 # Import konfigurasi dari file terpisah
-from config import FFMPEG_PATH, FOLDER_HASIL_JSON
+from config import (
+    FFMPEG_PATH, FOLDER_HASIL_JSON, JUMLAH_PENGISI_UKURAN, JUMLAH_KONVERSI, JUMLAH_PREFETCH, JUMLAH_PEMUAT_GALERI
+)
+from core.search_cache import SearchCache
+from core.journal import JurnalHasil
+from core.ydl_pool import (
+    ambil_ydl, atur_outtmpl, buang_ydl, tutup_pool, file_hasil,
+    PROFIL_CARI_CEPAT, PROFIL_AUDIO, PROFIL_AUDIO_ASLI, PROFIL_AUDIO_MENTAH, PROFIL_VIDEO, PROFIL_KEDUANYA
+)
+from core.transcode import (
+    buat_audio, metadata_dari_info, MP3BersampulPP, AudioAsliPP, FORMAT_AUDIO_MP3, FORMAT_AUDIO_ASLI
+)
+from core.pipeline import PengukurTahap
+from core.size_enricher import PengayaUkuran, perlu_ukuran
+from core.info_ringkas import masih_berlaku, info_untuk_unduh
+from core.prefetch import PenyelesaiAwal
+from core.arsip_unduhan import ArsipUnduhan, ambil_video_id, ARSIP_HARDLINK, ARSIP_UNDUH_ULANG
+from core.concurrency import PengaturKonkurensi, klasifikasi_error, STATUS_OK, STATUS_THROTTLE
+from core.cache_thumbnail import (
+    ambil_cache_thumbnail, sampul_untuk_info, kunci_youtube, url_youtube, KUALITAS_GALERI
+)
+from core.cache_gambar import ambil_cache_gambar
+from core.spotify_klien import ambil_klien_spotify, ambil_lagu_playlist, panggil_api
+from core.log_terstruktur import ambil_logger, catat, PEKERJA_UTAMA
 
-# Mutex untuk memastikan penulisan file aman dari beberapa thread sekaligus
-file_mutex = QMutex()
+log_pencarian = ambil_logger('pencarian')
+log_unduhan = ambil_logger('unduhan')
+
+# Judul hasil untuk pencarian yang terus dibatasi YouTube; dicari ulang saat proses dilanjutkan
+JUDUL_DIBATASI = "Dibatasi YouTube"
 
 class SearchWorker(QThread):
-    task_finished = pyqtSignal(int, list)
-    log_message = pyqtSignal(int, str)
     progress_update = pyqtSignal(int)
+    result_found = pyqtSignal(dict)
+
+    MAKS_PERCOBAAN = 3
 
-    def __init__(self, worker_id, titles_to_search, get_file_size):
+    def __init__(self, worker_id, job_queue, jurnal, limiter, cache=None):
         super().__init__()
         self.worker_id = worker_id
-        self.titles_to_search = titles_to_search
-        self.get_file_size = get_file_size
+        self.job_queue = job_queue
+        self.jurnal = jurnal
+        self.limiter = limiter
+        self.cache = cache
         self.is_running = True
 
     def run(self):
-        worker_results = []
-        ydl_opts = {'quiet': True, 'no_warnings': True}
-        if not self.get_file_size:
-            ydl_opts['extract_flat'] = 'in_playlist'
+        # Tahap pertama selalu memakai extract_flat; ukuran file diisi oleh tahap kedua
+        ydl_opts = {'quiet': True, 'no_warnings': True, 'extract_flat': 'in_playlist'}
 
-        for title in self.titles_to_search:
-            if not self.is_running:
+        while self.is_running:
+            # Ambil satu judul dari antrean bersama; pekerja yang cepat otomatis mengambil lebih banyak
+            try:
+                title, percobaan = self.job_queue.get_nowait()
+            except queue.Empty:
                 break
 
-            self.log_message.emit(self.worker_id, f"[Pekerja #{self.worker_id}] Mencari: {title}...")
-            video_info = None
-            try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(f"ytsearch1:{title}", download=False)
-                if info and 'entries' in info and info['entries']:
-                    video_info = info['entries'][0]
-            except Exception as e:
-                self.log_message.emit(self.worker_id, f"   -> [Pekerja #{self.worker_id}] Error saat mencari: {e}")
-
-            if video_info:
-                judul_hasil = video_info.get('title', 'Judul tidak ditemukan')
-                link_hasil = video_info.get('webpage_url', 'Link tidak ditemukan')
-                ukuran_file_str = "N/A"
-                log_pesan = f"   -> [Pekerja #{self.worker_id}] Ditemukan: '{judul_hasil}'"
-
-                if self.get_file_size:
-                    try:
-                        best_format = next((f for f in reversed(video_info.get('formats', [])) 
-                                            if f.get('vcodec') != 'none' and f.get('acodec') != 'none' and f.get('filesize')), None)
-                        if not best_format:
-                            best_format = next((f for f in reversed(video_info.get('formats', [])) 
-                                                if f.get('acodec') != 'none' and f.get('filesize')), None)
-                        
-                        if best_format and best_format.get('filesize'):
-                            filesize = best_format['filesize']
-                            ukuran_file_str = f"{filesize / (1024*1024):.2f} MB"
-                        else:
-                            filesize_approx = video_info.get('filesize_approx')
-                            if filesize_approx:
-                                ukuran_file_str = f"~{filesize_approx / (1024*1024):.2f} MB"
-                            else:
-                                ukuran_file_str = "Tidak diketahui"
-                    except Exception:
-                        ukuran_file_str = "Error"
-                    log_pesan += f" ({ukuran_file_str})"
-                
-                self.log_message.emit(self.worker_id, log_pesan)
+            cached = self.cache.ambil(title) if self.cache else None
+            if cached:
+                if cached['ditemukan']:
+                    judul_hasil = cached['judul_video']
+                    link_hasil = cached['link_youtube']
+                    ukuran_file_str = cached['ukuran_file']
+                    self._log(f"Dari cache: '{judul_hasil}'", item=title)
+                else:
+                    judul_hasil = "Tidak Ditemukan"
+                    link_hasil = "Link tidak ditemukan"
+                    ukuran_file_str = "N/A"
+                    self._log("Dari cache: tidak ditemukan", item=title)
             else:
-                judul_hasil = "Tidak Ditemukan"
-                link_hasil = "Link tidak ditemukan"
-                ukuran_file_str = "N/A"
-                self.log_message.emit(self.worker_id, f"   -> [Pekerja #{self.worker_id}] Gagal menemukan video.")
+                # Batasi jumlah pencarian jaringan yang berjalan bersamaan
+                if not self.limiter.masuk(lambda: self.is_running):
+                    break
+                mulai = time.monotonic()
+                judul_hasil, link_hasil, ukuran_file_str, status = self._cari(title, ydl_opts)
+                self.limiter.keluar(time.monotonic() - mulai, status)
+
+                if status == STATUS_THROTTLE:
+                    if percobaan < self.MAKS_PERCOBAAN:
+                        # Dibatasi YouTube: kembalikan ke antrean untuk dicoba lagi setelah jeda
+                        self.job_queue.put((title, percobaan + 1))
+                        continue
+                    # Bukan berarti tidak ditemukan; tandai agar dicari lagi saat proses dilanjutkan
+                    judul_hasil = JUDUL_DIBATASI
 
-            worker_results.append({
+            # Simpan langsung ke jurnal agar hasil tidak hilang jika proses terhenti
+            hasil = {
                 "judul_asli": title,
                 "judul_video": judul_hasil,
                 "link_youtube": link_hasil,
                 "ukuran_file": ukuran_file_str,
                 "download": False
-            })
+            }
+            try:
+                self.jurnal.tambah(hasil)
+            except Exception as e:
+                self._log(f"Gagal menyimpan hasil: {e}", logging.ERROR, title)
+            self.result_found.emit(dict(hasil))
             self.progress_update.emit(1)
 
-        self.task_finished.emit(self.worker_id, worker_results)
+        tutup_pool()
+
+    def _cari(self, title, ydl_opts):
+        self._log("Mencari...", item=title)
+        video_info = None
+        status = STATUS_OK
+        try:
+            ydl = ambil_ydl(PROFIL_CARI_CEPAT, ydl_opts)
+            info = ydl.extract_info(f"ytsearch1:{title}", download=False)
+            if info and 'entries' in info and info['entries']:
+                video_info = info['entries'][0]
+        except Exception as e:
+            buang_ydl(PROFIL_CARI_CEPAT)
+            status = klasifikasi_error(e)
+            self._log(f"Error saat mencari: {e}", logging.ERROR, title)
+
+        if video_info:
+            judul_hasil = video_info.get('title', 'Judul tidak ditemukan')
+            link_hasil = video_info.get('webpage_url') or video_info.get('url') or 'Link tidak ditemukan'
+            ukuran_file_str = "N/A"
+            self._log(f"   -> Ditemukan: '{judul_hasil}'", item=title)
+            if self.cache:
+                self.cache.simpan(title, video_info.get('id'), judul_hasil, link_hasil, ukuran_file_str)
+        else:
+            judul_hasil = "Tidak Ditemukan"
+            link_hasil = "Link tidak ditemukan"
+            ukuran_file_str = "N/A"
+            self._log("   -> Gagal menemukan video.", logging.WARNING, title)
+            # Error jaringan tidak disimpan sebagai hasil negatif, agar dicoba lagi lain kali
+            if self.cache and status == STATUS_OK:
+                self.cache.simpan(title, ditemukan=False)
+
+        return judul_hasil, link_hasil, ukuran_file_str, status
+
+    def _log(self, pesan, level=logging.INFO, item=None):
+        catat(log_pencarian, level, pesan, f"Pencari-{self.worker_id}", item)
 
     def stop(self):
         self.is_running = False
 
 class SearchManager(QThread):
     progress = pyqtSignal(int, str)
-    log_message = pyqtSignal(str)
+    result_found = pyqtSignal(dict)
     finished = pyqtSignal(str)
 
-    def __init__(self, input_file, output_file, get_file_size, num_workers):
+    URUTAN_INPUT = 'input'
+    URUTAN_TERPENDEK = 'terpendek'
+
+    def __init__(self, input_file, output_file, get_file_size, num_workers, use_cache=True, urutan=URUTAN_INPUT,
+                 adaptif=False, simpan_info=False, streaming=False):
         super().__init__()
         self.input_file = input_file
         self.output_file = output_file
         self.get_file_size = get_file_size
+        self.simpan_info = simpan_info
+        # Mode streaming: setiap hasil tahap 1 langsung diteruskan lewat result_found
+        self.streaming = streaming
         self.num_workers = num_workers
+        self.use_cache = use_cache
+        self.urutan = urutan
+        self.adaptif = adaptif
+        # Mode adaptif: num_workers menjadi batas atas, mulai dari level yang aman
+        batas_awal = min(3, num_workers) if adaptif else num_workers
+        self.limiter = PengaturKonkurensi(batas_awal, num_workers, adaptif)
+        self.waktu_selesai = deque()
+        self._lock_progres = threading.Lock()
+        self.cache = None
+        self.jurnal = JurnalHasil(output_file)
+        self.pengaya = None
         self.workers = []
         self.is_running = True
         self.total_processed = 0
         self.total_titles = 0
-        self.all_results = []
-        self.workers_finished_count = 0
 
     def run(self):
         try:
@@ -131,22 +202,20 @@ class SearchManager(QThread):
                 self.finished.emit("File input kosong atau formatnya tidak sesuai.")
                 return
 
-            try:
-                if os.path.exists(self.output_file):
-                    with open(self.output_file, 'r', encoding='utf-8') as f:
-                        self.all_results = json.load(f)
-                    judul_asli_sudah_diproses = {item.get('judul_asli') for item in self.all_results}
-                    
-                    original_count = len(daftar_judul_input)
-                    titles_to_process = [title for title in daftar_judul_input if title not in judul_asli_sudah_diproses]
-                    
-                    self.log_message.emit(f"Melanjutkan proses. {len(judul_asli_sudah_diproses)} dari {original_count} lagu sudah ada.")
-                else:
-                    titles_to_process = daftar_judul_input
-                    self.log_message.emit("Memulai proses pencarian baru...")
-            except (FileNotFoundError, json.JSONDecodeError):
+            # Hasil lama dibaca dari file JSON akhir dan jurnal yang belum dipadatkan
+            hasil_sebelumnya = self.jurnal.muat()
+            if hasil_sebelumnya:
+                # Judul yang gagal karena throttling belum benar-benar diproses, jadi dicari lagi
+                judul_asli_sudah_diproses = {item.get('judul_asli') for item in hasil_sebelumnya
+                                             if item.get('judul_video') != JUDUL_DIBATASI}
+                
+                original_count = len(daftar_judul_input)
+                titles_to_process = [title for title in daftar_judul_input if title not in judul_asli_sudah_diproses]
+                
+                self._log(f"Melanjutkan proses. {len(judul_asli_sudah_diproses)} dari {original_count} lagu sudah ada.")
+            else:
                 titles_to_process = daftar_judul_input
-                self.log_message.emit("Memulai proses pencarian baru...")
+                self._log("Memulai proses pencarian baru...")
 
             self.total_titles = len(titles_to_process)
             if self.total_titles == 0:
@@ -156,127 +225,422 @@ class SearchManager(QThread):
             self.finished.emit(f"Error saat membaca file input: {e}")
             return
 
-        chunk_size = (self.total_titles + self.num_workers - 1) // self.num_workers
-        chunks = [titles_to_process[i:i + chunk_size] for i in range(0, self.total_titles, chunk_size)]
+        if self.use_cache:
+            try:
+                self.cache = SearchCache()
+            except Exception as e:
+                self._log(f"⚠️ Cache pencarian tidak dapat dibuka, lanjut tanpa cache: {e}", logging.WARNING)
+
+        if self.urutan == self.URUTAN_TERPENDEK:
+            titles_to_process = sorted(titles_to_process, key=len)
+
+        job_queue = queue.Queue()
+        for title in titles_to_process:
+            job_queue.put((title, 0))
 
-        for i, chunk in enumerate(chunks):
+        for i in range(min(self.num_workers, self.total_titles)):
             if not self.is_running: break
-            worker = SearchWorker(i + 1, chunk, self.get_file_size)
-            worker.log_message.connect(self.handle_worker_log)
-            worker.progress_update.connect(self.handle_worker_progress)
-            worker.task_finished.connect(self.handle_worker_finished)
+            worker = SearchWorker(i + 1, job_queue, self.jurnal, self.limiter, self.cache)
+            # Langsung di thread pekerja: progres diteruskan ke pengumpul pembaruan tanpa antre di thread GUI
+            worker.progress_update.connect(self.handle_worker_progress, Qt.ConnectionType.DirectConnection)
+            if self.streaming:
+                worker.result_found.connect(self.result_found)
             self.workers.append(worker)
             worker.start()
 
         for worker in self.workers:
             worker.wait()
 
-    def handle_worker_log(self, worker_id, message):
-        self.log_message.emit(message)
+        # Tahap 1 selesai: tulis hasil sekarang juga agar daftar langsung bisa dipakai
+        try:
+            self.jurnal.padatkan()
+            self._log(f"Tahap 1 selesai. Daftar hasil sudah bisa dibuka di tab Pengunduh:\n{self.output_file}")
+        except Exception as e:
+            self._log(f"   -> Gagal menyimpan file hasil: {e}", logging.ERROR)
+
+        if self.get_file_size and self.is_running:
+            self._lengkapi_ukuran()
+
+        if self.cache:
+            self._log(f"Cache pencarian: {self.cache.statistik()}")
+            self.cache.tutup()
+            self.cache = None
+
+        try:
+            self.jurnal.tutup()
+        except Exception as e:
+            self._log(f"   -> Gagal menyimpan file hasil: {e}", logging.ERROR)
+
+        if self.is_running:
+            self.finished.emit(f"Proses pencarian selesai. Hasil disimpan di:\n{self.output_file}")
+        else:
+            self.finished.emit("Proses pencarian dihentikan oleh pengguna.")
+
+    def _lengkapi_ukuran(self):
+        """Tahap 2: mengisi ukuran file untuk hasil yang belum punya ukuran."""
+        items = [(item['judul_asli'], item['judul_asli'], item['link_youtube'])
+                 for item in self.jurnal.semua() if perlu_ukuran(item)]
+        if not items:
+            return
+
+        self._log(f"Tahap 2: melengkapi ukuran file untuk {len(items)} lagu di latar belakang...")
+        self.total_processed = 0
+        self.total_titles = len(items)
+        self.progress.emit(0, "")
+        self.pengaya = PengayaUkuran(items, self._ukuran_ditemukan, self.num_workers, self.cache, self.simpan_info)
+        self.pengaya.jalankan()
+        self.pengaya = None
+
+    def _ukuran_ditemukan(self, kunci, judul_asli, ukuran_file, info_unduh=None):
+        kolom = {'ukuran_file': ukuran_file}
+        if info_unduh:
+            kolom['info_unduh'] = info_unduh
+        try:
+            self.jurnal.perbarui(judul_asli, **kolom)
+        except Exception as e:
+            self._log(f"   -> Gagal menyimpan ukuran: {e}", logging.ERROR, judul_asli)
+        self._log(f"   -> Ukuran: {ukuran_file}", item=judul_asli)
+        self.handle_worker_progress(1)
 
     def handle_worker_progress(self, num_processed):
-        self.total_processed += num_processed
-        percentage = int(self.total_processed / self.total_titles * 100) if self.total_titles > 0 else 0
-        self.progress.emit(percentage, "")
-
-    def handle_worker_finished(self, worker_id, results):
-        self.all_results.extend(results)
-        self.workers_finished_count += 1
-        
-        with QMutexLocker(file_mutex):
-            try:
-                with open(self.output_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.all_results, f, indent=4, ensure_ascii=False)
-            except Exception as e:
-                 self.log_message.emit(f"   -> Gagal menyimpan file sementara: {e}")
+        with self._lock_progres:
+            self.total_processed += num_processed
+            percentage = int(self.total_processed / self.total_titles * 100) if self.total_titles > 0 else 0
+            status = self._status_kecepatan(num_processed) if self.pengaya is None else ""
+        self.progress.emit(percentage, status)
 
-        if self.workers_finished_count == len(self.workers):
-            if self.is_running:
-                self.finished.emit(f"Proses pencarian selesai. Hasil disimpan di:\n{self.output_file}")
-            else:
-                self.finished.emit("Proses pencarian dihentikan oleh pengguna.")
+    def _status_kecepatan(self, num_processed, jendela=10):
+        """Level konkurensi saat ini dan kecepatan (judul/detik) dalam jendela waktu terakhir."""
+        sekarang = time.monotonic()
+        self.waktu_selesai.extend([sekarang] * num_processed)
+        while self.waktu_selesai and self.waktu_selesai[0] < sekarang - jendela:
+            self.waktu_selesai.popleft()
+        rentang = max(sekarang - self.waktu_selesai[0], 1.0) if self.waktu_selesai else jendela
+        return f"{self.limiter.status()} | {len(self.waktu_selesai) / rentang:.1f} judul/detik"
+
+    def _log(self, pesan, level=logging.INFO, item=None):
+        catat(log_pencarian, level, pesan, item=item)
 
     def stop(self):
         self.is_running = False
-        self.log_message.emit("Menghentikan semua pekerja...")
+        self._log("Menghentikan semua pekerja...")
         for worker in self.workers:
             worker.stop()
+        if self.pengaya:
+            self.pengaya.stop()
 
 class DownloadWorker(QThread):
-    progress = pyqtSignal(int, str)
+    progress = pyqtSignal(int)
+    item_progress = pyqtSignal(int, str)
     item_finished = pyqtSignal(int, bool)
+    stage_status = pyqtSignal(str)
     finished = pyqtSignal(str)
 
-    def __init__(self, items_to_download, download_mode, output_path, json_file_path):
+    def __init__(self, items_to_download, download_mode, output_path, status_store, num_parallel=1,
+                 pipeline=False, num_konversi=JUMLAH_KONVERSI, format_audio=FORMAT_AUDIO_MP3,
+                 prefetch=JUMLAH_PREFETCH, aksi_arsip=ARSIP_HARDLINK, streaming=False):
         super().__init__()
-        self.items = items_to_download
+        self.items = list(items_to_download)
+        # Mode streaming: item baru masih bisa ditambahkan (tambah_item) sampai akhiri_antrean()
+        self.streaming = streaming
+        self._antrean = queue.Queue()
+        self._antrean_ditutup = threading.Event()
+        self._siap = False
         self.mode = download_mode
+        self.format_audio = format_audio
         self.output_path = output_path
-        self.json_file_path = json_file_path
+        self.status_store = status_store
+        self.num_parallel = max(1, num_parallel)
+        # Mode pipeline: tahap unduh hanya mengambil stream mentah, konversi MP3
+        # dikerjakan tahap terpisah sehingga jaringan tidak menganggur saat ffmpeg bekerja
+        self.pipeline = pipeline and download_mode in ('audio', 'both')
+        self.num_konversi = max(1, num_konversi)
+        self.prefetch = prefetch
+        self.penyelesai = None
+        self.aksi_arsip = aksi_arsip
+        self.arsip = None
+        self._dari_arsip = {}
+        self._jumlah_awal = 0
+        self._berakhir = False
         self.is_running = True
+        self._lokal = threading.local()
+        self._lock = threading.Lock()
+        self._selesai = 0
+        self._antrean_konversi = None
+        self._laju_unduh = None
+        self._laju_konversi = None
 
     def run(self):
-        total_items = len(self.items)
-        if total_items == 0:
+        with self._lock:
+            awal = list(self.items)
+        total_items = len(awal)
+        self._jumlah_awal = total_items
+        if total_items == 0 and not self.streaming:
             self.finished.emit("Tidak ada item yang dipilih untuk diunduh.")
             return
 
-        audio_path = os.path.join(self.output_path, "audio")
-        os.makedirs(audio_path, exist_ok=True)
+        self.audio_path = os.path.join(self.output_path, "audio")
+        os.makedirs(self.audio_path, exist_ok=True)
         os.makedirs(self.output_path, exist_ok=True)
 
-        for i, (row_index, link, filename, judul_asli) in enumerate(self.items):
-            if not self.is_running:
+        # Arsip pustaka: item yang sudah pernah diunduh (di folder mana pun) tidak diunduh lagi
+        try:
+            self.arsip = ArsipUnduhan()
+        except Exception as e:
+            self.arsip = None
+            self._log(f"⚠️ Arsip unduhan tidak bisa dibuka: {e}", logging.WARNING)
+        if self.arsip and self.aksi_arsip != ARSIP_UNDUH_ULANG:
+            for i, (_, link, _, _) in enumerate(awal):
+                file_arsip = self._cari_di_arsip(link)
+                if file_arsip:
+                    self._dari_arsip[i] = file_arsip
+            if self._dari_arsip:
+                self._log(f"📦 {len(self._dari_arsip)} item sudah ada di arsip dan tidak akan diunduh ulang.")
+
+        # Ekstraksi info K item berikutnya di latar belakang; item yang sudah punya
+        # info_unduh yang masih berlaku (atau ada di arsip) tidak perlu diekstraksi
+        perlu_resolusi = [(i, link) for i, (_, link, _, judul_asli) in enumerate(awal)
+                          if i not in self._dari_arsip and not masih_berlaku(self._info_tersimpan(judul_asli))]
+        if self.prefetch > 0 and (perlu_resolusi or self.streaming):
+            self.penyelesai = PenyelesaiAwal(perlu_resolusi, self.prefetch, min(self.num_parallel, self.prefetch),
+                                             terbuka=self.streaming and not self._antrean_ditutup.is_set())
+            self.penyelesai.mulai()
+
+        for i, item in enumerate(awal):
+            self._antrean.put((i, item))
+        # Item yang di-stream selagi persiapan di atas berjalan diantrekan sekarang
+        with self._lock:
+            self._siap = True
+            susulan = self.items[total_items:]
+        for i, item in enumerate(susulan, start=total_items):
+            self._antrekan(i, item)
+        if not self.streaming:
+            self._antrean_ditutup.set()
+
+        threads_konversi = []
+        if self.pipeline:
+            # Antrean terbatas: jika konversi tertinggal, tahap unduh ikut menunggu
+            self._antrean_konversi = queue.Queue(maxsize=self.num_konversi * 2)
+            self._laju_unduh = PengukurTahap("Unduh")
+            self._laju_konversi = PengukurTahap("Konversi")
+            threads_konversi = [threading.Thread(target=self._kerja_konversi, daemon=True,
+                                                 name=f"Konversi-{n + 1}")
+                                for n in range(self.num_konversi if self.streaming else min(self.num_konversi, total_items))]
+            for t in threads_konversi:
+                t.start()
+
+        # Setiap thread mengambil item berikutnya dari antrean bersama
+        threads = [threading.Thread(target=self._kerja, daemon=True, name=f"Unduh-{n + 1}")
+                   for n in range(self.num_parallel if self.streaming else min(self.num_parallel, total_items))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        if self.penyelesai:
+            self.penyelesai.stop()
+
+        if self.pipeline:
+            for _ in threads_konversi:
+                self._antrean_konversi.put(None)
+            for t in threads_konversi:
+                t.join()
+            self._log(f"📊 {self._laju_unduh.ringkasan()} | {self._laju_konversi.ringkasan()}")
+
+        if self.mode in ('audio', 'both'):
+            self._log(f"🖼️ Cache thumbnail: {ambil_cache_thumbnail().statistik()}")
+
+        try:
+            self.status_store.simpan()
+        except Exception as e:
+            self._log(f"   -> Gagal memperbarui file JSON: {e}", logging.ERROR)
+        # Item yang masih di-stream setelah titik ini diabaikan oleh tambah_item()
+        with self._lock:
+            self._berakhir = True
+        if self.arsip:
+            self.arsip.tutup()
+
+        if self.is_running:
+            self.finished.emit("Semua proses unduhan selesai.")
+        else:
+            self.finished.emit("Proses unduhan dihentikan oleh pengguna.")
+
+    def _kerja(self):
+        self._lokal.pekerja = threading.current_thread().name
+        while self.is_running:
+            berikutnya = self._ambil_item()
+            if berikutnya is None:
                 break
-            
-            self.progress.emit(int((i + 1) / total_items * 100), f"Memproses [{i+1}/{total_items}]: {filename}")
-            
+            i, (row_index, link, filename, judul_asli) = berikutnya
+
+            self._lokal.row_index = row_index
+            self._lokal.judul_asli = judul_asli
+            self._log(f"Memproses [{i+1}/{len(self.items)}]: {filename}")
+
+            file_arsip = self._dari_arsip.get(i)
+            if file_arsip is None and i >= self._jumlah_awal and self.arsip and self.aksi_arsip != ARSIP_UNDUH_ULANG:
+                # Item susulan (streaming) diperiksa di sini, bukan di thread GUI saat diantrekan
+                file_arsip = self._cari_di_arsip(link)
+            if file_arsip:
+                if self.penyelesai:
+                    self.penyelesai.lewati(i)
+                self._selesaikan_item(row_index, judul_asli, self._pakai_arsip(file_arsip, filename))
+                continue
+
+            self._lokal.info_awal = self.penyelesai.ambil(i) if self.penyelesai else None
+            self.item_progress.emit(row_index, "⏳ Memulai...")
+
+            if self.pipeline:
+                self._unduh_ke_pipeline(row_index, link, filename, judul_asli)
+                continue
+
             sukses = False
             if self.mode == 'audio':
-                sukses = self._unduh_audio(link, filename, audio_path)
+                sukses = self._unduh_audio(link, filename, self.audio_path)
             elif self.mode == 'video':
                 sukses = self._unduh_video(link, filename, self.output_path)
             elif self.mode == 'both':
-                self.progress.emit(int((i + 1) / total_items * 100), f"   -> Mengunduh Video...")
-                sukses_v = self._unduh_video(link, filename, self.output_path)
-                self.progress.emit(int((i + 1) / total_items * 100), f"   -> Mengunduh Audio...")
-                sukses_a = self._unduh_audio(link, filename, audio_path)
-                sukses = sukses_v or sukses_a
-            
-            if sukses:
-                self._update_json_status(judul_asli)
-            
-            self.item_finished.emit(row_index, sukses)
-        
-        if self.is_running:
-            self.finished.emit("Semua proses unduhan selesai.")
+                sukses = self._unduh_keduanya(link, filename, self.output_path, self.audio_path)
+
+            self._selesaikan_item(row_index, judul_asli, sukses)
+
+        tutup_pool()
+
+    def _ambil_item(self):
+        """Item antrean berikutnya, atau None jika antrean sudah ditutup dan habis (atau dihentikan)."""
+        while self.is_running:
+            try:
+                if self._antrean_ditutup.is_set():
+                    return self._antrean.get_nowait()
+                return self._antrean.get(timeout=0.5)
+            except queue.Empty:
+                if self._antrean_ditutup.is_set():
+                    return None
+        return None
+
+    def tambah_item(self, item):
+        """Mode streaming: menambahkan (row, link, filename, judul_asli) ke antrean yang sedang berjalan."""
+        with self._lock:
+            if self._berakhir or not self.is_running:
+                return  # Pekerja sudah dihentikan atau selesai; arsip mungkin sudah ditutup
+            self.items.append(item)
+            i = len(self.items) - 1
+            if not self._siap:
+                return  # Diantrekan oleh run() setelah arsip dan prefetch siap
+        self._antrekan(i, item)
+
+    def _antrekan(self, i, item):
+        # Hanya mengantrekan; pengecekan arsip dilakukan oleh thread pengunduh (_kerja)
+        _, link, _, judul_asli = item
+        if self.penyelesai and not masih_berlaku(self._info_tersimpan(judul_asli)):
+            self.penyelesai.tambah(i, link)
+        self._antrean.put((i, item))
+
+    def akhiri_antrean(self):
+        """Mode streaming: tidak ada item baru lagi; pekerja berhenti setelah antrean habis."""
+        if self.penyelesai:
+            self.penyelesai.tutup_daftar()
+        self._antrean_ditutup.set()
+
+    def _selesaikan_item(self, row_index, judul_asli, sukses):
+        if sukses:
+            self._update_json_status(judul_asli)
+
+        with self._lock:
+            self._selesai += 1
+            selesai = self._selesai
+        self.progress.emit(int(selesai / len(self.items) * 100))
+        self.item_finished.emit(row_index, sukses)
+
+    def _unduh_ke_pipeline(self, row_index, link, filename, judul_asli):
+        """Tahap unduh mode pipeline: ambil stream mentah lalu serahkan ke antrean konversi."""
+        if self.mode == 'audio':
+            profil, format_, path, simpan_sumber = PROFIL_AUDIO_MENTAH, 'bestaudio/best', self.audio_path, False
         else:
-            self.finished.emit("Proses unduhan dihentikan oleh pengguna.")
+            profil, format_, path, simpan_sumber = PROFIL_KEDUANYA, 'bestvideo+bestaudio/best', self.output_path, True
+
+        self._laju_unduh.masuk()
+        hasil = self._unduh_mentah(link, filename, path, profil, format_)
+        self._laju_unduh.keluar(os.path.getsize(hasil[0]) if hasil else 0, sukses=hasil is not None)
+        self.stage_status.emit(self._status_tahap())
+        if hasil is None:
+            self._selesaikan_item(row_index, judul_asli, False)
+            return
+
+        tugas = (row_index, judul_asli, filename, hasil, simpan_sumber)
+        self.item_progress.emit(row_index, "⏸️ Menunggu konversi...")
+        while self.is_running:
+            try:
+                self._antrean_konversi.put(tugas, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+        self._bersihkan_unduhan(hasil, simpan_sumber)
+        self._selesaikan_item(row_index, judul_asli, False)
+
+    def _kerja_konversi(self):
+        """Tahap konversi mode pipeline: setiap thread menjalankan satu proses ffmpeg."""
+        self._lokal.pekerja = threading.current_thread().name
+        while True:
+            tugas = self._antrean_konversi.get()
+            if tugas is None:
+                break
+            row_index, judul_asli, filename, hasil, simpan_sumber = tugas
+            self._lokal.judul_asli = judul_asli
+            if not self.is_running:
+                self._bersihkan_unduhan(hasil, simpan_sumber)
+                self._selesaikan_item(row_index, judul_asli, False)
+                continue
+
+            self.item_progress.emit(row_index, "🎵 Membuat file audio...")
+            self._laju_konversi.masuk()
+            ukuran_sumber = os.path.getsize(hasil[0]) if os.path.exists(hasil[0]) else 0
+            sukses = self._konversi_audio(hasil, filename, simpan_sumber)
+            self._laju_konversi.keluar(ukuran_sumber, sukses=sukses)
+            self.stage_status.emit(self._status_tahap())
+
+            # Pada mode 'both' video sudah tersimpan, jadi item tetap dianggap berhasil
+            self._selesaikan_item(row_index, judul_asli, sukses or simpan_sumber)
+
+    def _status_tahap(self):
+        return (f"{self._laju_unduh.ringkasan()} | {self._laju_konversi.ringkasan()} | "
+                f"Antrean konversi: {self._antrean_konversi.qsize()}/{self._antrean_konversi.maxsize}")
 
     def _progress_hook(self, d):
+        # Dipanggil dari thread pengunduh; baris tabel diambil dari data lokal thread
+        row_index = getattr(self._lokal, 'row_index', -1)
         if d['status'] == 'downloading':
-            msg = f"\r   -> Progress: {d['_percent_str']} | Ukuran: {d['_total_bytes_str']} | Kecepatan: {d['_speed_str']}"
-            self.progress.emit(-1, msg)
+            msg = f"⬇️ {d['_percent_str'].strip()} | {d['_total_bytes_str'].strip()} | {d['_speed_str'].strip()}"
+            self.item_progress.emit(row_index, msg)
         elif d['status'] == 'finished':
-            self.progress.emit(-1, "")
+            self.item_progress.emit(row_index, "⚙️ Memproses file...")
 
     def _unduh_audio(self, url, nama_file, path):
         ydl_opts = {
             'format': 'bestaudio/best',
-            'postprocessors': [{'key': 'FFmpegExtractAudio', 'preferredcodec': 'mp3', 'preferredquality': '192'},
-                               {'key': 'EmbedThumbnail', 'already_have_thumbnail': False}],
             'outtmpl': os.path.join(path, f'{nama_file}.%(ext)s'),
             'ffmpeg_location': FFMPEG_PATH,
             'progress_hooks': [self._progress_hook],
-            'writethumbnail': True, 'ignoreerrors': True,
+            'ignoreerrors': True,
         }
+        # MP3: encode + sematkan sampul dalam satu proses ffmpeg; asli: hanya remux + tag + sampul
+        if self.format_audio == FORMAT_AUDIO_ASLI:
+            profil, pp = PROFIL_AUDIO_ASLI, AudioAsliPP
+        else:
+            profil, pp = PROFIL_AUDIO, MP3BersampulPP
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
-            self.progress.emit(-1, f"   -> ✅ Audio '{nama_file}.mp3' berhasil diunduh.")
+            ydl = ambil_ydl(profil, ydl_opts, lambda y: y.add_post_processor(pp(y)))
+            atur_outtmpl(ydl, ydl_opts['outtmpl'])
+            info = self._ekstrak_dan_unduh(ydl, url)
+            # ignoreerrors: ekstraksi/unduhan yang gagal tidak melempar exception, cek file hasilnya
+            if not file_hasil(info):
+                self._log(f"   -> ❌ Gagal mengunduh audio '{nama_file}'.", logging.ERROR)
+                return False
+            self._catat_arsip(info, self._mode_audio())
+            self._log(f"   -> ✅ Audio '{nama_file}' berhasil diunduh.")
             return True
         except Exception as e:
-            self.progress.emit(-1, f"\n   -> ❌ Error saat mengunduh audio: {e}")
+            buang_ydl(profil)
+            self._log(f"   -> ❌ Error saat mengunduh audio: {e}", logging.ERROR)
             return False
 
     def _unduh_video(self, url, nama_file, path):
@@ -288,80 +652,293 @@ class DownloadWorker(QThread):
             'ignoreerrors': True,
         }
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
-            self.progress.emit(-1, f"   -> ✅ Video '{nama_file}' berhasil diunduh.")
+            ydl = ambil_ydl(PROFIL_VIDEO, ydl_opts)
+            atur_outtmpl(ydl, ydl_opts['outtmpl'])
+            info = self._ekstrak_dan_unduh(ydl, url)
+            if not file_hasil(info):
+                self._log(f"   -> ❌ Gagal mengunduh video '{nama_file}'.", logging.ERROR)
+                return False
+            self._catat_arsip(info, 'video')
+            self._log(f"   -> ✅ Video '{nama_file}' berhasil diunduh.")
             return True
         except Exception as e:
-            self.progress.emit(-1, f"\n   -> ❌ Error saat mengunduh video: {e}")
+            buang_ydl(PROFIL_VIDEO)
+            self._log(f"   -> ❌ Error saat mengunduh video: {e}", logging.ERROR)
             return False
             
-    def _update_json_status(self, judul_asli_to_update):
+    def _unduh_keduanya(self, url, nama_file, path_video, path_audio):
+        """Mode 'both': unduh video sekali, lalu buat MP3 secara lokal dari stream audionya."""
+        hasil = self._unduh_mentah(url, nama_file, path_video, PROFIL_KEDUANYA, 'bestvideo+bestaudio/best')
+        if hasil is None:
+            return False
+        self.item_progress.emit(getattr(self._lokal, 'row_index', -1), "🎵 Membuat audio dari video...")
+        self._konversi_audio(hasil, nama_file, simpan_sumber=True)
+        return True
+
+    def _unduh_mentah(self, url, nama_file, path, profil, format_):
+        """
+        Mengunduh stream tanpa konversi. Mengembalikan (file, salinan sementara
+        sampul dari cache thumbnail, acodec, metadata, video_id) atau None jika gagal.
+        """
+        ydl_opts = {
+            'format': format_,
+            'outtmpl': os.path.join(path, f'{nama_file}.%(ext)s'),
+            'ffmpeg_location': FFMPEG_PATH,
+            'progress_hooks': [self._progress_hook],
+            'ignoreerrors': True,
+        }
         try:
-            with open(self.json_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            item_found = False
-            for item in data:
-                if item.get('judul_asli') == judul_asli_to_update:
-                    item['download'] = True
-                    item_found = True
-                    break
-            
-            if item_found:
-                with open(self.json_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4, ensure_ascii=False)
-                self.progress.emit(-1, f"   -> Status 'download: true' untuk '{judul_asli_to_update}' disimpan.")
+            ydl = ambil_ydl(profil, ydl_opts)
+            atur_outtmpl(ydl, ydl_opts['outtmpl'])
+            info = self._ekstrak_dan_unduh(ydl, url)
         except Exception as e:
-            self.progress.emit(-1, f"   -> Gagal memperbarui file JSON: {e}")
+            buang_ydl(profil)
+            self._log(f"   -> ❌ Error saat mengunduh: {e}", logging.ERROR)
+            return None
+
+        file_unduhan = file_hasil(info)
+        if not file_unduhan:
+            self._log(f"   -> ❌ Gagal mengunduh '{nama_file}'.", logging.ERROR)
+            return None
+        if profil == PROFIL_KEDUANYA:
+            self._catat_arsip(info, 'video')
+            self._log(f"   -> ✅ Video '{nama_file}' berhasil diunduh.")
+        return file_unduhan, sampul_untuk_info(info), info.get('acodec'), metadata_dari_info(info), info.get('id')
+
+    def _konversi_audio(self, hasil_unduhan, nama_file, simpan_sumber):
+        """Membuat file audio bersampul sesuai format_audio; sumber dihapus kecuali simpan_sumber."""
+        sumber, sampul, acodec, metadata, video_id = hasil_unduhan
+        hasil = None
+        try:
+            hasil = buat_audio(sumber, os.path.join(self.audio_path, nama_file), self.format_audio,
+                               acodec, sampul, metadata=metadata)
+            self._catat_arsip({'id': video_id}, self._mode_audio(), hasil)
+            if simpan_sumber:
+                self._log(f"   -> ✅ Audio '{os.path.basename(hasil)}' dibuat dari video (tanpa unduh ulang).")
+            else:
+                self._log(f"   -> ✅ Audio '{os.path.basename(hasil)}' berhasil dibuat.")
+            return True
+        except Exception as e:
+            self._log(f"   -> ❌ Error saat membuat audio: {e}", logging.ERROR)
+            return False
+        finally:
+            self._bersihkan_unduhan(hasil_unduhan, simpan_sumber, hasil)
+
+    @staticmethod
+    def _bersihkan_unduhan(hasil_unduhan, simpan_sumber, hasil=None):
+        """
+        Menghapus file sementara dari _unduh_mentah(): stream mentah (kecuali
+        simpan_sumber) dan salinan sampul. Pada format asli file hasil bisa sama
+        dengan sumber (mis. .m4a), jadi tidak ikut terhapus.
+        """
+        sumber, sampul = hasil_unduhan[:2]
+        if not simpan_sumber and sumber != hasil and os.path.exists(sumber):
+            os.remove(sumber)
+        if sampul and os.path.exists(sampul):
+            os.remove(sampul)
+
+    def _ekstrak_dan_unduh(self, ydl, url):
+        """
+        Mengunduh memakai info format dari tahap pencarian (info_unduh) selama URL
+        stream-nya masih berlaku, sehingga satu ekstraksi per lagu terlewati.
+        Selain itu memakai info hasil PenyelesaiAwal jika sudah siap. Jika tidak
+        ada, sudah kedaluwarsa, atau gagal, ekstraksi ulang seperti biasa.
+        """
+        rekaman = self._info_tersimpan(getattr(self._lokal, 'judul_asli', None))
+        if masih_berlaku(rekaman):
+            info_siap, pesan = info_untuk_unduh(rekaman), "   -> ⚡ Memakai info format tersimpan (tanpa ekstraksi ulang)."
+        else:
+            info_siap, pesan = getattr(self._lokal, 'info_awal', None), "   -> ⚡ Info sudah diekstraksi di latar belakang."
+        self._lokal.info_awal = None
+
+        if info_siap:
+            try:
+                info = ydl.process_ie_result(info_siap, download=True)
+                if file_hasil(info):
+                    self._log(pesan)
+                    return info
+            except Exception:
+                pass  # Kembali ke ekstraksi ulang
+        return ydl.extract_info(url, download=True)
+
+    def _mode_audio(self):
+        # MP3 dan audio asli adalah file yang berbeda, jadi dicatat terpisah di arsip
+        return f'audio_{self.format_audio}'
+
+    def _cari_di_arsip(self, link):
+        """Daftar (file_arsip, folder_tujuan) jika semua keluaran mode ini sudah ada di arsip, selain itu None."""
+        video_id = ambil_video_id(link)
+        keluaran = []
+        if self.mode in ('video', 'both'):
+            keluaran.append(('video', self.output_path))
+        if self.mode in ('audio', 'both'):
+            keluaran.append((self._mode_audio(), self.audio_path))
+
+        hasil = []
+        for mode, folder in keluaran:
+            file_arsip = self.arsip.cari(video_id, mode)
+            if not file_arsip:
+                return None
+            hasil.append((file_arsip, folder))
+        return hasil
+
+    def _pakai_arsip(self, file_arsip, nama_file):
+        """Menempatkan file dari arsip ke folder tujuan (hardlink atau salin) alih-alih mengunduh."""
+        try:
+            for sumber, folder in file_arsip:
+                tujuan = self.arsip.pakai(sumber, folder, nama_file, self.aksi_arsip)
+                if os.path.abspath(tujuan) == os.path.abspath(sumber):
+                    self._log(f"   -> 📦 '{os.path.basename(tujuan)}' sudah ada di folder ini.")
+                else:
+                    cara = "ditautkan" if self.aksi_arsip == ARSIP_HARDLINK else "disalin"
+                    self._log(f"   -> 📦 '{os.path.basename(tujuan)}' {cara} dari arsip: {sumber}")
+            return True
+        except Exception as e:
+            self._log(f"   -> ❌ Gagal memakai file dari arsip: {e}", logging.ERROR)
+            return False
+
+    def _catat_arsip(self, info, mode, path=None):
+        if not self.arsip or not info:
+            return
+        try:
+            self.arsip.catat(info.get('id'), mode, path or file_hasil(info))
+        except Exception:
+            pass  # Arsip hanya pelengkap; unduhan tetap dianggap berhasil
+
+    def _info_tersimpan(self, judul_asli):
+        item = self.status_store.cari(judul_asli) if judul_asli else None
+        return item.get('info_unduh') if item else None
+
+    def _update_json_status(self, judul_asli_to_update):
+        # Hanya memperbarui indeks di memori; penulisan ke disk dikumpulkan oleh PenyimpanStatus
+        if self.status_store.perbarui(judul_asli_to_update, download=True):
+            self._log(f"   -> Status 'download: true' untuk '{judul_asli_to_update}' dicatat.")
+
+    def _log(self, pesan, level=logging.INFO):
+        # Pekerja dan item diambil dari data lokal thread yang sedang memproses item
+        catat(log_unduhan, level, pesan, getattr(self._lokal, 'pekerja', PEKERJA_UTAMA),
+              getattr(self._lokal, 'judul_asli', None))
 
     def stop(self):
         self.is_running = False
+        if self.penyelesai:
+            self.penyelesai.stop()
+
+class SizeWorker(QThread):
+    """Tahap kedua pencarian untuk tab Pengunduh: mengisi ukuran file baris yang belum punya ukuran."""
+    size_found = pyqtSignal(int, str)
+    finished = pyqtSignal(int)
+
+    def __init__(self, items, status_store, num_workers=JUMLAH_PENGISI_UKURAN, simpan_info=False):
+        super().__init__()
+        # items: list of (row_index, judul_asli, link)
+        self.status_store = status_store
+        self.pengaya = PengayaUkuran(items, self._ukuran_ditemukan, num_workers, simpan_info=simpan_info)
+        self._jumlah = 0
+
+    def run(self):
+        try:
+            self.pengaya.cache = SearchCache()
+        except Exception:
+            self.pengaya.cache = None
+
+        self.pengaya.jalankan()
+        try:
+            self.status_store.simpan()
+        except Exception:
+            pass  # Ukuran hanya pelengkap; akan dicoba lagi saat file dibuka berikutnya
+
+        if self.pengaya.cache:
+            self.pengaya.cache.tutup()
+        self.finished.emit(self._jumlah)
+
+    def _ukuran_ditemukan(self, row_index, judul_asli, ukuran_file, info_unduh=None):
+        if info_unduh:
+            self.status_store.perbarui(judul_asli, ukuran_file=ukuran_file, info_unduh=info_unduh)
+        else:
+            self.status_store.perbarui(judul_asli, ukuran_file=ukuran_file)
+        self._jumlah += 1
+        self.size_found.emit(row_index, ukuran_file)
+
+    def prioritaskan(self, row_indexes):
+        self.pengaya.prioritaskan(row_indexes)
+
+    def stop(self):
+        self.pengaya.stop()
 
 class ThumbnailWorker(QThread):
-    finished = pyqtSignal(str, QPixmap)
+    finished = pyqtSignal(str, QImage)
 
     def __init__(self, url):
         super().__init__()
         self.url = url
 
     def run(self):
-        match = re.search(r'(?:v=|\/|be\/|embed\/|shorts\/)([0-9A-Za-z_-]{11})', self.url)
-        video_id = match.group(1) if match else None
-
+        video_id = ambil_video_id(self.url)
         if not video_id:
-            self.finished.emit("ID video tidak valid dari URL.", QPixmap())
+            self.finished.emit("ID video tidak valid dari URL.", QImage())
             return
-            
-        qualities = ['maxresdefault.jpg', 'sddefault.jpg', 'hqdefault.jpg', 'mqdefault.jpg']
-        image_data = None
-        for quality in qualities:
-            try:
-                thumbnail_url = f"https.img.youtube.com/vi/{video_id}/{quality}"
-                response = requests.get(thumbnail_url, timeout=5)
-                if response.status_code == 200 and 'image' in response.headers.get('Content-Type', ''):
-                    image_data = response.content
-                    break
-            except requests.exceptions.RequestException:
-                continue
 
-        if not image_data:
-            self.finished.emit("Gagal memuat gambar thumbnail.", QPixmap())
+        # Gambar dan judul diambil bersamaan lewat cache thumbnail bersama (juga dipakai sampul unduhan)
+        gambar, video_title = ambil_cache_gambar().pratinjau_youtube(video_id)
+        if gambar.isNull():
+            self.finished.emit("Gagal memuat gambar thumbnail.", QImage())
             return
-        
-        pixmap = QPixmap()
-        pixmap.loadFromData(image_data)
+        self.finished.emit(video_title or "Gagal mengambil judul video", gambar)
 
-        video_title = "Gagal mengambil judul video"
-        try:
-            info_url = f"https.www.youtube.com/oembed?url=http://www.youtube.com/watch?v={video_id}&format=json"
-            info_resp = requests.get(info_url, timeout=5)
-            if info_resp.status_code == 200:
-                video_title = info_resp.json().get('title', 'Judul tidak ditemukan')
-        except requests.exceptions.RequestException:
-            pass
-        
-        self.finished.emit(video_title, pixmap)
+class GaleriWorker(QThread):
+    """
+    Memuat sampul untuk galeri thumbnail. Hanya sel yang sedang terlihat yang
+    diambil (lihat atur_terlihat), paling banyak num_workers sekaligus. File
+    dari cache thumbnail langsung di-decode pada ukuran tampil lewat
+    QImageReader, sehingga thread GUI hanya menerima QImage kecil yang siap pakai.
+    """
+    gambar_siap = pyqtSignal(int, QImage)
+
+    def __init__(self, ukuran, num_workers=JUMLAH_PEMUAT_GALERI):
+        super().__init__()
+        self.ukuran = ukuran
+        self.num_workers = max(1, num_workers)
+        self.is_running = True
+        self._kondisi = threading.Condition()
+        self._antrean = []  # [(row, video_id)], sel terlihat yang belum diambil
+
+    def atur_terlihat(self, sel):
+        """Mengganti antrean dengan sel yang sedang terlihat; sel yang sudah tergulir lewat dibuang."""
+        with self._kondisi:
+            self._antrean = list(reversed(sel))
+            self._kondisi.notify_all()
+
+    def run(self):
+        threads = [threading.Thread(target=self._kerja, name=f"Galeri-{i + 1}", daemon=True)
+                   for i in range(self.num_workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def _kerja(self):
+        cache = ambil_cache_thumbnail()
+        while True:
+            with self._kondisi:
+                while self.is_running and not self._antrean:
+                    self._kondisi.wait()
+                if not self.is_running:
+                    return
+                row, video_id = self._antrean.pop()
+            path = cache.ambil_file(kunci_youtube(video_id, KUALITAS_GALERI), url_youtube(video_id, KUALITAS_GALERI))
+            if not path:
+                continue
+            reader = QImageReader(path)
+            reader.setScaledSize(reader.size().scaled(self.ukuran, Qt.AspectRatioMode.KeepAspectRatio))
+            gambar = reader.read()
+            if not gambar.isNull() and self.is_running:
+                self.gambar_siap.emit(row, gambar)
+
+    def stop(self):
+        with self._kondisi:
+            self.is_running = False
+            self._kondisi.notify_all()
 
 class SpotifyWorker(QThread):
     tracks_finished = pyqtSignal(list)
@@ -379,16 +956,11 @@ class SpotifyWorker(QThread):
 
     def run(self):
         try:
-            auth_manager = SpotifyClientCredentials(client_id=self.client_id, client_secret=self.client_secret)
-            sp = spotipy.Spotify(auth_manager=auth_manager)
+            # Klien bersama: token dan koneksi dipakai ulang selama kredensial sama
+            sp = ambil_klien_spotify(self.client_id, self.client_secret)
 
             if self.task_type == 'playlist_tracks':
-                results = sp.playlist_tracks(self.query)
-                tracks_raw = results['items']
-                
-                while results['next']:
-                    results = sp.next(results)
-                    tracks_raw.extend(results['items'])
+                tracks_raw = ambil_lagu_playlist(sp, self.query)
 
                 track_list = []
                 for item in tracks_raw:
@@ -397,7 +969,7 @@ class SpotifyWorker(QThread):
                         track_list.append({
                             'name': track.get('name', 'N/A'),
                             'artist': track['artists'][0].get('name', 'N/A'),
-                            'album': track.get('album', {}).get('name', 'N/A')
+                            'album': (track.get('album') or {}).get('name', 'N/A')
                         })
                 self.tracks_finished.emit(track_list)
 
@@ -414,7 +986,7 @@ class SpotifyWorker(QThread):
                 
                 for page in range(self.num_pages):
                     offset = page * self.limit
-                    results = sp.search(q=self.query, type=search_type_api, limit=self.limit, offset=offset)
+                    results = panggil_api(sp.search, q=self.query, type=search_type_api, limit=self.limit, offset=offset)
                     
                     if search_type_api == 'playlist':
                         items = results.get('playlists', {}).get('items', [])
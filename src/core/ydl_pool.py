@@ -0,0 +1,76 @@
+import os
+import threading
+import yt_dlp
+
+# Profil opsi YoutubeDL. Satu profil = satu set opsi yang tidak berubah antar item.
+PROFIL_CARI_CEPAT = 'cari_cepat'      # ytsearch dengan extract_flat
+PROFIL_CARI_LENGKAP = 'cari_lengkap'  # ytsearch dengan daftar format lengkap
+PROFIL_AUDIO = 'audio'
+PROFIL_AUDIO_ASLI = 'audio_asli'      # bestaudio, codec asli tanpa encode
+PROFIL_AUDIO_MENTAH = 'audio_mentah'  # bestaudio tanpa postprocessor (mode pipeline)
+PROFIL_VIDEO = 'video'
+PROFIL_KEDUANYA = 'keduanya'          # video, MP3 dibuat lokal
+
+_lokal = threading.local()
+
+
+def ambil_ydl(profil, opsi, siapkan=None):
+    """
+    Mengembalikan YoutubeDL milik thread ini untuk profil tertentu. Instance
+    dibuat sekali lalu dipakai ulang, sehingga extractor, opener HTTP, cookie
+    jar, dan koneksi keep-alive tidak dibuat ulang untuk setiap item.
+    `opsi` dan `siapkan(ydl)` (mis. menambah postprocessor) hanya dipakai saat
+    instance pertama kali dibuat.
+    """
+    pool = getattr(_lokal, 'pool', None)
+    if pool is None:
+        pool = _lokal.pool = {}
+    ydl = pool.get(profil)
+    if ydl is None:
+        # Salinan: YoutubeDL menormalkan dict opsi di tempat (mis. outtmpl menjadi dict)
+        ydl = yt_dlp.YoutubeDL(dict(opsi))
+        if siapkan is not None:
+            siapkan(ydl)
+        pool[profil] = ydl
+    return ydl
+
+
+def atur_outtmpl(ydl, outtmpl):
+    """Mengganti template nama file output pada instance yang dipakai ulang."""
+    ydl.params['outtmpl']['default'] = outtmpl
+
+
+def file_hasil(info):
+    """Path file akhir dari info hasil extract_info(download=True), atau None."""
+    if not info:
+        return None
+    for unduhan in reversed(info.get('requested_downloads') or []):
+        if unduhan.get('filepath') and os.path.exists(unduhan['filepath']):
+            return unduhan['filepath']
+    return None
+
+
+def file_thumbnail(info):
+    """Path thumbnail yang ditulis oleh opsi writethumbnail, atau None."""
+    for thumbnail in reversed((info or {}).get('thumbnails') or []):
+        if thumbnail.get('filepath') and os.path.exists(thumbnail['filepath']):
+            return thumbnail['filepath']
+    return None
+
+
+def buang_ydl(profil):
+    """Menutup dan membuang instance profil ini (mis. setelah error yang merusak state)."""
+    pool = getattr(_lokal, 'pool', None) or {}
+    ydl = pool.pop(profil, None)
+    if ydl is not None:
+        try:
+            ydl.close()
+        except Exception:
+            pass
+
+
+def tutup_pool():
+    """Menutup semua YoutubeDL milik thread ini. Panggil saat thread pekerja selesai."""
+    pool = getattr(_lokal, 'pool', None) or {}
+    for profil in list(pool):
+        buang_ydl(profil)
@@ -0,0 +1,63 @@
+import collections
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PyQt6.QtGui import QPixmap, QColor
+
+from config import MAKS_GAMBAR_GALERI
+from core.arsip_unduhan import ambil_video_id
+
+
+class ModelGaleri(QAbstractListModel):
+    """
+    Model galeri thumbnail di atas file hasil pencarian. Sampul disimpan
+    sebagai QPixmap seukuran sel dalam LRU berbatas (MAKS_GAMBAR_GALERI),
+    sel lain memakai satu gambar pengganti, sehingga memori tetap kecil
+    berapa pun jumlah item.
+    """
+
+    def __init__(self, ukuran, parent=None):
+        super().__init__(parent)
+        self.ukuran = ukuran
+        self.judul = []
+        self.link = []
+        self.video_id = []
+        self._gambar = collections.OrderedDict()  # row -> QPixmap
+        self._pengganti = QPixmap(ukuran)
+        self._pengganti.fill(QColor(128, 128, 128, 60))
+
+    def muat(self, data):
+        self.beginResetModel()
+        self.judul = [item.get("judul_video") or item.get("judul_asli", "") for item in data]
+        self.link = [item.get("link_youtube", "") for item in data]
+        self.video_id = [ambil_video_id(link) for link in self.link]
+        self._gambar.clear()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.judul)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self.judul[row]
+        if role == Qt.ItemDataRole.DecorationRole:
+            gambar = self._gambar.get(row)
+            if gambar is None:
+                return self._pengganti
+            self._gambar.move_to_end(row)
+            return gambar
+        return None
+
+    def belum_bergambar(self, rows):
+        """(row, video_id) dari baris yang punya video_id tetapi sampulnya belum ada di memori."""
+        return [(row, self.video_id[row]) for row in rows if self.video_id[row] and row not in self._gambar]
+
+    def atur_gambar(self, row, gambar):
+        """Menyimpan sampul (QImage yang sudah seukuran sel) untuk satu baris."""
+        if row >= len(self.judul):
+            return
+        self._gambar[row] = QPixmap.fromImage(gambar)
+        self._gambar.move_to_end(row)
+        while len(self._gambar) > MAKS_GAMBAR_GALERI:
+            self._gambar.popitem(last=False)
+        indeks = self.index(row)
+        self.dataChanged.emit(indeks, indeks, [Qt.ItemDataRole.DecorationRole])
@@ -0,0 +1,158 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor, QBrush
+
+from core.pilih_ukuran import KolomUkuran
+
+KOLOM_PILIH, KOLOM_JUDUL_ASLI, KOLOM_JUDUL_VIDEO, KOLOM_UKURAN, KOLOM_STATUS, KOLOM_URL = range(6)
+JUDUL_KOLOM = ["", "Judul Asli", "Judul Video YouTube", "Ukuran", "Status", "URL"]
+
+_HIJAU = QBrush(QColor(204, 255, 204))
+
+
+class ModelUnduhan(QAbstractTableModel):
+    """
+    Model tabel Pengunduh di atas penyimpanan baris yang ringkas: satu list
+    per kolom teks dan bytearray untuk centang dan warna status. Tampilan
+    hanya meminta data baris yang terlihat, sehingga file hasil berisi
+    ratusan ribu baris tetap bisa dimuat dan digulir tanpa macet.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._kosongkan()
+
+    def _kosongkan(self):
+        self.judul_asli = []
+        self.judul_video = []
+        self.ukuran = []
+        self.status = []
+        self.link = []
+        self._centang = bytearray()
+        self._hijau = bytearray()
+        self.kolom_ukuran = KolomUkuran()
+
+    def muat(self, data):
+        """Mengganti seluruh isi model dengan daftar hasil pencarian (list of dict)."""
+        self.beginResetModel()
+        self._kosongkan()
+        for item in data:
+            self._tambah_baris(item)
+        self.endResetModel()
+
+    def tambah(self, item):
+        """Menambahkan satu baris di akhir tabel (mode streaming). Mengembalikan nomor barisnya."""
+        row = len(self.link)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._tambah_baris(item)
+        self.endInsertRows()
+        return row
+
+    def ganti(self, row, item):
+        """Mengganti isi satu baris (hasil pencarian ulang untuk judul yang sama)."""
+        sudah = bool(item.get("download", False))
+        self.judul_asli[row] = item.get("judul_asli", "")
+        self.judul_video[row] = item.get("judul_video", "")
+        self.ukuran[row] = item.get("ukuran_file", "N/A")
+        self.status[row] = "Sudah diunduh" if sudah else "Belum diunduh"
+        self.link[row] = item.get("link_youtube", "")
+        self._hijau[row] = sudah
+        self.kolom_ukuran.perbarui(row, self.ukuran[row])
+        self._ubah_rentang([row], KOLOM_PILIH, len(JUDUL_KOLOM) - 1, [])
+
+    def _tambah_baris(self, item):
+        sudah = bool(item.get("download", False))
+        self.judul_asli.append(item.get("judul_asli", ""))
+        self.judul_video.append(item.get("judul_video", ""))
+        self.ukuran.append(item.get("ukuran_file", "N/A"))
+        self.status.append("Sudah diunduh" if sudah else "Belum diunduh")
+        self.link.append(item.get("link_youtube", ""))
+        self._hijau.append(sudah)
+        self._centang.append(0)
+        # Ukuran diurai sekali di sini agar pemilihan cerdas tidak mengurai teks di setiap klik
+        self.kolom_ukuran.tambah(self.ukuran[-1])
+
+    # --- Antarmuka QAbstractTableModel ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.link)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(JUDUL_KOLOM)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return JUDUL_KOLOM[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row, kolom = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if kolom == KOLOM_JUDUL_ASLI:
+                return self.judul_asli[row]
+            if kolom == KOLOM_JUDUL_VIDEO:
+                return self.judul_video[row]
+            if kolom == KOLOM_UKURAN:
+                return self.ukuran[row]
+            if kolom == KOLOM_STATUS:
+                return self.status[row]
+            if kolom == KOLOM_URL:
+                return self.link[row]
+        elif role == Qt.ItemDataRole.CheckStateRole and kolom == KOLOM_PILIH:
+            return Qt.CheckState.Checked if self._centang[row] else Qt.CheckState.Unchecked
+        elif role == Qt.ItemDataRole.BackgroundRole and self._hijau[row]:
+            return _HIJAU
+        return None
+
+    def flags(self, index):
+        if index.column() == KOLOM_PILIH:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.CheckStateRole or index.column() != KOLOM_PILIH:
+            return False
+        self._centang[index.row()] = 1 if Qt.CheckState(value) == Qt.CheckState.Checked else 0
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    # --- Operasi massal ---
+
+    def _ubah_rentang(self, baris, kolom_awal, kolom_akhir, roles):
+        """Satu sinyal dataChanged untuk rentang baris yang berubah."""
+        if baris:
+            self.dataChanged.emit(self.index(min(baris), kolom_awal), self.index(max(baris), kolom_akhir), roles)
+
+    def atur_semua_centang(self, dicentang):
+        self._centang[:] = (b'\x01' if dicentang else b'\x00') * len(self._centang)
+        self._ubah_rentang(range(len(self._centang)), KOLOM_PILIH, KOLOM_PILIH, [Qt.ItemDataRole.CheckStateRole])
+
+    def atur_centang(self, centang):
+        """Mengganti centang semua baris sekaligus (bytearray 0/1 sepanjang jumlah baris, lihat KolomUkuran)."""
+        self._centang[:] = centang
+        self._ubah_rentang(range(len(self._centang)), KOLOM_PILIH, KOLOM_PILIH, [Qt.ItemDataRole.CheckStateRole])
+
+    def baris_dicentang(self):
+        return [row for row, c in enumerate(self._centang) if c]
+
+    def total_mb_dicentang(self):
+        return self.kolom_ukuran.total(self._centang)
+
+    def atur_ukuran(self, row, teks):
+        self.ukuran[row] = teks
+        self.kolom_ukuran.perbarui(row, teks)
+        indeks = self.index(row, KOLOM_UKURAN)
+        self.dataChanged.emit(indeks, indeks, [Qt.ItemDataRole.DisplayRole])
+
+    def atur_status(self, status_per_baris):
+        for row, teks in status_per_baris.items():
+            self.status[row] = teks
+        self._ubah_rentang(status_per_baris.keys(), KOLOM_STATUS, KOLOM_STATUS, [Qt.ItemDataRole.DisplayRole])
+
+    def tandai_selesai(self, hasil_per_baris):
+        """Baris selesai diunduh: status berhasil/gagal, centang dilepas, baris berhasil diwarnai hijau."""
+        for row, sukses in hasil_per_baris.items():
+            self.status[row] = "✅ Berhasil" if sukses else "❌ Gagal"
+            self._centang[row] = 0
+            if sukses:
+                self._hijau[row] = 1
+        self._ubah_rentang(hasil_per_baris.keys(), KOLOM_PILIH, len(JUDUL_KOLOM) - 1, [])
@@ -0,0 +1,78 @@
+import threading
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+from config import FPS_PEMBARUAN_UI
+
+
+class PengumpulPembaruan(QObject):
+    """
+    Menampung pembaruan dari thread pekerja (progres, status per baris, dan
+    baris selesai) lalu menyalurkannya ke tampilan paling banyak
+    FPS_PEMBARUAN_UI kali per detik. Untuk tiap baris hanya status terakhir
+    yang ditampilkan. Slot terima_* aman dipanggil dari thread mana pun.
+    """
+    progres = pyqtSignal(int)
+    status = pyqtSignal(str)
+    status_baris = pyqtSignal(dict)    # {row: pesan terakhir}
+    baris_selesai = pyqtSignal(dict)   # {row: sukses}
+
+    def __init__(self, fps=FPS_PEMBARUAN_UI, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._kosongkan()
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(1, 1000 // fps))
+        self._timer.timeout.connect(self.salurkan)
+
+    def _kosongkan(self):
+        self._nilai = None
+        self._status = None
+        self._status_baris = {}
+        self._baris_selesai = {}
+
+    @staticmethod
+    def hubungkan(sinyal, slot):
+        """Sinyal pekerja langsung memanggil slot terima_* di thread pengirim, tanpa antrean event GUI."""
+        sinyal.connect(slot, Qt.ConnectionType.DirectConnection)
+
+    def mulai(self):
+        self._timer.start()
+
+    def berhenti(self):
+        """Menghentikan timer setelah menyalurkan sisa pembaruan yang masih tertampung."""
+        self._timer.stop()
+        self.salurkan()
+
+    def terima_progres(self, nilai):
+        """Format sinyal progress DownloadWorker: persentase saja."""
+        with self._lock:
+            self._nilai = nilai
+
+    def terima_progres_status(self, nilai, status):
+        """Format sinyal progress SearchManager: persentase + teks status (bukan log)."""
+        with self._lock:
+            self._nilai = nilai
+            self._status = status
+
+    def terima_status_baris(self, row, pesan):
+        with self._lock:
+            self._status_baris[row] = pesan
+
+    def terima_baris_selesai(self, row, sukses):
+        with self._lock:
+            self._status_baris.pop(row, None)
+            self._baris_selesai[row] = sukses
+
+    def salurkan(self):
+        with self._lock:
+            nilai, status = self._nilai, self._status
+            status_baris, baris_selesai = self._status_baris, self._baris_selesai
+            self._kosongkan()
+        if nilai is not None:
+            self.progres.emit(nilai)
+        if status is not None:
+            self.status.emit(status)
+        if status_baris:
+            self.status_baris.emit(status_baris)
+        if baris_selesai:
+            self.baris_selesai.emit(baris_selesai)
@@ -1,25 +1,44 @@
 import os
-import json
 import re
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QLabel,
-    QTextEdit, QProgressBar, QTableWidget, QTableWidgetItem, QHeaderView,
+    QProgressBar, QTableView, QHeaderView,
     QRadioButton, QButtonGroup, QFileDialog, QGroupBox, QSpacerItem, 
-    QSizePolicy, QCheckBox, QComboBox
+    QSizePolicy, QCheckBox, QComboBox, QSpinBox
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QBrush, QIcon
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QIcon
 
 # Import worker dan konfigurasi
-from core.workers import DownloadWorker
-from config import FOLDER_HASIL_JSON, FOLDER_DOWNLOAD_UTAMA
+from core.workers import DownloadWorker, SizeWorker
+from gui.pengumpul_pembaruan import PengumpulPembaruan
+from gui.tampilan_log import TampilanLog
+from gui.model_unduhan import (
+    ModelUnduhan, KOLOM_PILIH, KOLOM_JUDUL_ASLI, KOLOM_JUDUL_VIDEO, KOLOM_UKURAN, KOLOM_STATUS, KOLOM_URL
+)
+from core.log_terstruktur import ambil_logger
+from core.size_enricher import perlu_ukuran
+from core.status_store import PenyimpanStatus
+from core.transcode import FORMAT_AUDIO_MP3, FORMAT_AUDIO_ASLI
+from core.arsip_unduhan import ARSIP_HARDLINK, ARSIP_SALIN, ARSIP_UNDUH_ULANG
+from config import FOLDER_HASIL_JSON, FOLDER_DOWNLOAD_UTAMA, JUMLAH_KONVERSI
 
 class DownloadTab(QWidget):
+    # Aturan pemilihan cerdas berdasarkan ukuran file
+    PILIH_MAKSIMAL = 'maksimal'
+    PILIH_MINIMAL = 'minimal'
+    PILIH_RENTANG = 'rentang'
+    PILIH_TERBESAR = 'terbesar'
+    PILIH_ANGGARAN = 'anggaran'
+
     def __init__(self):
         super().__init__()
         self.init_ui()
         self.download_worker = None
+        self.size_worker = None
+        self.status_store = None
         self.current_json_path = ""
+        self.streaming_aktif = False
 
     def init_ui(self):
         main_layout = QHBoxLayout(self)
@@ -35,13 +54,24 @@ class DownloadTab(QWidget):
         self.select_all_checkbox = QCheckBox("Pilih / Batal Pilih Semua")
         self.select_all_checkbox.clicked.connect(self.toggle_select_all)
         
-        self.filter_label = QLabel("Kecualikan jika ukuran file:")
+        self.filter_label = QLabel("Pilih berdasarkan ukuran:")
         self.filter_combo = QComboBox()
-        self.filter_combo.addItems(["> (Lebih besar dari)", "< (Lebih kecil dari)"])
-        
+        self.filter_combo.addItem("≤ (Maksimal)", (self.PILIH_MAKSIMAL, "Ukuran (MB)"))
+        self.filter_combo.addItem("≥ (Minimal)", (self.PILIH_MINIMAL, "Ukuran (MB)"))
+        self.filter_combo.addItem("Rentang", (self.PILIH_RENTANG, "Min-Maks (MB)"))
+        self.filter_combo.addItem("K Terbesar", (self.PILIH_TERBESAR, "Jumlah lagu"))
+        self.filter_combo.addItem("Muat dalam Anggaran", (self.PILIH_ANGGARAN, "Total (GB)"))
+        self.filter_combo.currentIndexChanged.connect(
+            lambda: self.size_input.setPlaceholderText(self.filter_combo.currentData()[1]))
+
         self.size_input = QLineEdit()
         self.size_input.setPlaceholderText("Ukuran (MB)")
-        self.size_input.setFixedWidth(80)
+        self.size_input.setFixedWidth(100)
+        self.size_input.returnPressed.connect(self.apply_smart_selection)
+
+        self.approx_checkbox = QCheckBox("Termasuk perkiraan (~)")
+        self.approx_checkbox.setChecked(True)
+        self.approx_checkbox.setToolTip("Ikut memilih lagu yang ukurannya hanya perkiraan. Lagu tanpa ukuran tidak pernah dipilih.")
 
         self.apply_filter_btn = QPushButton("Terapkan")
         self.apply_filter_btn.clicked.connect(self.apply_smart_selection)
@@ -51,30 +81,54 @@ class DownloadTab(QWidget):
         selection_layout.addWidget(self.filter_label)
         selection_layout.addWidget(self.filter_combo)
         selection_layout.addWidget(self.size_input)
+        selection_layout.addWidget(self.approx_checkbox)
         selection_layout.addWidget(self.apply_filter_btn)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["", "Judul Asli", "Judul Video YouTube", "Ukuran", "Status", "URL"])
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        self.table.setColumnHidden(5, True)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table.setWordWrap(True)
+        # Model/view: hanya baris yang terlihat yang dirender. Ukuran kolom dan baris dibuat tetap,
+        # karena ResizeToContents akan mengukur seluruh baris setiap kali data berubah.
+        self.model = ModelUnduhan(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(KOLOM_PILIH, QHeaderView.ResizeMode.Fixed)
+        header.resizeSection(KOLOM_PILIH, 30)
+        header.setSectionResizeMode(KOLOM_JUDUL_ASLI, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(KOLOM_JUDUL_VIDEO, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(KOLOM_UKURAN, QHeaderView.ResizeMode.Interactive)
+        header.resizeSection(KOLOM_UKURAN, 90)
+        header.setSectionResizeMode(KOLOM_STATUS, QHeaderView.ResizeMode.Interactive)
+        header.resizeSection(KOLOM_STATUS, 160)
+        self.table.setColumnHidden(KOLOM_URL, True)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.setWordWrap(False)
+
+        # Baris yang terlihat/dipilih didahulukan saat melengkapi ukuran file
+        self.priority_timer = QTimer(self)
+        self.priority_timer.setSingleShot(True)
+        self.priority_timer.setInterval(150)
+        self.priority_timer.timeout.connect(self.prioritize_visible_rows)
+        self.table.verticalScrollBar().valueChanged.connect(lambda *_: self.priority_timer.start())
+        self.table.selectionModel().selectionChanged.connect(lambda *_: self.priority_timer.start())
 
         self.progress_bar = QProgressBar()
-        self.log_box = QTextEdit()
-        self.log_box.setReadOnly(True)
-        self.log_box.setFixedHeight(150)
+        self.log_view = TampilanLog(ambil_logger('unduhan'))
+        self.log_view.setFixedHeight(180)
+
+        # Progres unduhan dikumpulkan dulu lalu diterapkan ke tabel/log per frame
+        self.pembaruan = PengumpulPembaruan(parent=self)
+        self.pembaruan.progres.connect(self.progress_bar.setValue)
+        self.pembaruan.status_baris.connect(self.apply_item_progress)
+        self.pembaruan.baris_selesai.connect(self.apply_items_finished)
 
         left_layout.addWidget(selection_group)
         left_layout.addWidget(self.table, 1)
         left_layout.addWidget(self.progress_bar)
-        left_layout.addWidget(QLabel("Log Proses:"))
-        left_layout.addWidget(self.log_box)
+        self.stage_label = QLabel("")
+        self.stage_label.setWordWrap(True)
+        left_layout.addWidget(self.stage_label)
+        left_layout.addWidget(self.log_view)
         
         # === KOLOM KANAN (Kontrol) ===
         right_layout = QVBoxLayout()
@@ -87,13 +141,18 @@ class DownloadTab(QWidget):
         self.json_file_label.setReadOnly(True)
         self.browse_json_btn = QPushButton("Pilih File JSON...")
         self.browse_json_btn.clicked.connect(self.browse_json_file)
+        self.auto_size_checkbox = QCheckBox("Lengkapi ukuran file otomatis")
+        self.auto_size_checkbox.setToolTip("Mengisi ukuran file yang belum diketahui di latar belakang,\n"
+                                           "mendahulukan baris yang sedang terlihat atau dipilih")
+        self.auto_size_checkbox.setChecked(True)
         source_group_layout.addWidget(self.json_file_label)
         source_group_layout.addWidget(self.browse_json_btn)
+        source_group_layout.addWidget(self.auto_size_checkbox)
         
         options_group = QGroupBox("② Opsi Unduhan")
         options_group_layout = QVBoxLayout(options_group)
         self.mode_group = QButtonGroup()
-        self.radio_audio = QRadioButton("Audio (.mp3)")
+        self.radio_audio = QRadioButton("Audio")
         self.radio_video = QRadioButton("Video")
         self.radio_both = QRadioButton("Audio & Video")
         self.radio_audio.setChecked(True)
@@ -120,12 +179,49 @@ class DownloadTab(QWidget):
         subfolder_layout.addWidget(self.subfolder_combo, 1)
         subfolder_layout.addWidget(self.refresh_folders_btn)
 
+        parallel_layout = QHBoxLayout()
+        self.parallel_spinbox = QSpinBox()
+        self.parallel_spinbox.setMinimum(1)
+        self.parallel_spinbox.setMaximum(8)
+        self.parallel_spinbox.setValue(2)
+        self.parallel_spinbox.setFixedWidth(50)
+        parallel_layout.addWidget(QLabel("Unduhan Simultan:"))
+        parallel_layout.addStretch()
+        parallel_layout.addWidget(self.parallel_spinbox)
+
+        audio_format_layout = QHBoxLayout()
+        self.audio_format_combo = QComboBox()
+        self.audio_format_combo.addItem("MP3 192k (kompatibel)", FORMAT_AUDIO_MP3)
+        self.audio_format_combo.addItem("Asli tanpa konversi (Opus/M4A)", FORMAT_AUDIO_ASLI)
+        self.audio_format_combo.setToolTip("Asli: stream audio disimpan apa adanya (hanya remux + tag + sampul),\n"
+                                           "tanpa encode ulang sehingga lebih cepat dan tanpa penurunan kualitas")
+        audio_format_layout.addWidget(QLabel("Format Audio:"))
+        audio_format_layout.addWidget(self.audio_format_combo, 1)
+
+        archive_layout = QHBoxLayout()
+        self.archive_combo = QComboBox()
+        self.archive_combo.addItem("Tautkan (Hardlink)", ARSIP_HARDLINK)
+        self.archive_combo.addItem("Salin File", ARSIP_SALIN)
+        self.archive_combo.addItem("Unduh Ulang", ARSIP_UNDUH_ULANG)
+        self.archive_combo.setToolTip("Lagu yang sudah pernah diunduh (dari daftar/folder mana pun) diambil dari arsip\n"
+                                      "pustaka alih-alih diunduh lagi. Hardlink tidak memakan ruang disk tambahan.")
+        archive_layout.addWidget(QLabel("Jika Sudah Pernah Diunduh:"))
+        archive_layout.addWidget(self.archive_combo, 1)
+
+        self.pipeline_checkbox = QCheckBox("Pisahkan Unduh && Konversi Audio (Pipeline)")
+        self.pipeline_checkbox.setToolTip("Tahap unduh terus berjalan sementara konversi audio dikerjakan\n"
+                                          f"paralel oleh {JUMLAH_KONVERSI} proses ffmpeg (sesuai jumlah CPU)")
+
         options_group_layout.addWidget(self.radio_audio)
         options_group_layout.addWidget(self.radio_video)
         options_group_layout.addWidget(self.radio_both)
+        options_group_layout.addLayout(audio_format_layout)
         options_group_layout.addSpacing(10)
         options_group_layout.addWidget(subfolder_label)
         options_group_layout.addLayout(subfolder_layout)
+        options_group_layout.addLayout(parallel_layout)
+        options_group_layout.addWidget(self.pipeline_checkbox)
+        options_group_layout.addLayout(archive_layout)
         # -------------------------
 
         action_group = QGroupBox("③ Aksi")
@@ -163,50 +259,38 @@ class DownloadTab(QWidget):
             subfolders.sort(key=str.lower)
             self.subfolder_combo.addItems(subfolders)
         except Exception as e:
-            self.log_box.append(f"⚠️ Gagal memuat daftar folder: {e}")
+            self.log_view.warning(f"⚠️ Gagal memuat daftar folder: {e}")
         # Atur agar tidak ada item yang terpilih secara default
         self.subfolder_combo.setCurrentIndex(-1)
     # ------------------------------------------
 
     def toggle_select_all(self, state):
-        check_state = Qt.CheckState.Checked if state else Qt.CheckState.Unchecked
-        for i in range(self.table.rowCount()):
-            self.table.item(i, 0).setCheckState(check_state)
+        self.model.atur_semua_centang(state)
             
     def apply_smart_selection(self):
+        aturan = self.filter_combo.currentData()[0]
+        teks = self.size_input.text().strip()
+        ukuran = self.model.kolom_ukuran
+        sertakan_perkiraan = self.approx_checkbox.isChecked()
         try:
-            limit_size_mb = float(self.size_input.text())
+            if aturan == self.PILIH_RENTANG:
+                batas_bawah, batas_atas = (float(x) for x in teks.split('-', 1))
+                centang = ukuran.rentang(batas_bawah, batas_atas, sertakan_perkiraan)
+            elif aturan == self.PILIH_TERBESAR:
+                centang = ukuran.terbesar(int(teks), sertakan_perkiraan)
+            elif aturan == self.PILIH_ANGGARAN:
+                centang = ukuran.anggaran(float(teks) * 1024, sertakan_perkiraan)
+            elif aturan == self.PILIH_MINIMAL:
+                centang = ukuran.paling_kecil(float(teks), sertakan_perkiraan)
+            else:
+                centang = ukuran.paling_besar(float(teks), sertakan_perkiraan)
         except ValueError:
-            self.log_box.append("⚠️ Harap masukkan angka yang valid untuk ukuran file.")
+            self.log_view.warning(f"⚠️ Harap masukkan nilai yang valid: {self.filter_combo.currentData()[1]}.")
             return
 
-        is_greater_than = self.filter_combo.currentIndex() == 0
-
-        for i in range(self.table.rowCount()):
-            self.table.item(i, 0).setCheckState(Qt.CheckState.Checked)
-
-        for i in range(self.table.rowCount()):
-            size_item = self.table.item(i, 3)
-            if not size_item:
-                self.table.item(i, 0).setCheckState(Qt.CheckState.Unchecked)
-                continue
-
-            size_text = size_item.text()
-            try:
-                match = re.search(r'[\d\.]+', size_text)
-                if match:
-                    current_size_mb = float(match.group())
-                    if is_greater_than and current_size_mb > limit_size_mb:
-                        self.table.item(i, 0).setCheckState(Qt.CheckState.Unchecked)
-                    elif not is_greater_than and current_size_mb < limit_size_mb:
-                        self.table.item(i, 0).setCheckState(Qt.CheckState.Unchecked)
-                else:
-                    self.table.item(i, 0).setCheckState(Qt.CheckState.Unchecked)
-            except (ValueError, IndexError):
-                self.table.item(i, 0).setCheckState(Qt.CheckState.Unchecked)
-                continue
-        
-        self.log_box.append(f"✅ Filter pemilihan cerdas diterapkan.")
+        self.model.atur_centang(centang)
+        self.log_view.info(f"✅ Filter pemilihan cerdas diterapkan: {sum(centang)} lagu dipilih, "
+                           f"total {self.model.total_mb_dicentang() / 1024:.2f} GB.")
 
     def browse_json_file(self):
         # Muat ulang daftar folder setiap kali pengguna memilih file baru, untuk jaga-jaga
@@ -219,59 +303,83 @@ class DownloadTab(QWidget):
             self.load_json_to_table(file_path)
     
     def load_json_to_table(self, file_path):
-        self.table.setRowCount(0)
+        self.stop_size_enrichment()
+        self.close_status_store()
+        self.model.muat([])
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            self.table.setRowCount(len(data))
-            for row, item in enumerate(data):
-                is_downloaded = item.get("download", False)
-                status = "Sudah diunduh" if is_downloaded else "Belum diunduh"
-                
-                chk_box_item = QTableWidgetItem()
-                chk_box_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-                chk_box_item.setCheckState(Qt.CheckState.Unchecked)
-                
-                judul_asli_item = QTableWidgetItem(item.get("judul_asli", ""))
-                judul_video_item = QTableWidgetItem(item.get("judul_video", ""))
-                ukuran_file_item = QTableWidgetItem(item.get("ukuran_file", "N/A"))
-                status_item = QTableWidgetItem(status)
-                link_item = QTableWidgetItem(item.get("link_youtube", ""))
-
-                self.table.setItem(row, 0, chk_box_item)
-                self.table.setItem(row, 1, judul_asli_item)
-                self.table.setItem(row, 2, judul_video_item)
-                self.table.setItem(row, 3, ukuran_file_item)
-                self.table.setItem(row, 4, status_item)
-                self.table.setItem(row, 5, link_item)
-                
-                if is_downloaded:
-                    green_color = QColor(204, 255, 204)
-                    for col in range(self.table.columnCount()):
-                        self.table.item(row, col).setBackground(QBrush(green_color))
-
-            self.table.resizeRowsToContents()
+            # Isi file disimpan di memori; status & ukuran ditulis balik secara bertahap
+            self.status_store = PenyimpanStatus(file_path)
+            data = self.status_store.data
+            self.model.muat(data)
             self.start_download_btn.setEnabled(True)
 
+            if self.auto_size_checkbox.isChecked():
+                self.start_size_enrichment(data)
+
         except Exception as e:
-            self.log_box.append(f"❌ Error memuat file JSON: {e}")
+            self.log_view.error(f"❌ Error memuat file JSON: {e}")
             self.start_download_btn.setEnabled(False)
             
-    def start_download(self):
-        items_to_download = []
-        for i in range(self.table.rowCount()):
-            if self.table.item(i, 0).checkState() == Qt.CheckState.Checked:
-                link = self.table.item(i, 5).text()
-                filename = self.table.item(i, 2).text()
-                judul_asli = self.table.item(i, 1).text()
-                filename = re.sub(r'[\\/*?:"<>|]', "", filename)
-                items_to_download.append((i, link, filename, judul_asli))
+    def close_status_store(self):
+        if self.status_store:
+            try:
+                self.status_store.tutup()
+            except Exception as e:
+                self.log_view.error(f"❌ Gagal menyimpan perubahan JSON: {e}")
+            self.status_store = None
+
+    def start_size_enrichment(self, data):
+        items = [(row, item.get("judul_asli", ""), item.get("link_youtube", ""))
+                 for row, item in enumerate(data) if perlu_ukuran(item)]
+        if not items:
+            return
+
+        self.log_view.info(f"ℹ️ Melengkapi ukuran file untuk {len(items)} lagu di latar belakang...")
+        # Info format ikut disimpan agar unduhan berikutnya tidak perlu ekstraksi ulang
+        self.size_worker = SizeWorker(items, self.status_store, simpan_info=True)
+        self.size_worker.size_found.connect(self.update_row_size)
+        self.size_worker.finished.connect(self.size_enrichment_finished)
+        self.size_worker.start()
+        self.prioritize_visible_rows()
+
+    def stop_size_enrichment(self):
+        if self.size_worker:
+            self.size_worker.size_found.disconnect()
+            self.size_worker.finished.disconnect()
+            self.size_worker.stop()
+            self.size_worker.wait()
+            self.size_worker = None
 
+    def prioritize_visible_rows(self):
+        if not self.size_worker or self.model.rowCount() == 0:
+            return
+        first_row = max(self.table.rowAt(0), 0)
+        last_row = self.table.rowAt(self.table.viewport().height() - 1)
+        if last_row < 0:
+            last_row = self.model.rowCount() - 1
+        rows = [index.row() for index in self.table.selectionModel().selectedRows()]
+        rows += range(first_row, last_row + 1)
+        self.size_worker.prioritaskan(rows)
+
+    def update_row_size(self, row_index, size_text):
+        self.model.atur_ukuran(row_index, size_text)
+
+    def size_enrichment_finished(self, count):
+        self.log_view.info(f"✅ Ukuran file untuk {count} lagu sudah dilengkapi.")
+        self.size_worker = None
+
+    def _item_unduhan(self, row):
+        filename = re.sub(r'[\\/*?:"<>|]', "", self.model.judul_video[row])
+        return (row, self.model.link[row], filename, self.model.judul_asli[row])
+
+    def start_download(self):
+        items_to_download = [self._item_unduhan(i) for i in self.model.baris_dicentang()]
         if not items_to_download:
-            self.log_box.append("⚠️ Tidak ada item yang dipilih untuk diunduh.")
+            self.log_view.warning("⚠️ Tidak ada item yang dipilih untuk diunduh.")
             return
-        
+        self._mulai_unduhan(items_to_download)
+
+    def _mulai_unduhan(self, items_to_download, streaming=False):
         download_mode = 'audio'
         if self.radio_video.isChecked(): download_mode = 'video'
         elif self.radio_both.isChecked(): download_mode = 'both'
@@ -287,40 +395,91 @@ class DownloadTab(QWidget):
             output_path = FOLDER_DOWNLOAD_UTAMA
         # -------------------------
         
-        self.log_box.clear()
+        self.log_view.bersihkan()
         self.progress_bar.setValue(0)
         self.start_download_btn.setEnabled(False)
         self.stop_download_btn.setEnabled(True)
         self.browse_json_btn.setEnabled(False)
 
-        self.download_worker = DownloadWorker(items_to_download, download_mode, output_path, self.current_json_path)
-        self.download_worker.progress.connect(self.update_download_progress)
-        self.download_worker.item_finished.connect(self.item_download_finished)
+        self.stage_label.setText("")
+        self.download_worker = DownloadWorker(items_to_download, download_mode, output_path, self.status_store,
+                                              self.parallel_spinbox.value(), self.pipeline_checkbox.isChecked(),
+                                              format_audio=self.audio_format_combo.currentData(),
+                                              aksi_arsip=self.archive_combo.currentData(), streaming=streaming)
+        self.pembaruan.hubungkan(self.download_worker.progress, self.pembaruan.terima_progres)
+        self.pembaruan.hubungkan(self.download_worker.item_progress, self.pembaruan.terima_status_baris)
+        self.pembaruan.hubungkan(self.download_worker.item_finished, self.pembaruan.terima_baris_selesai)
+        self.download_worker.stage_status.connect(self.stage_label.setText)
         self.download_worker.finished.connect(self.download_finished)
+        self.pembaruan.mulai()
         self.download_worker.start()
 
+    # --- Mode streaming: hasil pencarian langsung masuk antrean unduhan ---
+
+    def mulai_streaming(self, json_path):
+        """Dipanggil saat pencarian streaming dimulai; antrean unduhan dibuka dan menunggu hasil."""
+        if self.download_worker:
+            self.log_view.warning("⚠️ Unduhan lain masih berjalan; hasil pencarian tidak di-stream ke antrean.")
+            return
+        self.stop_size_enrichment()
+        self.close_status_store()
+        self.current_json_path = json_path
+        self.json_file_label.setText(os.path.basename(json_path))
+        try:
+            self.status_store = PenyimpanStatus(json_path)
+        except Exception as e:
+            self.log_view.error(f"❌ Error memuat file JSON: {e}")
+            return
+        # File hasil sedang ditulis oleh pencarian; status unduhan digabung setelah pencarian selesai
+        self.status_store.tahan()
+        self.streaming_aktif = True
+        self.model.muat(self.status_store.data)
+        # Hasil dari proses sebelumnya (pencarian yang dilanjutkan) yang belum diunduh ikut diantrekan
+        items = [self._item_unduhan(row) for row in range(self.model.rowCount())
+                 if not self.status_store.data[row].get('download') and self.model.link[row].startswith('http')]
+        self._mulai_unduhan(items, streaming=True)
+        self.log_view.info("📡 Mode streaming: hasil pencarian langsung diunduh begitu ditemukan.")
+
+    def tambah_hasil_streaming(self, item):
+        if not self.streaming_aktif:
+            return
+        row = self.status_store.tambah(item)
+        if row is None:
+            return
+        if row < self.model.rowCount():
+            self.model.ganti(row, item)  # judul yang dicari ulang saat melanjutkan (mis. "Dibatasi YouTube")
+        else:
+            row = self.model.tambah(item)
+        if self.download_worker and self.model.link[row].startswith('http'):
+            self.download_worker.tambah_item(self._item_unduhan(row))
+
+    def akhiri_streaming(self):
+        """Pencarian selesai: file hasil sudah final, antrean unduhan ditutup."""
+        if not self.streaming_aktif:
+            return
+        self.streaming_aktif = False
+        if self.status_store:
+            try:
+                self.status_store.lanjutkan()
+            except Exception as e:
+                self.log_view.error(f"❌ Gagal menyimpan perubahan JSON: {e}")
+        if self.download_worker:
+            self.download_worker.akhiri_antrean()
+
     def stop_download(self):
         if self.download_worker:
             self.download_worker.stop()
             self.stop_download_btn.setEnabled(False)
 
-    def update_download_progress(self, value, message):
-        if value != -1:
-            self.progress_bar.setValue(value)
-        self.log_box.append(message)
-    
-    def item_download_finished(self, row_index, success):
-        status = "✅ Berhasil" if success else "❌ Gagal"
-        self.table.setItem(row_index, 4, QTableWidgetItem(status))
-        self.table.item(row_index, 0).setCheckState(Qt.CheckState.Unchecked)
+    def apply_item_progress(self, status_per_row):
+        self.model.atur_status(status_per_row)
 
-        if success:
-            green_color = QColor(204, 255, 204)
-            for col in range(self.table.columnCount()):
-                self.table.item(row_index, col).setBackground(QBrush(green_color))
+    def apply_items_finished(self, finished_rows):
+        self.model.tandai_selesai(finished_rows)
 
     def download_finished(self, message):
-        self.log_box.append(f"\n{message}")
+        self.pembaruan.berhenti()
+        self.log_view.info(message)
         self.start_download_btn.setEnabled(True)
         self.stop_download_btn.setEnabled(False)
         self.browse_json_btn.setEnabled(True)
@@ -11,6 +11,7 @@ from config import (
     STYLESHEET_DARK, STYLESHEET_LIGHT,
     save_ui_settings, load_ui_settings
 )
+from core.cache_thumbnail import tutup_cache_thumbnail
 from gui.tabs.search_tab import SearchTab
 from gui.tabs.download_tab import DownloadTab
 from gui.tabs.thumbnail_tab import ThumbnailTab
@@ -64,9 +65,15 @@ class MainWindow(QMainWindow):
         header_layout.addLayout(controls_layout)
 
         tab_widget = QTabWidget()
+        search_tab = SearchTab()
+        download_tab = DownloadTab()
+        # Mode streaming: hasil pencarian langsung masuk antrean tab Pengunduh
+        search_tab.streaming_started.connect(download_tab.mulai_streaming)
+        search_tab.streaming_result.connect(download_tab.tambah_hasil_streaming)
+        search_tab.streaming_finished.connect(download_tab.akhiri_streaming)
         tab_widget.addTab(SpotifyTab(), "① Spotify Populer")
-        tab_widget.addTab(SearchTab(), "② Pencari Musik")
-        tab_widget.addTab(DownloadTab(), "③ Pengunduh")
+        tab_widget.addTab(search_tab, "② Pencari Musik")
+        tab_widget.addTab(download_tab, "③ Pengunduh")
         tab_widget.addTab(ThumbnailTab(), "④ Penampil Thumbnail")
 
         main_layout.addLayout(header_layout)
@@ -134,4 +141,13 @@ class MainWindow(QMainWindow):
             if hasattr(tab, 'download_worker') and tab.download_worker:
                 tab.download_worker.stop()
                 tab.download_worker.wait()
+            if hasattr(tab, 'size_worker') and tab.size_worker:
+                tab.size_worker.stop()
+                tab.size_worker.wait()
+            if hasattr(tab, 'galeri_worker') and tab.galeri_worker:
+                tab.stop_gallery_worker()
+            if hasattr(tab, 'status_store') and tab.status_store:
+                tab.status_store.tutup()
+        # Setelah semua pekerja berhenti, tidak ada lagi yang memakai cache thumbnail
+        tutup_cache_thumbnail()
         event.accept()
\ No newline at end of file
@@ -2,19 +2,28 @@ import os
 import json
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QLabel,
-    QTextEdit, QProgressBar, QFileDialog, QCheckBox, QSpinBox
+    QProgressBar, QFileDialog, QCheckBox, QSpinBox, QComboBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 
 # Import worker dan konfigurasi
 from core.workers import SearchManager # Diubah dari SearchWorker ke SearchManager
+from gui.pengumpul_pembaruan import PengumpulPembaruan
+from gui.tampilan_log import TampilanLog
+from core.log_terstruktur import ambil_logger
 from config import FOLDER_MUSIK_UTAMA, FOLDER_HASIL_JSON
 
 class SearchTab(QWidget):
+    # Mode streaming: hasil diteruskan ke tab Pengunduh (dihubungkan oleh MainWindow)
+    streaming_started = pyqtSignal(str)
+    streaming_result = pyqtSignal(dict)
+    streaming_finished = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.init_ui()
         self.search_manager = None # Diubah dari search_worker
+        self.streaming = False
 
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -40,8 +49,21 @@ class SearchTab(QWidget):
 
         # Opsi
         options_layout = QHBoxLayout()
-        self.get_size_checkbox = QCheckBox("Dapatkan Ukuran File (Proses Lebih Lambat)")
+        self.get_size_checkbox = QCheckBox("Lengkapi Ukuran File (Tahap 2, di Latar Belakang)")
+        self.get_size_checkbox.setToolTip("Daftar hasil ditulis dulu dengan pencarian cepat,\n"
+                                          "lalu ukuran file diisi setelahnya")
         self.get_size_checkbox.setChecked(True)
+        self.save_info_checkbox = QCheckBox("Simpan Info Format")
+        self.save_info_checkbox.setToolTip("Simpan info format (id, format, URL stream, ukuran byte) dari tahap 2\n"
+                                           "agar unduhan tidak perlu mengekstraksi ulang selama URL masih berlaku")
+        self.get_size_checkbox.toggled.connect(self.save_info_checkbox.setEnabled)
+        self.use_cache_checkbox = QCheckBox("Gunakan Cache Pencarian")
+        self.use_cache_checkbox.setToolTip("Pakai ulang hasil pencarian sebelumnya untuk judul yang sama")
+        self.use_cache_checkbox.setChecked(True)
+        self.stream_checkbox = QCheckBox("Langsung Unduh Hasil")
+        self.stream_checkbox.setToolTip("Setiap hasil yang ditemukan langsung masuk antrean tab Pengunduh\n"
+                                        "(memakai pengaturan unduhan di tab tersebut), sehingga pencarian\n"
+                                        "dan pengunduhan berjalan bersamaan")
         
         # --- PERUBAHAN DI SINI: Menambahkan Pilihan Jumlah Worker ---
         self.worker_label = QLabel("Jumlah Pencarian Simultan:")
@@ -50,11 +72,25 @@ class SearchTab(QWidget):
         self.worker_spinbox.setMaximum(10) # Batas wajar
         self.worker_spinbox.setValue(3)    # Nilai default
         self.worker_spinbox.setFixedWidth(50)
+        self.adaptive_checkbox = QCheckBox("Adaptif")
+        self.adaptive_checkbox.setToolTip("Atur jumlah pencarian simultan otomatis berdasarkan latensi dan error.\n"
+                                          "Nilai di samping menjadi batas maksimum.")
+
+        self.order_label = QLabel("Urutan:")
+        self.order_combo = QComboBox()
+        self.order_combo.addItem("Sesuai Input", SearchManager.URUTAN_INPUT)
+        self.order_combo.addItem("Judul Terpendek Dulu", SearchManager.URUTAN_TERPENDEK)
 
         options_layout.addWidget(self.get_size_checkbox)
+        options_layout.addWidget(self.save_info_checkbox)
+        options_layout.addWidget(self.use_cache_checkbox)
+        options_layout.addWidget(self.stream_checkbox)
         options_layout.addStretch()
         options_layout.addWidget(self.worker_label)
         options_layout.addWidget(self.worker_spinbox)
+        options_layout.addWidget(self.adaptive_checkbox)
+        options_layout.addWidget(self.order_label)
+        options_layout.addWidget(self.order_combo)
         # -----------------------------------------------------------
 
         # Tombol Aksi
@@ -69,16 +105,22 @@ class SearchTab(QWidget):
         action_layout.addWidget(self.stop_search_btn)
 
         self.progress_bar = QProgressBar()
-        self.log_box = QTextEdit()
-        self.log_box.setReadOnly(True)
+        self.status_label = QLabel("")
+        self.log_view = TampilanLog(ambil_logger('pencarian'))
+
+        # Progres dari banyak pekerja digabung lalu ditampilkan per frame
+        self.pembaruan = PengumpulPembaruan(parent=self)
+        self.pembaruan.progres.connect(self.progress_bar.setValue)
+        # Pesan log datang dari sinyal terpisah; status hanya berisi konkurensi & kecepatan
+        self.pembaruan.status.connect(self.status_label.setText)
 
         layout.addLayout(input_layout)
         layout.addLayout(output_layout)
         layout.addLayout(options_layout)
         layout.addLayout(action_layout)
         layout.addWidget(self.progress_bar)
-        layout.addWidget(QLabel("Log Proses:"))
-        layout.addWidget(self.log_box, 1)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.log_view, 1)
 
     def browse_input_file(self):
         os.makedirs(FOLDER_MUSIK_UTAMA, exist_ok=True)
@@ -103,10 +145,10 @@ class SearchTab(QWidget):
         output_file = self.output_file_label.text()
 
         if not input_file or not output_file:
-            self.log_box.append("❌ Harap pilih file input terlebih dahulu.")
+            self.log_view.error("❌ Harap pilih file input terlebih dahulu.")
             return
 
-        self.log_box.clear()
+        self.log_view.bersihkan()
         self.progress_bar.setValue(0)
         self.start_search_btn.setEnabled(False)
         self.stop_search_btn.setEnabled(True)
@@ -115,11 +157,20 @@ class SearchTab(QWidget):
         # --- PERUBAHAN DI SINI: Menggunakan SearchManager ---
         get_size = self.get_size_checkbox.isChecked()
         num_workers = self.worker_spinbox.value()
+        use_cache = self.use_cache_checkbox.isChecked()
+        urutan = self.order_combo.currentData()
+        adaptif = self.adaptive_checkbox.isChecked()
+        simpan_info = get_size and self.save_info_checkbox.isChecked()
+        self.streaming = self.stream_checkbox.isChecked()
         
-        self.search_manager = SearchManager(input_file, output_file, get_size, num_workers)
-        self.search_manager.progress.connect(self.update_search_progress)
-        self.search_manager.log_message.connect(self.log_box.append)
+        self.search_manager = SearchManager(input_file, output_file, get_size, num_workers, use_cache, urutan, adaptif,
+                                            simpan_info, self.streaming)
+        if self.streaming:
+            self.search_manager.result_found.connect(self.streaming_result)
+            self.streaming_started.emit(output_file)
+        self.pembaruan.hubungkan(self.search_manager.progress, self.pembaruan.terima_progres_status)
         self.search_manager.finished.connect(self.search_finished)
+        self.pembaruan.mulai()
         self.search_manager.start()
         # ----------------------------------------------------
 
@@ -128,13 +179,12 @@ class SearchTab(QWidget):
             self.search_manager.stop()
             self.stop_search_btn.setEnabled(False)
 
-    def update_search_progress(self, value, message):
-        self.progress_bar.setValue(value)
-        if message: # Pesan log sekarang datang dari sinyal terpisah
-            self.log_box.append(message)
-    
     def search_finished(self, message):
-        self.log_box.append(f"\n✅ {message}")
+        self.pembaruan.berhenti()
+        if self.streaming:
+            self.streaming = False
+            self.streaming_finished.emit()
+        self.log_view.info(f"✅ {message}")
         self.start_search_btn.setEnabled(True)
         self.stop_search_btn.setEnabled(False)
         self.browse_input_btn.setEnabled(True)
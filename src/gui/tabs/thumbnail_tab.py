@@ -1,19 +1,26 @@
 import os
 import re
+import json
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QLabel
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QLabel, QListView, QSplitter, QFileDialog
 )
 from PyQt6.QtGui import QPixmap
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSize, QTimer
 
 # Import worker
-from core.workers import ThumbnailWorker
+from config import FOLDER_HASIL_JSON
+from core.workers import ThumbnailWorker, GaleriWorker
+from gui.model_galeri import ModelGaleri
+
+UKURAN_SAMPUL_GALERI = QSize(160, 90)
+UKURAN_SEL_GALERI = QSize(176, 124)
 
 class ThumbnailTab(QWidget):
     def __init__(self):
         super().__init__()
-        self.init_ui()
         self.thread = None
+        self.galeri_worker = None
+        self.init_ui()
 
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -27,8 +34,11 @@ class ThumbnailTab(QWidget):
         self.url_input.returnPressed.connect(self.fetch_thumbnail)
         self.fetch_btn = QPushButton("Lihat Thumbnail")
         self.fetch_btn.clicked.connect(self.fetch_thumbnail)
+        self.gallery_btn = QPushButton("Buka Galeri JSON...")
+        self.gallery_btn.clicked.connect(self.browse_gallery_json)
         url_layout.addWidget(self.url_input)
         url_layout.addWidget(self.fetch_btn)
+        url_layout.addWidget(self.gallery_btn)
 
         # Image Preview
         self.image_preview = QLabel("Masukkan URL untuk melihat pratinjau")
@@ -45,9 +55,39 @@ class ThumbnailTab(QWidget):
         self.video_title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.video_title_label.setWordWrap(True)
 
+        # Galeri hasil pencarian: hanya sel terlihat yang sampulnya diambil
+        self.gallery_model = ModelGaleri(UKURAN_SAMPUL_GALERI, self)
+        self.gallery_view = QListView()
+        self.gallery_view.setModel(self.gallery_model)
+        self.gallery_view.setViewMode(QListView.ViewMode.IconMode)
+        self.gallery_view.setIconSize(UKURAN_SAMPUL_GALERI)
+        self.gallery_view.setGridSize(UKURAN_SEL_GALERI)
+        self.gallery_view.setUniformItemSizes(True)
+        self.gallery_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.gallery_view.setMovement(QListView.Movement.Static)
+        self.gallery_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.gallery_view.setWordWrap(False)
+        self.gallery_view.clicked.connect(self.show_gallery_item)
+        self.gallery_view.hide()
+
+        self.visible_timer = QTimer(self)
+        self.visible_timer.setSingleShot(True)
+        self.visible_timer.setInterval(50)
+        self.visible_timer.timeout.connect(self.request_visible_covers)
+        self.gallery_view.verticalScrollBar().valueChanged.connect(self.schedule_visible_covers)
+        self.gallery_view.verticalScrollBar().rangeChanged.connect(self.schedule_visible_covers)
+
+        preview = QWidget()
+        preview_layout = QVBoxLayout(preview)
+        preview_layout.setContentsMargins(0, 0, 0, 0)
+        preview_layout.addWidget(self.image_preview, 1)
+        preview_layout.addWidget(self.video_title_label)
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        splitter.addWidget(preview)
+        splitter.addWidget(self.gallery_view)
+
         layout.addLayout(url_layout)
-        layout.addWidget(self.image_preview, 1)
-        layout.addWidget(self.video_title_label)
+        layout.addWidget(splitter, 1)
 
     def fetch_thumbnail(self):
         url = self.url_input.text()
@@ -62,15 +102,77 @@ class ThumbnailTab(QWidget):
         self.thread.finished.connect(self.display_thumbnail)
         self.thread.start()
 
-    def display_thumbnail(self, title, pixmap):
-        if pixmap.isNull():
+    def display_thumbnail(self, title, gambar):
+        if gambar.isNull():
             self.image_preview.setText(title)
             self.video_title_label.setText("❌ Gagal memuat data.")
         else:
-            self.image_preview.setPixmap(pixmap.scaled(
+            self.image_preview.setPixmap(QPixmap.fromImage(gambar).scaled(
                 self.image_preview.size(),
                 Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
             ))
             self.video_title_label.setText(title)
         
-        self.fetch_btn.setEnabled(True)
\ No newline at end of file
+        self.fetch_btn.setEnabled(True)
+
+    def browse_gallery_json(self):
+        os.makedirs(FOLDER_HASIL_JSON, exist_ok=True)
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Pilih File Hasil Pencarian", FOLDER_HASIL_JSON, "Hasil Pencarian (*_hasil_pencarian.json);;JSON Files (*.json)"
+        )
+        if file_path:
+            self.load_gallery(file_path)
+
+    def load_gallery(self, file_path):
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            self.video_title_label.setText(f"❌ Gagal memuat file JSON: {e}")
+            return
+
+        # Worker baru untuk setiap file agar sampul lama tidak masuk ke baris yang salah
+        self.stop_gallery_worker()
+        self.gallery_model.muat(data)
+        self.galeri_worker = GaleriWorker(UKURAN_SAMPUL_GALERI)
+        self.galeri_worker.gambar_siap.connect(self.gallery_model.atur_gambar)
+        self.galeri_worker.start()
+        self.gallery_view.show()
+        self.gallery_view.scrollToTop()
+        self.schedule_visible_covers()
+
+    def stop_gallery_worker(self):
+        if self.galeri_worker:
+            self.galeri_worker.gambar_siap.disconnect()
+            self.galeri_worker.stop()
+            self.galeri_worker.wait()
+            self.galeri_worker = None
+
+    def schedule_visible_covers(self, *_):
+        # Dibatasi, bukan ditunda: selama digulir, sel terlihat tetap diperbarui setiap interval timer
+        if not self.visible_timer.isActive():
+            self.visible_timer.start()
+
+    def request_visible_covers(self):
+        """Mengirim sel yang sedang terlihat (tanpa sampul di memori) ke GaleriWorker."""
+        jumlah = self.gallery_model.rowCount()
+        if not self.galeri_worker or jumlah == 0:
+            return
+        grid = self.gallery_view.gridSize()
+        viewport = self.gallery_view.viewport()
+        kolom = max(1, viewport.width() // grid.width())
+        baris_awal = self.gallery_view.verticalScrollBar().value() // grid.height()
+        baris_terlihat = viewport.height() // grid.height() + 2
+        awal = baris_awal * kolom
+        akhir = min(jumlah, (baris_awal + baris_terlihat) * kolom)
+        self.galeri_worker.atur_terlihat(self.gallery_model.belum_bergambar(range(awal, akhir)))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.schedule_visible_covers()
+
+    def show_gallery_item(self, index):
+        link = self.gallery_model.link[index.row()]
+        if link and self.fetch_btn.isEnabled():
+            self.url_input.setText(link)
+            self.fetch_thumbnail()
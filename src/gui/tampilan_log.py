@@ -0,0 +1,111 @@
+import logging
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPlainTextEdit
+from PyQt6.QtCore import QTimer
+
+from config import FPS_PEMBARUAN_UI, load_log_settings
+from core.log_terstruktur import PenampungLog, catat, PEKERJA_UTAMA
+
+_SEMUA_PEKERJA = "Semua Pekerja"
+
+
+class TampilanLog(QWidget):
+    """
+    Kotak log untuk satu logger aplikasi (mis. 'music_manager.unduhan').
+    Catatan ditampung di ring buffer, lalu catatan baru ditampilkan
+    sekaligus per frame ke kotak teks dengan batas jumlah baris. Log bisa
+    disaring per level dan per pekerja.
+    """
+
+    def __init__(self, logger, judul="Log Proses:", parent=None):
+        super().__init__(parent)
+        self.logger = logger
+        settings = load_log_settings()
+        self.penampung = PenampungLog(settings['kapasitas'])
+        logger.addHandler(self.penampung)
+        self._jumlah_pekerja = 0
+
+        self.level_combo = QComboBox()
+        for teks, level in (("Semua Level", logging.DEBUG), ("Info", logging.INFO),
+                            ("Peringatan", logging.WARNING), ("Error", logging.ERROR)):
+            self.level_combo.addItem(teks, level)
+        self.worker_combo = QComboBox()
+        self.worker_combo.addItem(_SEMUA_PEKERJA, None)
+        self.level_combo.currentIndexChanged.connect(self.tampilkan_ulang)
+        self.worker_combo.currentIndexChanged.connect(self.tampilkan_ulang)
+
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setMaximumBlockCount(settings['baris_tampil'])
+
+        header = QHBoxLayout()
+        header.addWidget(QLabel(judul))
+        header.addStretch()
+        header.addWidget(self.level_combo)
+        header.addWidget(self.worker_combo)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(header)
+        layout.addWidget(self.text)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(max(1, 1000 // FPS_PEMBARUAN_UI))
+        self.timer.timeout.connect(self.tampilkan_baru)
+        self.timer.start()
+
+    def info(self, pesan):
+        catat(self.logger, logging.INFO, pesan)
+
+    def warning(self, pesan):
+        catat(self.logger, logging.WARNING, pesan)
+
+    def error(self, pesan):
+        catat(self.logger, logging.ERROR, pesan)
+
+    def _lolos(self, record):
+        pekerja = self.worker_combo.currentData()
+        return record.levelno >= self.level_combo.currentData() and (pekerja is None or record.pekerja == pekerja)
+
+    @staticmethod
+    def _teks(record):
+        teks = record.getMessage()
+        if getattr(record, 'item', None):
+            teks = f"<{record.item}> {teks}"
+        if record.pekerja != PEKERJA_UTAMA:
+            teks = f"[{record.pekerja}] {teks}"
+        return teks
+
+    def _perbarui_daftar_pekerja(self):
+        with self.penampung.lock:
+            if len(self.penampung.pekerja) == self._jumlah_pekerja:
+                return
+            pekerja = sorted(self.penampung.pekerja)
+        self._jumlah_pekerja = len(pekerja)
+        sudah_ada = {self.worker_combo.itemData(i) for i in range(self.worker_combo.count())}
+        for nama in pekerja:
+            if nama not in sudah_ada:
+                self.worker_combo.addItem(nama, nama)
+
+    def tampilkan_baru(self):
+        catatan = self.penampung.ambil_baru()
+        if not catatan:
+            return
+        self._perbarui_daftar_pekerja()
+        baris = [self._teks(r) for r in catatan if self._lolos(r)]
+        if baris:
+            self.text.appendPlainText("\n".join(baris))
+
+    def tampilkan_ulang(self):
+        """Menyusun ulang isi kotak log dari ring buffer sesuai filter yang dipilih."""
+        baris = [self._teks(r) for r in self.penampung.semua() if self._lolos(r)]
+        self.text.setPlainText("\n".join(baris[-self.text.maximumBlockCount():]))
+        self.text.verticalScrollBar().setValue(self.text.verticalScrollBar().maximum())
+
+    def bersihkan(self):
+        self.penampung.bersihkan()
+        self.text.clear()
+        self._jumlah_pekerja = 0
+        self.worker_combo.blockSignals(True)
+        while self.worker_combo.count() > 1:
+            self.worker_combo.removeItem(1)
+        self.worker_combo.setCurrentIndex(0)
+        self.worker_combo.blockSignals(False)
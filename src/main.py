@@ -6,8 +6,9 @@ from PyQt6.QtWidgets import QApplication
 from gui.tabs.main_window import MainWindow
 from config import (
     FOLDER_MUSIK_UTAMA, FOLDER_HASIL_JSON, FOLDER_DOWNLOAD_UTAMA,
-    STYLESHEET_LIGHT, STYLESHEET_DARK, load_ui_settings
+    STYLESHEET_LIGHT, STYLESHEET_DARK, load_ui_settings, load_log_settings
 )
+from core.log_terstruktur import pasang_file_log
 
 if __name__ == '__main__':
     # Membuat folder yang diperlukan jika belum ada
@@ -15,6 +16,10 @@ if __name__ == '__main__':
     os.makedirs(FOLDER_HASIL_JSON, exist_ok=True)
     os.makedirs(FOLDER_DOWNLOAD_UTAMA, exist_ok=True)
     
+    log_settings = load_log_settings()
+    if log_settings.get('file_aktif'):
+        pasang_file_log(log_settings['file'], log_settings['maks_mb'], log_settings['cadangan'])
+
     app = QApplication(sys.argv)
     
     # --- PERUBAHAN DI SINI ---
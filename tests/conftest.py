@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modul aplikasi diimpor seperti saat dijalankan dari src/ (from config import ..., from core.X import ...)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
@@ -0,0 +1,91 @@
+import core.concurrency as concurrency
+from core.concurrency import (
+    PengaturKonkurensi, klasifikasi_error, STATUS_OK, STATUS_ERROR, STATUS_THROTTLE
+)
+
+
+class WaktuPalsu:
+    def __init__(self):
+        self.sekarang = 100.0
+
+    def monotonic(self):
+        return self.sekarang
+
+
+def selesai(pengatur, status=STATUS_OK, latensi=1.0, kali=1):
+    for _ in range(kali):
+        assert pengatur.masuk()
+        pengatur.keluar(latensi, status)
+
+
+def test_klasifikasi_error():
+    assert klasifikasi_error(Exception("HTTP Error 429: Too Many Requests")) == STATUS_THROTTLE
+    assert klasifikasi_error(Exception("Sign in to confirm you're not a bot")) == STATUS_THROTTLE
+    assert klasifikasi_error(Exception("Video unavailable")) == STATUS_ERROR
+
+
+def test_additive_increase_satu_per_batas_sukses():
+    pengatur = PengaturKonkurensi(2, 8)
+    selesai(pengatur, kali=2)
+    assert pengatur.batas == 3
+    selesai(pengatur, kali=2)
+    assert pengatur.batas == 3
+    selesai(pengatur)
+    assert pengatur.batas == 4
+
+
+def test_batas_tidak_melewati_maksimum():
+    pengatur = PengaturKonkurensi(3, 3)
+    selesai(pengatur, kali=20)
+    assert pengatur.batas == 3
+
+
+def test_multiplicative_decrease_saat_error_dan_throttle(monkeypatch):
+    waktu = WaktuPalsu()
+    monkeypatch.setattr(concurrency, 'time', waktu)
+    pengatur = PengaturKonkurensi(8, 8)
+    selesai(pengatur, STATUS_ERROR)
+    assert pengatur.batas == 4
+    selesai(pengatur, STATUS_THROTTLE)
+    assert pengatur.batas == 2
+    waktu.sekarang += 5  # lewati jeda throttling
+    selesai(pengatur, STATUS_ERROR, kali=3)
+    assert pengatur.batas == 1
+
+
+def test_latensi_melonjak_menurunkan_batas():
+    pengatur = PengaturKonkurensi(4, 8)
+    selesai(pengatur, latensi=1.0, kali=4)
+    batas = pengatur.batas
+    selesai(pengatur, latensi=20.0)
+    assert pengatur.batas == batas - 1
+
+
+def test_jeda_throttle_berlipat_dan_direset_setelah_sukses(monkeypatch):
+    waktu = WaktuPalsu()
+    monkeypatch.setattr(concurrency, 'time', waktu)
+    pengatur = PengaturKonkurensi(4, 8)
+
+    selesai(pengatur, STATUS_THROTTLE)
+    assert pengatur._jeda_sampai == waktu.sekarang + 5
+    assert not pengatur.masuk(iter([True, False]).__next__)  # masih dalam jeda
+
+    waktu.sekarang += 5
+    selesai(pengatur, STATUS_THROTTLE)
+    assert pengatur._jeda_sampai == waktu.sekarang + 10
+
+    waktu.sekarang += 10
+    selesai(pengatur, STATUS_OK)
+    selesai(pengatur, STATUS_THROTTLE)
+    assert pengatur._jeda_sampai == waktu.sekarang + 5
+
+
+def test_mode_non_adaptif_tetap_jeda_tetapi_batas_tetap(monkeypatch):
+    waktu = WaktuPalsu()
+    monkeypatch.setattr(concurrency, 'time', waktu)
+    pengatur = PengaturKonkurensi(4, 8, adaptif=False)
+
+    selesai(pengatur, kali=10)
+    selesai(pengatur, STATUS_THROTTLE)
+    assert pengatur.batas == 4
+    assert pengatur._jeda_sampai == waktu.sekarang + 5
@@ -0,0 +1,85 @@
+import json
+import os
+
+from core.journal import JurnalHasil, tulis_json_atomik
+
+
+def hasil(judul, **kolom):
+    item = {"judul_asli": judul, "judul_video": judul.title(), "link_youtube": "https://youtu.be/x",
+            "ukuran_file": "N/A", "download": False}
+    item.update(kolom)
+    return item
+
+
+def baca_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_tambah_ditulis_ke_jurnal_sebelum_dipadatkan(tmp_path):
+    output = str(tmp_path / 'hasil.json')
+    jurnal = JurnalHasil(output, interval_item=100, interval_detik=3600)
+    jurnal.tambah(hasil("a"))
+    jurnal.tambah(hasil("b"))
+
+    assert not os.path.exists(output)
+    with open(jurnal.path, 'r', encoding='utf-8') as f:
+        assert [json.loads(line)['judul_asli'] for line in f] == ["a", "b"]
+    jurnal.tutup()
+
+
+def test_pemadatan_setiap_interval_item(tmp_path):
+    output = str(tmp_path / 'hasil.json')
+    jurnal = JurnalHasil(output, interval_item=3, interval_detik=3600)
+    for judul in "abc":
+        jurnal.tambah(hasil(judul))
+
+    assert [item['judul_asli'] for item in baca_json(output)] == ["a", "b", "c"]
+    assert not os.path.exists(jurnal.path)
+
+    jurnal.tambah(hasil("d"))
+    assert os.path.exists(jurnal.path)
+    jurnal.tutup()
+    assert [item['judul_asli'] for item in baca_json(output)] == ["a", "b", "c", "d"]
+    assert not os.path.exists(jurnal.path)
+
+
+def test_muat_menggabungkan_file_akhir_dan_jurnal(tmp_path):
+    output = str(tmp_path / 'hasil.json')
+    tulis_json_atomik(output, [hasil("a"), hasil("b")])
+    jurnal_path = os.path.splitext(output)[0] + ".jurnal.jsonl"
+    with open(jurnal_path, 'w', encoding='utf-8') as f:
+        # Entri jurnal lebih baru dari file akhir, dan baris terakhir terpotong
+        f.write(json.dumps(hasil("b", ukuran_file="3.00 MB")) + "\n")
+        f.write(json.dumps(hasil("c")) + "\n")
+        f.write('{"judul_asli": "d", "judul_')
+
+    jurnal = JurnalHasil(output)
+    semua = {item['judul_asli']: item for item in jurnal.muat()}
+
+    assert sorted(semua) == ["a", "b", "c"]
+    assert semua["b"]["ukuran_file"] == "3.00 MB"
+
+
+def test_perbarui_hanya_kolom_yang_diberikan(tmp_path):
+    output = str(tmp_path / 'hasil.json')
+    jurnal = JurnalHasil(output, interval_item=100, interval_detik=3600)
+    jurnal.tambah(hasil("a"))
+    jurnal.perbarui("a", ukuran_file="4.20 MB")
+    jurnal.perbarui("tidak-ada", ukuran_file="1.00 MB")
+    jurnal.tutup()
+
+    assert baca_json(output) == [hasil("a", ukuran_file="4.20 MB")]
+
+
+def test_entri_ganda_setelah_mati_di_tengah_pemadatan(tmp_path):
+    # File akhir sudah ditulis tetapi jurnal belum sempat dihapus: muat() tidak menggandakan entri
+    output = str(tmp_path / 'hasil.json')
+    jurnal = JurnalHasil(output, interval_item=100, interval_detik=3600)
+    jurnal.tambah(hasil("a"))
+    jurnal.tambah(hasil("b"))
+    tulis_json_atomik(output, jurnal.semua())
+
+    semua = JurnalHasil(output).muat()
+    assert sorted(item['judul_asli'] for item in semua) == ["a", "b"]
+    jurnal.tutup()
@@ -0,0 +1,60 @@
+import pytest
+
+from core.pilih_ukuran import (
+    KolomUkuran, urai_ukuran, UKURAN_PASTI, UKURAN_PERKIRAAN, UKURAN_TIDAK_DIKETAHUI
+)
+
+
+@pytest.mark.parametrize("teks, harapan", [
+    ("3.42 MB", (3.42, UKURAN_PASTI)),
+    ("~5.10 MB", (5.10, UKURAN_PERKIRAAN)),
+    ("1 GB", (1024.0, UKURAN_PASTI)),
+    ("512 KB", (0.5, UKURAN_PASTI)),
+    ("N/A", (0.0, UKURAN_TIDAK_DIKETAHUI)),
+    ("Error", (0.0, UKURAN_TIDAK_DIKETAHUI)),
+    (None, (0.0, UKURAN_TIDAK_DIKETAHUI)),
+])
+def test_urai_ukuran(teks, harapan):
+    mb, jenis = urai_ukuran(teks)
+    assert mb == pytest.approx(harapan[0]) and jenis == harapan[1]
+
+
+@pytest.fixture
+def kolom():
+    # baris:        0          1          2       3          4
+    return KolomUkuran(["2.00 MB", "~6.00 MB", "N/A", "10.00 MB", "4.00 MB"])
+
+
+def test_paling_besar_dan_paling_kecil(kolom):
+    assert list(kolom.paling_besar(4)) == [1, 0, 0, 0, 1]
+    assert list(kolom.paling_kecil(6)) == [0, 1, 0, 1, 0]
+
+
+def test_perkiraan_bisa_dikecualikan(kolom):
+    assert list(kolom.paling_kecil(6, sertakan_perkiraan=False)) == [0, 0, 0, 1, 0]
+    assert list(kolom.rentang(3, 7, sertakan_perkiraan=False)) == [0, 0, 0, 0, 1]
+
+
+def test_baris_tanpa_ukuran_tidak_pernah_dipilih(kolom):
+    assert kolom.paling_besar(1000)[2] == 0
+    assert kolom.paling_kecil(0)[2] == 0
+    assert kolom.anggaran(1000)[2] == 0
+
+
+def test_terbesar(kolom):
+    assert list(kolom.terbesar(2)) == [0, 1, 0, 1, 0]
+    assert list(kolom.terbesar(10)) == [1, 1, 0, 1, 1]
+
+
+def test_anggaran_melewati_baris_yang_tidak_muat(kolom):
+    # 2 + 6 = 8; 10 tidak muat lalu dilewati; 4 masih tidak muat di sisa 3
+    assert list(kolom.anggaran(11)) == [1, 1, 0, 0, 0]
+    # 2 muat, 6 tidak muat di sisa 5, 10 tidak muat, 4 muat di sisa 5
+    assert list(kolom.anggaran(7)) == [1, 0, 0, 0, 1]
+
+
+def test_perbarui_dan_total(kolom):
+    kolom.perbarui(2, "1.50 MB")
+    centang = kolom.paling_besar(4)
+    assert list(centang) == [1, 0, 1, 0, 1]
+    assert kolom.total(centang) == pytest.approx(7.5)
@@ -0,0 +1,95 @@
+import pytest
+
+import core.search_cache as search_cache
+from core.search_cache import SearchCache, normalisasi_judul
+
+
+class WaktuPalsu:
+    def __init__(self):
+        self.sekarang = 1_000_000.0
+
+    def time(self):
+        return self.sekarang
+
+
+@pytest.fixture
+def waktu(monkeypatch):
+    palsu = WaktuPalsu()
+    monkeypatch.setattr(search_cache, 'time', palsu)
+    return palsu
+
+
+@pytest.fixture
+def buat_cache(tmp_path):
+    dibuka = []
+
+    def buat(ttl_hari=1, ttl_negatif_jam=1, maks_entri=1000):
+        cache = SearchCache(str(tmp_path / 'cache.sqlite3'), settings={
+            'ttl_hari': ttl_hari, 'ttl_negatif_jam': ttl_negatif_jam, 'maks_entri': maks_entri,
+        })
+        dibuka.append(cache)
+        return cache
+
+    yield buat
+    for cache in dibuka:
+        try:
+            cache.tutup()
+        except Exception:
+            pass
+
+
+def test_normalisasi_judul_menyatukan_variasi():
+    assert normalisasi_judul("  Bohemian   Rhapsody!! ") == normalisasi_judul("bohemian rhapsody")
+
+
+def test_hasil_ditemukan_berlaku_sampai_ttl(waktu, buat_cache):
+    cache = buat_cache(ttl_hari=1)
+    cache.simpan("Lagu A", "abcdefghijk", "Lagu A (Official)", "https://youtu.be/abcdefghijk", "3.42 MB")
+
+    waktu.sekarang += 86400 - 1
+    hasil = cache.ambil("lagu a")
+    assert hasil['ditemukan'] and hasil['ukuran_file'] == "3.42 MB"
+
+    waktu.sekarang += 86400 + 1
+    assert cache.ambil("Lagu A") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_hasil_negatif_memakai_ttl_negatif(waktu, buat_cache):
+    cache = buat_cache(ttl_hari=30, ttl_negatif_jam=2)
+    cache.simpan("Lagu Hilang", ditemukan=False)
+
+    waktu.sekarang += 3600
+    assert cache.ambil("Lagu Hilang")['ditemukan'] is False
+
+    waktu.sekarang += 2 * 3600
+    assert cache.ambil("Lagu Hilang") is None
+
+
+def test_perlu_ukuran_melewati_entri_tanpa_ukuran(waktu, buat_cache):
+    cache = buat_cache()
+    cache.simpan("Lagu B", "bbbbbbbbbbb", "Lagu B", "https://youtu.be/bbbbbbbbbbb")
+    assert cache.ambil("Lagu B") is not None
+    assert cache.ambil("Lagu B", perlu_ukuran=True) is None
+
+
+def test_na_tidak_menimpa_ukuran_yang_sudah_diketahui(waktu, buat_cache):
+    cache = buat_cache()
+    cache.simpan("Lagu C", "ccccccccccc", "Lagu C", "https://youtu.be/ccccccccccc", "5.00 MB")
+    cache.simpan("Lagu C", "ccccccccccc", "Lagu C", "https://youtu.be/ccccccccccc", "N/A")
+    assert cache.ambil("Lagu C")['ukuran_file'] == "5.00 MB"
+
+
+def test_pemangkasan_membuang_entri_paling_lama_tidak_diakses(waktu, buat_cache):
+    cache = buat_cache(maks_entri=3)
+    for i in range(5):
+        waktu.sekarang += 1
+        cache.simpan(f"Lagu {i}", f"id{i}", f"Lagu {i}", f"https://youtu.be/id{i}")
+    # Lagu 0 diakses paling akhir, jadi bertahan meski paling lama disimpan
+    waktu.sekarang += 1
+    assert cache.ambil("Lagu 0") is not None
+
+    cache.tutup()
+    cache = buat_cache(maks_entri=3)
+    tersisa = {i for i in range(5) if cache.ambil(f"Lagu {i}") is not None}
+    assert tersisa == {0, 3, 4}